@@ -10,14 +10,59 @@ class Settings(BaseSettings):
     # OpenAI 설정
     OPENAI_API_KEY: str
     OPENAI_MODEL: str = "gpt-4.1-nano"  # 기본 모델 (가장 빠르고 저렴)
+    OPENAI_STATUS_PROBE_INTERVAL: int = 60  # 상태 확인 주기 (초)
+    OPENAI_BASE_URL: str = ""  # 비어있으면 공식 API, 벤치마크 시 로컬 스텁 서버 URL (예: http://127.0.0.1:8100/v1)
     
     # Firebase 설정
     FIREBASE_PROJECT_ID: str = "ma-cardnews"
     FIREBASE_CREDENTIALS_PATH: str = "./serviceAccountKey.json"
     
+    # 저장소 백엔드: firestore | sqlite | auto (Firestore 초기화 실패 시 SQLite)
+    STORAGE_BACKEND: str = "auto"
+    SQLITE_PATH: str = "./data/cardnews.db"
+    
     # 크롤링 설정 (Phase 2)
     DEFAULT_CRAWL_INTERVAL: int = 30  # 분 단위
     MAX_CONCURRENT_CRAWLS: int = 3
+    CRAWL_LOG_RETENTION_DAYS: int = 30  # 크롤링 로그 보존 기간 (일)
+    CRAWL_LOG_FLUSH_INTERVAL: float = 2.0  # 크롤링 로그 버퍼 저장 주기 (초)
+    
+    # 여러 URL 프로젝트 생성 (URL별 동시 스크래핑, 출처별 동시 요약)
+    SCRAPE_MAX_CONCURRENT: int = 5  # 동시에 스크래핑하는 URL 수
+    SCRAPE_TIMEOUT: float = 20.0  # URL당 스크래핑 제한 시간 (초, 초과 시 해당 URL 건너뜀)
+    SUMMARIZE_MAX_CONCURRENT: int = 5  # 동시에 요약하는 출처 수
+    
+    # 워커 프로세스 (python -m app.worker: 스케줄러, 크롤링, 자동 생성 파이프라인 실행)
+    WORKER_POLL_INTERVAL: float = 2.0  # 작업 큐 / 워커 변경 알림 확인 주기 (초)
+    WORKER_HEARTBEAT_INTERVAL: int = 30  # 워커 상태 저장 주기 (초)
+    WORKER_TASK_TIMEOUT: int = 300  # API가 작업 결과를 기다리는 최대 시간 (초)
+    WORKER_EMBEDDED: bool = False  # API 프로세스 안에서 워커 실행 (로컬 개발용)
+    
+    # 백그라운드 작업 API (/api/jobs, API 프로세스 안에서 실행)
+    JOB_MAX_CONCURRENT: int = 4  # 동시에 실행하는 작업 수
+    JOB_RETENTION_SECONDS: int = 3600  # 완료된 작업 보관 시간 (초)
+    
+    # HTTP 응답 압축 (brotli/gzip)
+    HTTP_COMPRESSION_MIN_BYTES: int = 1024  # 이 크기 이상 응답만 압축 (0이면 압축 안 함)
+    RESPONSE_BODY_CACHE_SIZE: int = 64  # 미리 직렬화한 프로젝트 목록 응답 보관 수 (ETag별)
+    RESPONSE_BODY_CACHE_TTL: int = 300  # 미리 직렬화한 응답 보관 시간 (초, ETag가 내용을 대표하므로 메모리 회수용)
+    
+    # 라이브러리 피드 캐시 (쓰기 시 무효화, TTL은 다른 프로세스의 쓰기 대비)
+    LIBRARY_CACHE_TTL: int = 3600  # 초
+    LIBRARY_CACHE_SIZE: int = 256  # 최대 캐시 항목 수
+    
+    # 프로젝트/섹션 read-through 캐시 (쓰기 시 무효화, 리스너는 다른 워커의 쓰기 반영)
+    PROJECT_CACHE_TTL: int = 300  # 초
+    PROJECT_CACHE_SIZE: int = 512  # 최대 캐시 항목 수
+    PROJECT_CACHE_LISTEN: bool = False  # Firestore 스냅샷 리스너 사용 여부
+    
+    # 큰 텍스트 필드 압축 저장 (rss_posts.content, projects.source_content)
+    COMPRESSION_CODEC: str = "zstd"  # zstd | gzip (zstandard 미설치 시 gzip)
+    COMPRESSION_MIN_BYTES: int = 2048  # 이 크기 이상만 압축 (0이면 압축 안 함)
+    
+    # 라이브러리 검색 색인 (비우면 디스크 저장 안 함)
+    SEARCH_INDEX_PATH: str = "./data/search_index.json"
+    SEARCH_INDEX_SAVE_INTERVAL: int = 60  # 변경분 저장 주기 (초)
     
     # Backend 설정
     BACKEND_PORT: int = 8000
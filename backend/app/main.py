@@ -3,7 +3,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
-from app.routers import projects, chat, status
+from app.routers import projects, chat, status, jobs
+from app.utils.http_compression import CompressionMiddleware
 from app.utils import firebase
 import logging
 
@@ -35,62 +36,67 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Firebase & 스케줄러 초기화
+# 응답 압축 (brotli/gzip, HTTP_COMPRESSION_MIN_BYTES 이상만, 스트리밍 응답 제외)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.HTTP_COMPRESSION_MIN_BYTES)
+
+# Firebase & 백그라운드 작업 초기화
 @app.on_event("startup")
 async def startup_event():
-    """앱 시작 시 Firebase 및 스케줄러 초기화"""
-    # Firebase 초기화
-    firebase.initialize_firebase()
+    """앱 시작 시 Firebase 및 백그라운드 작업 초기화"""
+    # 저장소 초기화 (STORAGE_BACKEND에 따라 Firestore 또는 SQLite, sqlite면 Firebase 초기화 생략)
+    firebase.get_db()
+    
+    # OpenAI 상태 백그라운드 확인 시작
+    from app.services.openai_status import start_status_prober
+    start_status_prober()
+    
+    # 라이브러리 검색 색인 로드 (없으면 재구축)
+    from app.services.library_service import start_search_indexer
+    start_search_indexer()
     
-    # Phase 2: 스케줄러 초기화 및 활성 사이트 로드
-    # ⚠️ 임시 비활성화: 크롤러가 Library API를 블로킹하는 문제 수정 중
-    try:
-        logger = logging.getLogger(__name__)
-        logger.warning("⚠️ Scheduler temporarily disabled to fix Library API blocking issue")
-        
-        # from app.services.scheduler_service import init_scheduler
-        # from app.services.crawler import crawl_site_job
-        # from app.utils.firebase import get_all_sites
-        
-        # # 스케줄러 시작
-        # scheduler = init_scheduler()
-        
-        # # 활성 사이트 로드 및 작업 등록
-        # sites = get_all_sites()
-        # active_sites = [s for s in sites if s.get('status') == 'active']
-        
-        # for site in active_sites:
-        #     scheduler.add_site_job(
-        #         site_id=site['id'],
-        #         site_name=site['name'],
-        #         rss_url=site['rss_url'],
-        #         crawl_interval=site['crawl_interval'],
-        #         crawl_func=crawl_site_job
-        #     )
-        
-        # logger = logging.getLogger(__name__)
-        # logger.info(f"Scheduler loaded {len(active_sites)} active sites")
-        
-    except Exception as e:
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Scheduler initialization failed: {e}")
+    # 프로젝트/섹션 캐시 리스너 (PROJECT_CACHE_LISTEN=true일 때만)
+    firebase.start_project_watch()
+    
+    # 스케줄러/크롤링/자동 생성은 워커 프로세스(python -m app.worker)에서 실행
+    if settings.WORKER_EMBEDDED:
+        from app.worker import start_embedded_worker
+        start_embedded_worker()
+    else:
+        # 워커가 쓴 라이브러리 항목/프로젝트를 검색 색인과 캐시에 반영
+        from app.services.task_queue import start_worker_event_listener
+        start_worker_event_listener()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """앱 종료 시 스케줄러 종료"""
-    try:
-        from app.services.scheduler_service import shutdown_scheduler
-        shutdown_scheduler()
-        logger = logging.getLogger(__name__)
-        logger.info("Scheduler shutdown completed")
-    except:
-        pass
+    """앱 종료 시 백그라운드 작업 종료"""
+    from app.services.openai_status import stop_status_prober
+    await stop_status_prober()
+    
+    from app.services.library_service import stop_search_indexer
+    await stop_search_indexer()
+    
+    firebase.stop_project_watch()
+    
+    # 실행 중인 작업(/api/jobs) 취소 (대기 중인 워커 작업도 함께 취소)
+    from app.services.job_manager import get_job_manager
+    await get_job_manager().shutdown()
+    
+    from app.services.task_queue import stop_worker_event_listener
+    await stop_worker_event_listener()
+    
+    # 내장 워커 종료 (실행 중이던 크롤링이 끝난 뒤 크롤링 로그 버퍼 최종 저장)
+    from app.worker import stop_embedded_worker
+    stop_embedded_worker()
+    
+    from app.services.crawl_log_writer import get_crawl_log_writer
+    get_crawl_log_writer().close()
 
 # 라우터 등록
 app.include_router(projects.router, prefix="/api/projects", tags=["projects"])
 app.include_router(chat.router, prefix="/api/chat", tags=["chat"])
 app.include_router(status.router, prefix="/api/status", tags=["status"])
+app.include_router(jobs.router, tags=["jobs"])
 
 # Phase 2: Sites 라우터
 try:
@@ -38,6 +38,9 @@ class CrawlLog(BaseModel):
     # 발견된 게시물 목록 (제목 & URL)
     post_titles: List[str] = []
     
+    # 보존 기간 만료 시각 (Firestore TTL 정책 대상)
+    expires_at: Optional[datetime] = None
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -0,0 +1,53 @@
+"""백그라운드 작업(Job) 관련 Pydantic 모델"""
+
+from pydantic import BaseModel, Field
+from typing import Annotated, Any, Optional, Literal, Union
+from datetime import datetime
+
+from app.models.project import ProjectCreate
+from app.models.library import CreateCardnewsRequest
+
+
+class JobResponse(BaseModel):
+    """작업 상태"""
+    id: str
+    type: str
+    status: Literal['queued', 'running', 'completed', 'failed', 'cancelled']
+    step: Optional[str] = None  # 현재 진행 단계
+    message: Optional[str] = None
+    progress: float = 0.0  # 단계 기준 진행률 (0~1)
+    result: Optional[Any] = None  # 완료 시 결과 (작업 종류별)
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+
+class TriggerCrawlParams(BaseModel):
+    """수동 크롤링 작업 인자"""
+    site_id: str
+
+
+class CreateProjectJobRequest(BaseModel):
+    """프로젝트 생성 작업 (URL 스크래핑 포함) → result: ProjectResponse"""
+    type: Literal['create_project']
+    params: ProjectCreate
+
+
+class CreateCardnewsJobRequest(BaseModel):
+    """RSS 게시물 카드뉴스 생성 작업 → result: CreateCardnewsResponse"""
+    type: Literal['create_cardnews']
+    params: CreateCardnewsRequest
+
+
+class TriggerCrawlJobRequest(BaseModel):
+    """수동 크롤링 작업 → result: 크롤링 결과"""
+    type: Literal['trigger_crawl']
+    params: TriggerCrawlParams
+
+
+# 작업 제출 요청 (type으로 params 형식 결정)
+JobSubmitRequest = Annotated[
+    Union[CreateProjectJobRequest, CreateCardnewsJobRequest, TriggerCrawlJobRequest],
+    Field(discriminator='type')
+]
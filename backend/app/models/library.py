@@ -38,6 +38,23 @@ class LibraryFeedResponse(BaseModel):
     page: int
     page_size: int
     items: List[LibraryFeedItem]
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+
+
+class LibraryFacetCount(BaseModel):
+    """집계 항목 (사이트 ID 또는 YYYY-MM)"""
+    key: str
+    items: int
+    cardnews: int
+
+
+class LibraryFacetsResponse(BaseModel):
+    """RSS Library 집계 응답"""
+    total: int
+    cardnews: Optional[int] = None  # 카드뉴스가 있는 항목 수 (카운터가 없으면 None)
+    sites: List[LibraryFacetCount] = []
+    months: List[LibraryFacetCount] = []
+    precomputed: bool  # 사전 집계 카운터 사용 여부 (False면 count 집계 fallback)
 
 
 class CreateCardnewsRequest(BaseModel):
@@ -1,6 +1,6 @@
 """프로젝트 관련 Pydantic 모델"""
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Literal
 from datetime import datetime
 
@@ -49,6 +49,27 @@ class ProjectResponse(BaseModel):
         from_attributes = True
 
 
+class ProjectListItem(BaseModel):
+    """프로젝트 목록 항목 (source_content 등 큰 필드 제외, 상세는 GET /api/projects/{id})"""
+    id: str
+    title: Optional[str] = None
+    source_type: str
+    summary: Optional[str] = None
+    keywords: Optional[List[str]] = None
+    recommended_card_count: Optional[int] = None
+    status: Literal['draft', 'summarized', 'completed']
+    model: Optional[str] = 'gpt-4.1-nano'
+    card_start_type: Optional[str] = 'title'
+    source_url: Optional[str] = None
+    source_site_id: Optional[str] = None
+    source_site_name: Optional[str] = None
+    is_auto_generated: bool = False
+    version: int = 1
+    last_error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+
 class SummarizeRequest(BaseModel):
     """요약 요청"""
     max_length: int = 200
@@ -60,3 +81,19 @@ class SummarizeResponse(BaseModel):
     keywords: List[str]
     recommended_card_count: int
 
+
+
+class ProjectBulkDeleteRequest(BaseModel):
+    """프로젝트 일괄 삭제 요청 (ID 목록 또는 조건 중 하나)"""
+    project_ids: Optional[List[str]] = Field(None, max_length=5000)
+    status: Optional[Literal['draft', 'summarized', 'completed']] = None
+    auto_generated: Optional[bool] = None  # True: 자동 생성 프로젝트만
+    limit: int = Field(1000, ge=1, le=5000)  # 조건 삭제 시 최대 개수
+
+
+class ProjectBulkDeleteResponse(BaseModel):
+    """프로젝트 일괄 삭제 결과"""
+    projects: int  # 삭제된 프로젝트 수
+    sections: int  # 삭제된 섹션 수
+    conversations: int  # 삭제된 대화 수
+    posts_unlinked: int  # 연결 해제된 RSS 게시물 수
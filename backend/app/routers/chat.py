@@ -3,7 +3,7 @@
 from fastapi import APIRouter, HTTPException, status
 from app.models.chat import ChatRequest, ChatResponse
 from app.services.chat_service import ChatService
-from app.utils import firebase
+from app.utils import firebase_async as firebase
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,9 +13,6 @@ router = APIRouter()
 # 서비스 인스턴스 (기본 모델 사용, 실제 사용 시 프로젝트 모델로 재생성)
 # chat_service = ChatService()
 
-# 인메모리 저장소
-from app.utils.memory_store import get_projects_store, get_sections_store
-
 
 @router.post("", response_model=ChatResponse)
 async def process_chat(request: ChatRequest):
@@ -27,12 +24,8 @@ async def process_chat(request: ChatRequest):
     - 대화 이력 저장
     """
     try:
-        # 프로젝트 존재 확인 (Firebase 또는 인메모리)
-        try:
-            project = firebase.get_project(request.project_id)
-        except:
-            memory_projects = get_projects_store()
-            project = memory_projects.get(request.project_id)
+        # 프로젝트 존재 확인
+        project = await firebase.get_project(request.project_id)
         
         if not project:
             raise HTTPException(
@@ -53,26 +46,21 @@ async def process_chat(request: ChatRequest):
         # 섹션이 수정되었으면 저장
         if result['updated_sections']:
             logger.info("Updating sections")
-            try:
-                # Firebase 시도
-                existing_sections = firebase.get_sections(request.project_id)
-                for section in existing_sections:
-                    firebase.delete_section(request.project_id, section['id'])
-                firebase.create_sections(request.project_id, result['updated_sections'])
-            except:
-                # 인메모리 업데이트
-                memory_sections = get_sections_store()
-                memory_sections[request.project_id] = result['updated_sections']
+            # 저장된 섹션 기준 diff, 단일 배치 커밋
+            result['updated_sections'] = await firebase.replace_sections(
+                request.project_id,
+                result['updated_sections']
+            )
         
-        # 대화 이력 저장 (Firebase만, 실패해도 무시)
+        # 대화 이력 저장 (실패해도 응답은 반환)
         try:
-            firebase.save_conversation(
+            await firebase.save_conversation(
                 project_id=request.project_id,
                 user_message=request.user_message,
                 ai_response=result['ai_response']
             )
-        except:
-            pass  # 인메모리는 대화 이력 저장 안함
+        except Exception as e:
+            logger.warning(f"Failed to save conversation: {str(e)}")
         
         return ChatResponse(
             ai_response=result['ai_response'],
@@ -96,11 +84,7 @@ async def get_chat_history(project_id: str, limit: int = 10):
     대화 이력 조회
     """
     try:
-        # Firebase에서만 조회 (인메모리는 대화 이력 저장 안함)
-        try:
-            conversations = firebase.get_conversations(project_id, limit)
-        except:
-            conversations = []  # 인메모리는 빈 배열 반환
+        conversations = await firebase.get_conversations(project_id, limit)
         
         return {
             "conversations": conversations
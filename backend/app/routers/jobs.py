@@ -0,0 +1,147 @@
+"""백그라운드 작업(Job) API 라우터"""
+
+from fastapi import APIRouter, Body, Header, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+import json
+import logging
+
+from app.models.job import JobResponse, JobSubmitRequest
+from app.services.job_manager import get_job_manager
+from app.services.job_runners import submit_job
+from app.services.task_queue import worker_available
+from app.utils.firebase_async import get_site
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+logger = logging.getLogger(__name__)
+
+# SSE 유휴 연결 유지 주기 (초)
+SSE_KEEPALIVE_SECONDS = 15
+
+
+@router.post("", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_job(request: JobSubmitRequest = Body(...)):
+    """
+    작업 제출 (바로 작업 ID 반환)
+    
+    - **create_project**: params = ProjectCreate (여러 URL 스크래핑 진행 이벤트)
+    - **create_cardnews**: params = CreateCardnewsRequest (파이프라인 단계 이벤트)
+    - **trigger_crawl**: params = {site_id}
+    
+    진행 상황은 GET /api/jobs/{id} 또는 GET /api/jobs/{id}/events (SSE)로 확인
+    """
+    try:
+        logger.info(f"POST /api/jobs - type={request.type}")
+        
+        site = None
+        if request.type in ('create_cardnews', 'trigger_crawl'):
+            site = await get_site(request.params.site_id)
+            if not site:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Site not found: {request.params.site_id}"
+                )
+            
+            # 워커 작업은 실행 중인 워커가 없으면 대기만 하다 실패하므로 바로 거절
+            if not await worker_available():
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="No running worker (start python -m app.worker or set WORKER_EMBEDDED=true)"
+                )
+        
+        job = submit_job(request, site)
+        return JobResponse(**job.to_dict())
+    
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Failed to submit job: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to submit job: {str(e)}"
+        )
+
+
+@router.get("", response_model=List[JobResponse])
+async def list_jobs(limit: int = Query(50, ge=1, le=200, description="조회할 작업 수")):
+    """최근 작업 목록 (최신순, 이 API 프로세스에서 제출된 작업)"""
+    return [JobResponse(**job.to_dict()) for job in get_job_manager().recent(limit)]
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """작업 상태 조회"""
+    job = get_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {job_id}"
+        )
+    
+    return JobResponse(**job.to_dict())
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: str, last_event_id: Optional[str] = Header(None)):
+    """
+    작업 진행 이벤트 스트림 (Server-Sent Events)
+    
+    - **progress**: {step, message, progress, ...}
+    - **status**: {status, result, error} (completed/failed/cancelled 후 스트림 종료)
+    
+    재연결 시 Last-Event-ID 이후 이벤트부터 전송
+    """
+    manager = get_job_manager()
+    if manager.get(job_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {job_id}"
+        )
+    
+    try:
+        after = int(last_event_id or 0)
+    except ValueError:
+        after = 0
+    
+    async def event_stream():
+        async for event in manager.events(job_id, after=after, keepalive=SSE_KEEPALIVE_SECONDS):
+            if event['event'] == 'ping':
+                yield ": ping\n\n"
+                continue
+            
+            data = json.dumps(jsonable_encoder(event['data']), ensure_ascii=False)
+            yield f"id: {event['id']}\nevent: {event['event']}\ndata: {data}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # nginx 버퍼링 비활성화
+        }
+    )
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+async def cancel_job(job_id: str):
+    """
+    작업 취소
+    
+    워커 작업은 워커가 아직 시작하지 않았을 때만 실행이 취소됩니다.
+    (이미 실행 중이면 워커에서는 끝까지 실행되고 작업은 cancelled로 표시)
+    """
+    job = await get_job_manager().cancel(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {job_id}"
+        )
+    
+    logger.info(f"POST /api/jobs/{job_id}/cancel - {job.status}")
+    return JobResponse(**job.to_dict())
@@ -1,24 +1,30 @@
 """RSS Library API 라우터"""
 
-from fastapi import APIRouter, Query, HTTPException, status
+from fastapi import APIRouter, Header, Query, HTTPException, status
+from pydantic import TypeAdapter
 from datetime import datetime
 from typing import Optional
 import logging
 
 from app.models.library import (
     LibraryFeedResponse,
-    LibraryFeedItem,
-    FeedSource,
+    LibraryFacetsResponse,
     CreateCardnewsRequest,
     CreateCardnewsResponse
 )
 from app.services.library_service import get_library_service
-from app.services.pipeline_service import AutoGenerationPipeline
-from app.utils.firebase import get_site
+from app.services.job_runners import enqueue_cardnews_task
+from app.services.task_queue import wait_for_task, WorkerUnavailableError
+from app.utils.firebase_async import get_site, get_project
+from app.utils.http_cache import make_etag, etag_matches, not_modified, etag_headers
+from app.utils.json_response import serialize, json_response
 
 router = APIRouter(prefix="/api/library", tags=["library"])
 logger = logging.getLogger(__name__)
 
+# 피드 응답 스키마 (직렬화 전 검증용)
+_feed_response_adapter = TypeAdapter(LibraryFeedResponse)
+
 
 @router.get("/feed", response_model=LibraryFeedResponse)
 async def get_library_feed(
@@ -28,7 +34,9 @@ async def get_library_feed(
     keyword: Optional[str] = Query(None, description="키워드 검색"),
     year_month: Optional[str] = Query(None, description="연월 필터 (YYYY-MM 형식)"),
     page: int = Query(1, ge=1, description="페이지 번호"),
-    page_size: int = Query(20, ge=1, le=100, description="페이지 크기")
+    page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     RSS Library 통합 피드 조회
@@ -36,6 +44,9 @@ async def get_library_feed(
     - 등록된 모든 RSS 사이트의 게시물을 시간순으로 조회
     - 카드뉴스가 생성된 게시물과 미생성 게시물 모두 포함
     - 필터링: 사이트별, 날짜별, 키워드별
+    - 페이지네이션: cursor(권장) 또는 page 번호
+    - ETag 응답: If-None-Match가 같으면 304 (본문 없음)
+    - 캐시된 페이지는 미리 직렬화한 JSON을 그대로 응답
     """
     try:
         logger.info(f"GET /api/library/feed - site_id={site_id}, keyword={keyword}, page={page}")
@@ -49,35 +60,37 @@ async def get_library_feed(
             keyword=keyword,
             year_month=year_month,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor
         )
         
-        # Pydantic 모델로 변환
-        items = []
-        for item in result['items']:
-            items.append(LibraryFeedItem(
-                id=item['id'],
-                type=item['type'],
-                title=item['title'],
-                title_original=item.get('title_original'),  # Optional field
-                source=FeedSource(**item['source']),
-                keywords=item.get('keywords', []),  # Default to empty list
-                summary=item['summary'],
-                published_at=item['published_at'],
-                url=item['url'],
-                has_cardnews=item['has_cardnews'],
-                project_id=item['project_id'],
-                status=item['status'],
-                is_new=item['is_new']
-            ))
-        
-        return LibraryFeedResponse(
-            total=result['total'],
-            page=result['page'],
-            page_size=result['page_size'],
-            items=items
-        )
+        # 결과 버전이 같으면 본문 없이 304 (조회 실패 결과는 버전 없음)
+        headers = None
+        if result.get('version'):
+            etag = make_etag('library_feed', result['version'])
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+            headers = etag_headers(etag)
+        
+        # 스키마 검증 + 직렬화는 페이지를 처음 보낼 때 한 번만 (캐시된 결과에 bytes 보관, 이후 요청은 재사용)
+        body = result.get('body')
+        if body is None:
+            body = serialize(_feed_response_adapter, {
+                'total': result['total'],
+                'page': result['page'],
+                'page_size': result['page_size'],
+                'items': result['items'],
+                'next_cursor': result['next_cursor']
+            })
+            result['body'] = body
+        
+        return json_response(body, headers)
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Failed to get library feed: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -86,62 +99,77 @@ async def get_library_feed(
         )
 
 
+@router.get("/facets", response_model=LibraryFacetsResponse)
+async def get_library_facets(
+    site_id: Optional[str] = Query(None, description="특정 사이트만 집계")
+):
+    """
+    RSS Library 집계 조회
+    
+    - 전체 / 카드뉴스 생성 항목 수
+    - 사이트별, 월별 항목 수 (사전 집계 카운터, 스캔 없음)
+    """
+    try:
+        library_service = get_library_service()
+        return LibraryFacetsResponse(**await library_service.get_facets(site_id=site_id))
+        
+    except Exception as e:
+        logger.error(f"Failed to get library facets: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get library facets: {str(e)}"
+        )
+
+
 @router.post("/create-cardnews", response_model=CreateCardnewsResponse)
 async def create_cardnews_from_feed(request: CreateCardnewsRequest):
     """
     RSS Library에서 카드뉴스 생성
     
     - RSS 게시물을 카드뉴스 프로젝트로 변환
-    - 자동 생성 파이프라인 실행 (스크래핑 → 요약 → 카드뉴스 생성)
+    - 워커 프로세스가 자동 생성 파이프라인 실행 (스크래핑 → 요약 → 카드뉴스 생성), API는 결과만 대기
+    - 진행 단계를 받으려면 작업 API 사용 (POST /api/jobs, type=create_cardnews)
     """
     try:
         logger.info(f"POST /api/library/create-cardnews - url={request.url}")
         
         # 사이트 정보 조회
-        site = get_site(request.site_id)
+        site = await get_site(request.site_id)
         if not site:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Site not found: {request.site_id}"
             )
         
-        # 자동 생성 파이프라인 실행
-        pipeline = AutoGenerationPipeline(model='gpt-4.1-nano')
-        
-        # RSS 게시물 형식으로 변환
-        post = {
-            'id': request.rss_post_id,
-            'title': request.title,
-            'link': request.url,
-            'content': request.content,
-            'summary': '',
-            'published': datetime.now(),
-            'author': 'Unknown'
-        }
-        
-        # 카드뉴스 생성
-        project_id = pipeline.generate_cardnews_from_post(
-            post=post,
-            site_id=request.site_id,
-            site_name=site['name']
-        )
+        # 카드뉴스 생성 (워커 프로세스에서 실행, 완료까지 대기)
+        try:
+            task = await enqueue_cardnews_task(request, site)
+        except WorkerUnavailableError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e)
+            )
+        
+        try:
+            task = await wait_for_task(task['id'])
+        except TimeoutError as e:
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=f"Cardnews generation is still pending (is the worker running?): {str(e)}"
+            )
         
-        if not project_id:
+        if task['status'] != 'completed':
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to generate cardnews"
+                detail=f"Failed to generate cardnews: {task.get('error') or 'Unknown error'}"
             )
         
-        # RSS 게시물 업데이트 (has_cardnews, project_id)
-        from app.utils.firebase import update_rss_post, get_project
-        update_rss_post(request.rss_post_id, {
-            'has_cardnews': True,
-            'project_id': project_id
-        })
-        logger.info(f"RSS post updated: {request.rss_post_id} -> project {project_id}")
+        project_id = task['result']['project_id']
+        
+        # RSS 게시물 연결(has_cardnews, project_id)과 라이브러리 항목은 파이프라인에서 갱신됨
         
         # 프로젝트 상태 조회
-        project = get_project(project_id)
+        project = await get_project(project_id)
         
         return CreateCardnewsResponse(
             project_id=project_id,
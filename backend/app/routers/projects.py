@@ -1,17 +1,28 @@
 """프로젝트 관련 API 라우터"""
 
-from fastapi import APIRouter, HTTPException, status, Query
-from pydantic import BaseModel
-from app.models.project import ProjectCreate, ProjectResponse, SummarizeRequest, SummarizeResponse
+from fastapi import APIRouter, HTTPException, status, Query, Header
+from pydantic import BaseModel, TypeAdapter
+from app.models.project import (
+    ProjectCreate,
+    ProjectResponse,
+    ProjectListItem,
+    SummarizeRequest,
+    SummarizeResponse,
+    ProjectBulkDeleteRequest,
+    ProjectBulkDeleteResponse
+)
 from app.services.scraper import WebScraper
 from app.services.summarizer import AISummarizer
 from app.services.card_generator import CardNewsGenerator
-from app.utils import firebase
-from app.utils.memory_store import get_projects_store, get_sections_store
+from app.services.project_service import create_project_from_request, split_sources, source_excerpt
+from app.utils import firebase_async as firebase
+from app.utils.cache import get_response_body_cache
+from app.utils.http_cache import make_etag, etag_matches, not_modified, etag_headers
+from app.utils.json_response import serialize, json_response
 from typing import List, Dict, Optional
 from datetime import datetime
+import asyncio
 import logging
-import uuid
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +33,9 @@ scraper = WebScraper()
 # summarizer = AISummarizer()  # 프로젝트별로 모델이 다를 수 있으므로 필요시 생성
 # card_generator = CardNewsGenerator()  # 프로젝트별로 모델이 다를 수 있으므로 필요시 생성
 
+# 프로젝트 목록 응답 스키마 (직렬화 전 검증용)
+_project_list_adapter = TypeAdapter(List[ProjectListItem])
+
 
 class SummarizeContentRequest(BaseModel):
     """요약 요청 모델"""
@@ -84,74 +98,11 @@ async def create_project(project: ProjectCreate):
     새 프로젝트 생성
     
     - URL 또는 텍스트 소스 입력
-    - 인메모리 저장소 또는 Firestore에 저장
+    - 저장소(Firestore 또는 SQLite)에 저장
+    - 여러 URL은 진행 상황을 받을 수 있는 작업 API 사용 권장 (POST /api/jobs, type=create_project)
     """
     try:
-        # URL인 경우 스크래핑
-        if project.source_type == 'url':
-            # 여러 URL을 줄바꿈으로 구분하여 처리
-            urls = [url.strip() for url in project.source_content.split('\n') if url.strip()]
-            logger.info(f"Scraping {len(urls)} URL(s)")
-            
-            all_content = []
-            for idx, url in enumerate(urls, 1):
-                try:
-                    logger.info(f"Scraping [{idx}/{len(urls)}]: {url}")
-                    scraped_data = scraper.scrape_url(url)
-                    
-                    # 출처와 내용을 명확히 구분
-                    source_info = f"━━━ 출처 {idx}: {scraped_data['title']} ━━━\n"
-                    source_info += f"URL: {url}\n"
-                    source_info += f"━━━━━━━━━━━━━━━━━━━━\n\n"
-                    source_info += scraped_data['content']
-                    
-                    all_content.append(source_info)
-                    logger.info(f"Successfully scraped [{idx}/{len(urls)}]: {scraped_data['title']}")
-                except Exception as e:
-                    logger.warning(f"Failed to scrape [{idx}/{len(urls)}] {url}: {str(e)}")
-                    # 실패한 URL은 건너뛰고 계속 진행
-                    continue
-            
-            if not all_content:
-                raise ValueError("모든 URL 스크래핑에 실패했습니다")
-            
-            # 모든 내용을 합침 (명확한 구분선 사용)
-            separator = "\n\n" + "=" * 60 + "\n\n"
-            content = separator.join(all_content)
-            
-            # 최종 정보 추가
-            header = f"📚 총 {len(all_content)}개의 소스에서 수집된 내용\n"
-            header += "=" * 60 + "\n\n"
-            content = header + content
-        else:
-            content = project.source_content
-        
-        # Firebase가 초기화되어 있으면 Firestore 사용, 아니면 인메모리 사용
-        try:
-            project_data = firebase.create_project({
-                'source_type': project.source_type,
-                'source_content': content,
-                'model': project.model,
-                'card_start_type': project.card_start_type
-            })
-            logger.info("Project saved to Firestore")
-        except ValueError:
-            # Firebase가 없으면 인메모리 저장소 사용
-            project_id = str(uuid.uuid4())
-            now = datetime.utcnow().isoformat()
-            project_data = {
-                'id': project_id,
-                'source_type': project.source_type,
-                'source_content': content,
-                'model': project.model,
-                'card_start_type': project.card_start_type,
-                'created_at': now,
-                'updated_at': now,
-                'status': 'draft'
-            }
-            memory_projects = get_projects_store()
-            memory_projects[project_id] = project_data
-            logger.info(f"Project saved to memory: {project_id} (model: {project.model})")
+        project_data = await create_project_from_request(project)
         
         return ProjectResponse(**project_data)
         
@@ -174,19 +125,7 @@ async def get_project(project_id: str):
     """
     프로젝트 조회
     """
-    # Firebase 먼저 시도, 실패하면 인메모리에서 찾기
-    try:
-        project = firebase.get_project(project_id)
-        logger.info(f"Project loaded from Firebase: {project_id}")
-    except Exception as e:
-        logger.info(f"Firebase failed ({str(e)}), trying memory...")
-        memory_projects = get_projects_store()
-        logger.info(f"Memory store size: {len(memory_projects)}, keys: {list(memory_projects.keys())}")
-        project = memory_projects.get(project_id)
-        if project:
-            logger.info(f"Project loaded from memory: {project_id}")
-        else:
-            logger.warning(f"Project not found in memory: {project_id}")
+    project = await firebase.get_project(project_id)
     
     if not project:
         raise HTTPException(
@@ -207,12 +146,7 @@ async def summarize_project(project_id: str, request: SummarizeRequest = Summari
     - 추천 카드 수 계산
     """
     try:
-        # 프로젝트 조회 (Firebase 또는 인메모리)
-        try:
-            project = firebase.get_project(project_id)
-        except:
-            memory_projects = get_projects_store()
-            project = memory_projects.get(project_id)
+        project = await firebase.get_project(project_id)
         
         if not project:
             raise HTTPException(
@@ -224,10 +158,20 @@ async def summarize_project(project_id: str, request: SummarizeRequest = Summari
         logger.info(f"Summarizing project: {project_id}")
         project_model = project.get('model', 'gpt-4o-mini')
         project_summarizer = AISummarizer(model=project_model)
-        summary_result = project_summarizer.summarize(
-            project['source_content'],
-            max_length=request.max_length
-        )
+        
+        # 여러 URL로 만든 프로젝트는 출처별로 동시에 요약 후 병합 (모든 출처 반영)
+        sources = split_sources(project['source_content'])
+        if len(sources) > 1:
+            summary_result = await asyncio.to_thread(
+                project_summarizer.summarize_sources,
+                [source['content'] for source in sources],
+                max_length=request.max_length
+            )
+        else:
+            summary_result = project_summarizer.summarize(
+                project['source_content'],
+                max_length=request.max_length
+            )
         
         # 프로젝트 업데이트
         update_data = {
@@ -238,13 +182,7 @@ async def summarize_project(project_id: str, request: SummarizeRequest = Summari
             'updated_at': datetime.utcnow().isoformat()
         }
         
-        try:
-            firebase.update_project(project_id, update_data)
-        except:
-            # 인메모리 업데이트
-            memory_projects = get_projects_store()
-            if project_id in memory_projects:
-                memory_projects[project_id].update(update_data)
+        await firebase.update_project(project_id, update_data)
         
         return SummarizeResponse(
             summary=summary_result['summary'],
@@ -272,15 +210,10 @@ async def generate_sections(project_id: str):
     카드뉴스 섹션 자동 생성
     
     - 요약본을 바탕으로 카드뉴스 구조 생성
-    - 인메모리 또는 Firestore에 저장
+    - 저장소(Firestore 또는 SQLite)에 저장
     """
     try:
-        # 프로젝트 조회 (Firebase 또는 인메모리)
-        try:
-            project = firebase.get_project(project_id)
-        except:
-            memory_projects = get_projects_store()
-            project = memory_projects.get(project_id)
+        project = await firebase.get_project(project_id)
         
         if not project:
             raise HTTPException(
@@ -311,33 +244,12 @@ async def generate_sections(project_id: str):
         
         sections = project_generator.generate_sections(
             summary=project['summary'],
-            original_text=project['source_content'],
+            original_text=source_excerpt(project['source_content']),  # 여러 출처면 출처별로 고르게 발췌
             card_count=card_count
         )
         
-        # 저장 (Firebase 또는 인메모리)
-        try:
-            created_sections = firebase.create_sections(project_id, sections)
-            firebase.update_project(project_id, {'status': 'completed'})
-        except:
-            # 인메모리 저장
-            created_sections = []
-            for i, section in enumerate(sections):
-                section_data = {
-                    'id': str(uuid.uuid4()),
-                    'project_id': project_id,
-                    'order': i,
-                    **section
-                }
-                created_sections.append(section_data)
-            memory_sections = get_sections_store()
-            memory_sections[project_id] = created_sections
-            
-            # 프로젝트 상태 업데이트
-            memory_projects = get_projects_store()
-            if project_id in memory_projects:
-                memory_projects[project_id]['status'] = 'completed'
-                memory_projects[project_id]['updated_at'] = datetime.utcnow().isoformat()
+        created_sections = await firebase.create_sections(project_id, sections)
+        await firebase.update_project(project_id, {'status': 'completed'})
         
         return {
             "message": "섹션 생성 완료",
@@ -364,12 +276,7 @@ async def get_sections(project_id: str):
     프로젝트의 섹션 목록 조회
     """
     try:
-        # Firebase 먼저 시도, 실패하면 인메모리
-        try:
-            sections = firebase.get_sections(project_id)
-        except:
-            memory_sections = get_sections_store()
-            sections = memory_sections.get(project_id, [])
+        sections = await firebase.get_sections(project_id)
         
         return {
             "sections": sections
@@ -384,11 +291,12 @@ async def get_sections(project_id: str):
 
 # Phase 2: 추가 엔드포인트
 
-@router.get("", response_model=List[ProjectResponse])
+@router.get("", response_model=List[ProjectListItem])
 async def list_all_projects(
     status_filter: Optional[str] = Query(None, description="상태 필터: draft, summarized, completed"),
     limit: int = Query(100, ge=1, le=500, description="최대 조회 개수"),
-    source_type: Optional[str] = Query(None, description="소스 타입 필터: url, text, rss")
+    source_type: Optional[str] = Query(None, description="소스 타입 필터: url, text, rss"),
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     모든 프로젝트 목록 조회 (Phase 2)
@@ -397,36 +305,37 @@ async def list_all_projects(
     - **limit**: 최대 조회 개수 (기본 100, 최대 500)
     - **source_type**: 소스 타입 필터 (옵션)
     
-    최근 생성순으로 정렬됨
+    최근 생성순으로 정렬됨. 목록 필드만 조회하므로 source_content는 상세 조회에서 가져옵니다.
+    ETag 응답: 목록의 (ID, updated_at)이 그대로면 If-None-Match에 304 (본문 없음)
+    같은 ETag의 목록은 미리 직렬화한 JSON을 재사용합니다.
     """
     try:
         logger.info(f"Fetching all projects (status={status_filter}, limit={limit}, source_type={source_type})")
         
-        # Firestore에서 프로젝트 목록 조회
-        try:
-            projects = firebase.get_all_projects(limit=limit, status=status_filter)
-        except:
-            # Firebase 실패 시 인메모리 사용
-            logger.info("Firebase failed, using memory store")
-            memory_projects = get_projects_store()
-            projects = list(memory_projects.values())
-            
-            # 상태 필터링
-            if status_filter:
-                projects = [p for p in projects if p.get('status') == status_filter]
-            
-            # 정렬 (최근 생성 순)
-            projects.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-            
-            # 제한
-            projects = projects[:limit]
+        projects = await firebase.get_all_projects(limit=limit, status=status_filter)
         
         # source_type 필터링 (클라이언트 측)
         if source_type:
             projects = [p for p in projects if p.get('source_type') == source_type]
         
         logger.info(f"Found {len(projects)} projects")
-        return [ProjectResponse(**project) for project in projects]
+        
+        # 버전 스탬프: 필터 + 프로젝트별 (ID, updated_at) - 모든 프로젝트 쓰기가 updated_at을 갱신
+        etag = make_etag(
+            'projects', status_filter, limit, source_type,
+            [(project.get('id'), str(project.get('updated_at'))) for project in projects]
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        
+        # 스키마 검증 + 직렬화는 목록 버전마다 한 번만 (이후 같은 버전 요청은 bytes 재사용)
+        body_cache = get_response_body_cache()
+        body = body_cache.get(etag)
+        if body is None:
+            body = serialize(_project_list_adapter, projects)
+            body_cache.set(etag, body)
+        
+        return json_response(body, etag_headers(etag))
         
     except Exception as e:
         logger.error(f"Failed to fetch projects: {str(e)}")
@@ -448,11 +357,7 @@ async def update_project_status(project_id: str, new_status: str):
         logger.info(f"Updating project status: {project_id} -> {new_status}")
         
         # 프로젝트 존재 확인
-        try:
-            existing_project = firebase.get_project(project_id)
-        except:
-            memory_projects = get_projects_store()
-            existing_project = memory_projects.get(project_id)
+        existing_project = await firebase.get_project(project_id)
         
         if not existing_project:
             raise HTTPException(
@@ -469,13 +374,7 @@ async def update_project_status(project_id: str, new_status: str):
             )
         
         # 상태 업데이트
-        try:
-            updated_project = firebase.update_project(project_id, {'status': new_status})
-        except:
-            memory_projects = get_projects_store()
-            memory_projects[project_id]['status'] = new_status
-            memory_projects[project_id]['updated_at'] = datetime.utcnow().isoformat()
-            updated_project = memory_projects[project_id]
+        updated_project = await firebase.update_project(project_id, {'status': new_status}, current=existing_project)
         
         logger.info(f"Project status updated: {project_id}")
         return ProjectResponse(**updated_project)
@@ -503,11 +402,7 @@ async def delete_project_by_id(project_id: str):
         logger.info(f"Deleting project: {project_id}")
         
         # 프로젝트 존재 확인
-        try:
-            existing_project = firebase.get_project(project_id)
-        except:
-            memory_projects = get_projects_store()
-            existing_project = memory_projects.get(project_id)
+        existing_project = await firebase.get_project(project_id)
         
         if not existing_project:
             raise HTTPException(
@@ -515,18 +410,10 @@ async def delete_project_by_id(project_id: str):
                 detail=f"Project not found: {project_id}"
             )
         
-        # 프로젝트 삭제
-        try:
-            firebase.delete_project(project_id)
-        except:
-            memory_projects = get_projects_store()
-            memory_sections = get_sections_store()
-            if project_id in memory_projects:
-                del memory_projects[project_id]
-            if project_id in memory_sections:
-                del memory_sections[project_id]
-        
-        logger.info(f"Project deleted successfully: {project_id}")
+        # 프로젝트 삭제 (섹션/대화 서브컬렉션, RSS 게시물 연결 포함)
+        result = await firebase.delete_project(project_id)
+        
+        logger.info(f"Project deleted successfully: {project_id} ({result})")
         return None
         
     except HTTPException:
@@ -538,3 +425,44 @@ async def delete_project_by_id(project_id: str):
             detail=f"Failed to delete project: {str(e)}"
         )
 
+
+@router.post("/bulk-delete", response_model=ProjectBulkDeleteResponse)
+async def bulk_delete_projects(request: ProjectBulkDeleteRequest):
+    """
+    프로젝트 일괄 삭제
+    
+    - **project_ids**: 삭제할 프로젝트 ID 목록
+    - **status** / **auto_generated**: ID 목록 대신 조건으로 선택 (예: 자동 생성된 draft 정리)
+    - **limit**: 조건 삭제 시 최대 개수 (기본 1000)
+    
+    ⚠️ 주의: 각 프로젝트의 섹션과 대화도 함께 삭제됩니다.
+    """
+    try:
+        if request.project_ids is not None:
+            project_ids = request.project_ids
+        elif request.status is not None or request.auto_generated is not None:
+            project_ids = await firebase.get_project_ids(
+                status=request.status,
+                auto_generated=request.auto_generated,
+                limit=request.limit
+            )
+        else:
+            raise ValueError("project_ids 또는 삭제 조건(status, auto_generated)을 지정해야 합니다")
+        
+        logger.info(f"Bulk deleting {len(project_ids)} projects")
+        result = await firebase.delete_projects(project_ids)
+        
+        logger.info(f"Bulk delete finished: {result}")
+        return ProjectBulkDeleteResponse(**result)
+        
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Failed to bulk delete projects: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to bulk delete projects: {str(e)}"
+        )
@@ -6,17 +6,17 @@ from datetime import datetime
 import logging
 
 from app.models.site import Site, SiteCreate, SiteUpdate, SiteResponse
-from app.utils.firebase import (
+from app.utils.firebase_async import (
     create_site,
     get_site,
     get_all_sites,
     update_site,
     delete_site,
-    get_crawl_logs
+    get_crawl_logs_page
 )
 from app.services.rss_service import RSSService
-from app.services.scheduler_service import get_scheduler
-from app.services.crawler import crawl_site_job
+from app.services.crawl_log_writer import get_crawl_log_writer
+from app.services.task_queue import enqueue_task, WorkerUnavailableError
 
 router = APIRouter(prefix="/api/sites", tags=["sites"])
 logger = logging.getLogger(__name__)
@@ -47,22 +47,15 @@ async def create_new_site(site: SiteCreate):
         
         # 사이트 생성
         site_data = site.model_dump()
-        created_site = create_site(site_data)
+        created_site = await create_site(site_data)
         
-        # 활성 상태면 스케줄러에 작업 등록
+        # 활성 상태면 워커 스케줄러에 작업 등록 요청
         if site.status == 'active':
             try:
-                scheduler = get_scheduler()
-                scheduler.add_site_job(
-                    site_id=created_site['id'],
-                    site_name=created_site['name'],
-                    rss_url=created_site['rss_url'],
-                    crawl_interval=created_site['crawl_interval'],
-                    crawl_func=crawl_site_job
-                )
-                logger.info(f"Scheduler job added for site: {created_site['id']}")
+                await enqueue_task('sync_site', {'site_id': created_site['id']}, require_worker=False)
+                logger.info(f"Scheduler sync queued for site: {created_site['id']}")
             except Exception as e:
-                logger.warning(f"Failed to add scheduler job: {str(e)}")
+                logger.warning(f"Failed to queue scheduler sync: {str(e)}")
         
         logger.info(f"Site created successfully: {created_site['id']}")
         return SiteResponse(**created_site)
@@ -86,7 +79,7 @@ async def list_sites():
     """
     try:
         logger.info("Fetching all sites")
-        sites = get_all_sites()
+        sites = await get_all_sites()
         
         return [SiteResponse(**site) for site in sites]
         
@@ -107,7 +100,7 @@ async def get_site_by_id(site_id: str):
     """
     try:
         logger.info(f"Fetching site: {site_id}")
-        site = get_site(site_id)
+        site = await get_site(site_id)
         
         if not site:
             raise HTTPException(
@@ -139,7 +132,7 @@ async def update_site_by_id(site_id: str, site: SiteUpdate):
         logger.info(f"Updating site: {site_id}")
         
         # 사이트 존재 확인
-        existing_site = get_site(site_id)
+        existing_site = await get_site(site_id)
         if not existing_site:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -157,42 +150,15 @@ async def update_site_by_id(site_id: str, site: SiteUpdate):
         
         # 사이트 수정
         update_data = site.model_dump(exclude_unset=True)
-        updated_site = update_site(site_id, update_data)
+        updated_site = await update_site(site_id, update_data, current=existing_site)
         
-        # 스케줄러 작업 업데이트
-        try:
-            scheduler = get_scheduler()
-            
-            # 상태 변경 시
-            if site.status:
-                if site.status == 'active':
-                    # 활성화: 작업 추가 또는 재개
-                    scheduler.add_site_job(
-                        site_id=updated_site['id'],
-                        site_name=updated_site['name'],
-                        rss_url=updated_site['rss_url'],
-                        crawl_interval=updated_site['crawl_interval'],
-                        crawl_func=crawl_site_job
-                    )
-                    logger.info(f"Scheduler job activated for site: {site_id}")
-                else:
-                    # 비활성화 또는 에러: 작업 제거
-                    scheduler.remove_site_job(site_id)
-                    logger.info(f"Scheduler job removed for site: {site_id}")
-            
-            # 크롤링 주기 변경 시 (활성 상태인 경우만)
-            elif site.crawl_interval and updated_site.get('status') == 'active':
-                scheduler.update_site_job(
-                    site_id=updated_site['id'],
-                    site_name=updated_site['name'],
-                    rss_url=updated_site['rss_url'],
-                    crawl_interval=updated_site['crawl_interval'],
-                    crawl_func=crawl_site_job
-                )
-                logger.info(f"Scheduler job updated for site: {site_id}")
-                
-        except Exception as e:
-            logger.warning(f"Failed to update scheduler job: {str(e)}")
+        # 스케줄러 작업에 쓰는 필드(상태, 주기, RSS URL, 이름)가 바뀌면 워커에 동기화 요청 (추가/재등록/제거는 워커가 판단)
+        if site.status or site.crawl_interval or site.rss_url or site.name:
+            try:
+                await enqueue_task('sync_site', {'site_id': site_id}, require_worker=False)
+                logger.info(f"Scheduler sync queued for site: {site_id}")
+            except Exception as e:
+                logger.warning(f"Failed to queue scheduler sync: {str(e)}")
         
         logger.info(f"Site updated successfully: {site_id}")
         return SiteResponse(**updated_site)
@@ -218,23 +184,22 @@ async def delete_site_by_id(site_id: str):
         logger.info(f"Deleting site: {site_id}")
         
         # 사이트 존재 확인
-        existing_site = get_site(site_id)
+        existing_site = await get_site(site_id)
         if not existing_site:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Site not found: {site_id}"
             )
         
-        # 스케줄러 작업 제거
+        # 사이트 삭제
+        await delete_site(site_id)
+        
+        # 워커 스케줄러 작업 제거 요청 (사이트가 없으면 워커가 작업 제거)
         try:
-            scheduler = get_scheduler()
-            scheduler.remove_site_job(site_id)
-            logger.info(f"Scheduler job removed for site: {site_id}")
+            await enqueue_task('sync_site', {'site_id': site_id}, require_worker=False)
+            logger.info(f"Scheduler sync queued for deleted site: {site_id}")
         except Exception as e:
-            logger.warning(f"Failed to remove scheduler job: {str(e)}")
-        
-        # 사이트 삭제
-        delete_site(site_id)
+            logger.warning(f"Failed to queue scheduler sync: {str(e)}")
         
         logger.info(f"Site deleted successfully: {site_id}")
         return None
@@ -286,46 +251,32 @@ async def trigger_manual_crawl(site_id: str):
     
     - **site_id**: 사이트 ID
     
-    스케줄러를 통해 즉시 크롤링 실행
+    워커 프로세스에 크롤링을 요청하고 바로 응답 (결과는 크롤링 로그로 확인)
     """
     try:
         logger.info(f"Manual crawl triggered for site: {site_id}")
         
         # 사이트 존재 확인
-        site = get_site(site_id)
+        site = await get_site(site_id)
         if not site:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Site not found: {site_id}"
             )
         
-        # 스케줄러를 통해 즉시 실행
+        # 워커에 크롤링 요청 (스케줄러 작업이 있으면 즉시 실행, 없으면 워커가 직접 실행)
         try:
-            scheduler = get_scheduler()
-            
-            # 작업이 등록되어 있으면 즉시 실행
-            job_info = scheduler.get_job_info(site_id)
-            if job_info:
-                scheduler.trigger_site_job_now(site_id)
-                logger.info(f"Existing job triggered for site: {site_id}")
-            else:
-                # 작업이 없으면 직접 실행 (비활성 사이트)
-                logger.info(f"No job found, running crawler directly for site: {site_id}")
-                result = crawl_site_job(site_id)
-                
-                if result['status'] == 'failed':
-                    logger.warning(f"Manual crawl failed: {result.get('error', 'Unknown')}")
-                    
-        except Exception as e:
-            logger.error(f"Failed to trigger crawl: {str(e)}")
+            task = await enqueue_task('crawl_site', {'site_id': site_id})
+        except WorkerUnavailableError as e:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to trigger crawl: {str(e)}"
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e)
             )
         
         return {
             "message": f"Crawl job triggered for site: {site['name']}",
-            "site_id": site_id
+            "site_id": site_id,
+            "task_id": task['id']
         }
         
     except HTTPException:
@@ -339,12 +290,13 @@ async def trigger_manual_crawl(site_id: str):
 
 
 @router.get("/{site_id}/crawl-logs")
-async def get_site_crawl_logs(site_id: str, limit: int = 20):
+async def get_site_crawl_logs(site_id: str, limit: int = 20, cursor: Optional[str] = None):
     """
     특정 사이트의 크롤링 로그 조회
     
     - **site_id**: 사이트 ID
     - **limit**: 조회할 로그 수 (기본: 20)
+    - **cursor**: 이전 응답의 next_cursor (다음 페이지 조회)
     
     최근 크롤링 이력과 발견된 게시물 정보 반환
     """
@@ -352,7 +304,7 @@ async def get_site_crawl_logs(site_id: str, limit: int = 20):
         logger.info(f"Fetching crawl logs for site: {site_id}")
         
         # 사이트 존재 확인
-        site = get_site(site_id)
+        site = await get_site(site_id)
         if not site:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -360,7 +312,11 @@ async def get_site_crawl_logs(site_id: str, limit: int = 20):
             )
         
         # 크롤링 로그 조회
-        logs = get_crawl_logs(site_id=site_id, limit=limit)
+        page = await get_crawl_logs_page(site_id=site_id, limit=limit, cursor=cursor)
+        logs = page['logs']
+        if cursor is None:
+            # 아직 저장되지 않은 진행 중/최근 로그 반영
+            logs = get_crawl_log_writer().overlay(logs, site_id=site_id)
         
         logger.info(f"Found {len(logs)} crawl logs for site: {site_id}")
         
@@ -368,11 +324,17 @@ async def get_site_crawl_logs(site_id: str, limit: int = 20):
             "site_id": site_id,
             "site_name": site['name'],
             "total_logs": len(logs),
-            "logs": logs
+            "logs": logs,
+            "next_cursor": page['next_cursor']
         }
         
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Failed to fetch crawl logs for site {site_id}: {str(e)}")
         raise HTTPException(
@@ -382,11 +344,12 @@ async def get_site_crawl_logs(site_id: str, limit: int = 20):
 
 
 @router.get("/crawl-logs/all")
-async def get_all_crawl_logs(limit: int = 50):
+async def get_all_crawl_logs(limit: int = 50, cursor: Optional[str] = None):
     """
     모든 사이트의 크롤링 로그 조회
     
     - **limit**: 조회할 로그 수 (기본: 50)
+    - **cursor**: 이전 응답의 next_cursor (다음 페이지 조회)
     
     전체 크롤링 이력 반환
     """
@@ -394,15 +357,24 @@ async def get_all_crawl_logs(limit: int = 50):
         logger.info(f"Fetching all crawl logs (limit: {limit})")
         
         # 모든 크롤링 로그 조회
-        logs = get_crawl_logs(site_id=None, limit=limit)
+        page = await get_crawl_logs_page(site_id=None, limit=limit, cursor=cursor)
+        logs = page['logs']
+        if cursor is None:
+            logs = get_crawl_log_writer().overlay(logs)
         
         logger.info(f"Found {len(logs)} total crawl logs")
         
         return {
             "total_logs": len(logs),
-            "logs": logs
+            "logs": logs,
+            "next_cursor": page['next_cursor']
         }
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Failed to fetch all crawl logs: {str(e)}")
         raise HTTPException(
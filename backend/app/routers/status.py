@@ -2,8 +2,18 @@
 시스템 상태 확인 API 라우터
 """
 
-from fastapi import APIRouter
-from app.services.openai_status import check_api_status, get_usage_info
+from fastapi import APIRouter, Query
+from fastapi.responses import PlainTextResponse
+from app.services.openai_status import get_api_status, get_usage_info
+from app.services.llm_telemetry import get_telemetry
+from app.utils.cache import get_library_cache, get_project_cache, get_response_body_cache
+from app.services.crawl_log_writer import get_crawl_log_writer
+from app.utils.search_index import get_search_index
+from app.utils.firebase_async import get_worker_heartbeat
+from app.services.job_manager import get_job_manager
+from app.services.task_queue import is_worker_alive
+from app.config import settings
+from datetime import datetime, timezone
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,11 +22,16 @@ router = APIRouter()
 
 
 @router.get("/openai")
-async def get_openai_status():
+async def get_openai_status(
+    refresh: bool = Query(False, description="캐시를 무시하고 즉시 재확인")
+):
     """
     OpenAI API 연결 상태 확인
+    
+    - 백그라운드에서 주기적으로 갱신된 캐시 결과를 반환
+    - refresh=true면 즉시 재확인
     """
-    status = check_api_status()
+    status = await get_api_status(force_refresh=refresh)
     usage = get_usage_info()
     
     return {
@@ -26,11 +41,13 @@ async def get_openai_status():
 
 
 @router.get("/system")
-async def get_system_status():
+async def get_system_status(
+    refresh: bool = Query(False, description="캐시를 무시하고 즉시 재확인")
+):
     """
     전체 시스템 상태 확인
     """
-    openai_status = check_api_status()
+    openai_status = await get_api_status(force_refresh=refresh)
     
     return {
         "status": "healthy",
@@ -44,3 +61,88 @@ async def get_system_status():
         }
     }
 
+
+
+@router.get("/worker")
+async def get_worker_status():
+    """
+    워커 프로세스 상태 (python -m app.worker가 주기적으로 저장한 heartbeat)
+    
+    - alive: 마지막 heartbeat가 WORKER_HEARTBEAT_INTERVAL의 3배 이내
+    - jobs: 이 API 프로세스의 작업(/api/jobs) 지표
+    """
+    jobs = get_job_manager().stats()
+    if settings.WORKER_EMBEDDED:
+        return {"alive": True, "embedded": True, "jobs": jobs}
+    
+    heartbeat = await get_worker_heartbeat()
+    if heartbeat is None:
+        return {"alive": False, "heartbeat": None, "jobs": jobs}
+    
+    age = (datetime.now(timezone.utc) - heartbeat['updated_at']).total_seconds()
+    return {
+        "alive": is_worker_alive(heartbeat),
+        "heartbeat_age_seconds": round(age, 1),
+        "heartbeat": heartbeat,
+        "jobs": jobs
+    }
+
+
+@router.get("/llm")
+async def get_llm_metrics():
+    """
+    LLM 호출 지표 조회 (호출 지점별 토큰, 지연시간, 비용)
+    """
+    return get_telemetry().snapshot()
+
+
+@router.get("/cache")
+async def get_cache_metrics():
+    """
+    쿼리 캐시, 검색 색인, 크롤링 로그 버퍼 지표 조회 (적중률, 크기, 무효화 횟수)
+    """
+    return {
+        "library_feed": get_library_cache().stats(),
+        "projects": get_project_cache().stats(),
+        "response_bodies": get_response_body_cache().stats(),
+        "search_index": get_search_index().stats(),
+        "crawl_log_writer": get_crawl_log_writer().stats()
+    }
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_prometheus_metrics():
+    """
+    Prometheus 형식 지표
+    """
+    return PlainTextResponse(
+        get_telemetry().to_prometheus() + _cache_prometheus(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
+def _cache_prometheus() -> str:
+    """캐시 지표를 Prometheus 형식으로 변환"""
+    caches = {
+        'library_feed': get_library_cache().stats(),
+        'projects': get_project_cache().stats()
+    }
+    lines = []
+    
+    for name, kind, help_text in (
+        ('hits', 'counter', 'Cache lookups served from cache'),
+        ('misses', 'counter', 'Cache lookups that missed'),
+        ('evictions', 'counter', 'Entries evicted by the LRU bound'),
+        ('expirations', 'counter', 'Entries dropped after TTL expiry'),
+        ('invalidations', 'counter', 'Entries removed by write invalidation'),
+        ('size', 'gauge', 'Current number of cached entries'),
+    ):
+        metric = f'query_cache_{name}' + ('_total' if kind == 'counter' else '')
+        lines += [
+            f'# HELP {metric} {help_text}',
+            f'# TYPE {metric} {kind}'
+        ]
+        lines += [f'{metric}{{cache="{cache}"}} {stats[name]}' for cache, stats in caches.items()]
+    
+    return '\n'.join(lines) + '\n'
+
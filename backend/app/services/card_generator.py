@@ -1,9 +1,10 @@
 """카드뉴스 생성 서비스"""
 
 from typing import List, Dict
-from openai import OpenAI
 from app.config import settings
+from app.utils.openai_client import create_openai_client
 from app.utils.prompts import CARD_GENERATION_PROMPT
+from app.services.llm_telemetry import tracked_completion
 import json
 import logging
 import re
@@ -15,7 +16,7 @@ class CardNewsGenerator:
     """AI를 사용하여 카드뉴스 섹션 자동 생성"""
     
     def __init__(self, model: str = None):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = create_openai_client()
         self.model = model or settings.OPENAI_MODEL
     
     def generate_sections(
@@ -48,7 +49,9 @@ class CardNewsGenerator:
         )
         
         try:
-            response = self.client.chat.completions.create(
+            response = tracked_completion(
+                self.client,
+                'card_generator.sections',
                 model=self.model,
                 messages=[
                     {
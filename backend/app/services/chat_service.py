@@ -1,9 +1,10 @@
 """AI 채팅 서비스"""
 
 from typing import List, Dict, Optional
-from openai import OpenAI
 from app.config import settings
+from app.utils.openai_client import create_openai_client
 from app.utils.prompts import CHAT_SYSTEM_PROMPT
+from app.services.llm_telemetry import tracked_completion
 import json
 import logging
 
@@ -14,7 +15,7 @@ class ChatService:
     """AI와 대화하며 카드뉴스 섹션을 수정하는 서비스"""
     
     def __init__(self, model: str = None):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = create_openai_client()
         self.model = model or settings.OPENAI_MODEL
     
     def process_chat_message(
@@ -64,7 +65,9 @@ class ChatService:
         
         try:
             # GPT 호출 (Function Calling 사용)
-            response = self.client.chat.completions.create(
+            response = tracked_completion(
+                self.client,
+                'chat.message',
                 model=self.model,
                 messages=messages,
                 temperature=0.7,
@@ -310,7 +313,9 @@ class ChatService:
 ⚠️ 주의: 원본과 동일한 내용을 반환하지 마세요! 반드시 요청에 따라 수정해야 합니다!
 """
             
-            response = self.client.chat.completions.create(
+            response = tracked_completion(
+                self.client,
+                'chat.modify_all',
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "당신은 카드뉴스 내용을 수정하는 전문가입니다. 사용자의 요청을 정확히 반영하여 내용을 반드시 변경해야 합니다. 항상 유효한 JSON 형식으로 응답하세요."},
@@ -0,0 +1,174 @@
+"""
+크롤링 로그 write-behind 버퍼
+
+크롤링 중 로그 상태(running → success/failed)를 메모리에 보관하고,
+백그라운드 스레드가 주기적으로 변경분을 배치로 저장합니다.
+크롤링 경로는 로그 저장을 기다리지 않으며, 같은 주기 안의 생성/완료는 쓰기 1회로 합쳐집니다.
+"""
+
+from typing import Dict, List, Optional
+import atexit
+import logging
+import threading
+
+from app.config import settings
+from app.utils.firebase import _new_crawl_log_data, write_crawl_logs
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlLogWriter:
+    """크롤링 로그 write-behind 버퍼 (스레드 안전)"""
+    
+    def __init__(self, flush_interval: float = 2.0, max_pending: int = 400):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending  # 대기 중인 로그가 이만큼 쌓이면 주기를 기다리지 않고 저장
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._logs: Dict[str, Dict] = {}   # log_id -> 최신 문서 (저장 전이거나 진행 중인 로그)
+        self._dirty: Dict[str, None] = {}  # 저장할 log_id (삽입 순서 유지)
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.flushes = 0
+        self.written = 0
+        self.failures = 0
+    
+    # ---- 기록 ----
+    
+    def create(self, data: Dict) -> Dict:
+        """
+        크롤링 로그 생성 (ID는 즉시 발급, 저장은 다음 flush)
+        
+        Returns:
+            생성된 로그
+        """
+        log = _new_crawl_log_data(data)
+        self._mark(log['id'], log)
+        return dict(log)
+    
+    def update(self, log_id: str, data: Dict):
+        """크롤링 로그 변경 (다음 flush에 저장)"""
+        self._mark(log_id, data)
+    
+    def _mark(self, log_id: str, data: Dict):
+        with self._lock:
+            log = self._logs.setdefault(log_id, {'id': log_id})
+            log.update(data)
+            self._dirty[log_id] = None
+            pending = len(self._dirty)
+        
+        self._ensure_thread()
+        if pending >= self.max_pending:
+            self._wakeup.set()
+    
+    # ---- 저장 ----
+    
+    def flush(self) -> int:
+        """
+        대기 중인 변경 저장 (set merge, 배치 커밋)
+        
+        Returns:
+            저장한 로그 수 (실패 시 0, 변경은 다음 flush에 다시 시도)
+        """
+        with self._flush_lock:
+            with self._lock:
+                docs = [dict(self._logs[log_id]) for log_id in self._dirty]
+                self._dirty.clear()
+            
+            if not docs:
+                return 0
+            
+            try:
+                write_crawl_logs(docs)
+            except Exception as e:
+                with self._lock:
+                    for doc in docs:
+                        self._dirty.setdefault(doc['id'], None)
+                self.failures += 1
+                logger.error(f"Crawl log flush failed ({len(docs)} logs): {str(e)}")
+                return 0
+            
+            with self._lock:
+                # 완료된 로그는 저장 후 메모리에서 제거 (그 사이 다시 바뀐 로그는 유지)
+                for doc in docs:
+                    log = self._logs.get(doc['id'])
+                    if log is not None and doc['id'] not in self._dirty and log.get('status') != 'running':
+                        del self._logs[doc['id']]
+            
+            self.flushes += 1
+            self.written += len(docs)
+            logger.debug(f"Crawl logs flushed: {len(docs)}")
+            return len(docs)
+    
+    def _ensure_thread(self):
+        if self._thread is not None or self._stopping.is_set():
+            return
+        
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='crawl-log-writer', daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+    
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+    
+    def close(self, timeout: float = 10.0):
+        """백그라운드 저장 중지 후 남은 변경 최종 저장"""
+        self._stopping.set()
+        self._wakeup.set()
+        
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        
+        flushed = self.flush()
+        if flushed:
+            logger.info(f"Crawl log writer closed: {flushed} logs flushed")
+    
+    # ---- 조회 ----
+    
+    def overlay(self, logs: List[Dict], site_id: Optional[str] = None) -> List[Dict]:
+        """
+        저장된 로그 목록(최신순 첫 페이지)에 아직 저장되지 않은 메모리 상태 반영
+        
+        Args:
+            logs: 저장소에서 읽은 로그
+            site_id: 사이트 필터 (None이면 전체)
+        """
+        with self._lock:
+            pending = {
+                log_id: dict(log) for log_id, log in self._logs.items()
+                if log.get('started_at') and (site_id is None or log.get('site_id') == site_id)
+            }
+        
+        if not pending:
+            return logs
+        
+        merged = [{**log, **pending.pop(log['id'], {})} for log in logs]
+        return sorted(pending.values(), key=lambda log: log['started_at'], reverse=True) + merged
+    
+    def stats(self) -> Dict:
+        """버퍼 지표"""
+        with self._lock:
+            return {
+                'pending': len(self._dirty),
+                'in_memory': len(self._logs),
+                'flushes': self.flushes,
+                'written': self.written,
+                'failures': self.failures,
+                'flush_interval_seconds': self.flush_interval
+            }
+
+
+# 전역 크롤링 로그 버퍼
+_crawl_log_writer = CrawlLogWriter(flush_interval=settings.CRAWL_LOG_FLUSH_INTERVAL)
+
+
+def get_crawl_log_writer() -> CrawlLogWriter:
+    """전역 크롤링 로그 버퍼 가져오기"""
+    return _crawl_log_writer
@@ -5,11 +5,11 @@ from typing import Dict, List, Optional
 import logging
 
 from app.services.rss_service import RSSService
+from app.services.crawl_log_writer import get_crawl_log_writer
 from app.utils.firebase import (
     get_site,
-    update_site,
-    create_crawl_log,
-    update_crawl_log
+    record_site_crawl,
+    SITE_ERROR_THRESHOLD
 )
 
 logger = logging.getLogger(__name__)
@@ -39,6 +39,7 @@ class SiteCrawler:
         """
         start_time = datetime.now(timezone.utc)
         log_id = None
+        site = None
         
         try:
             logger.info(f"Starting crawl for site: {site_id}")
@@ -52,14 +53,14 @@ class SiteCrawler:
                     'error': 'Site not found'
                 }
             
-            # 크롤링 로그 생성 (시작)
+            # 크롤링 로그 생성 (시작, 저장은 버퍼에서 비동기로)
             log_data = {
                 'site_id': site_id,
                 'site_name': site['name'],
                 'status': 'running',
                 'started_at': start_time
             }
-            log = create_crawl_log(log_data)
+            log = get_crawl_log_writer().create(log_data)
             log_id = log['id']
             
             # RSS 피드 파싱
@@ -145,9 +146,12 @@ class SiteCrawler:
                             # 제목 번역 (영문인 경우만)
                             import re
                             if re.search(r'[a-zA-Z]{3,}', title_kr):  # 영문이 포함된 경우
-                                from openai import OpenAI
-                                client = OpenAI()
-                                response = client.chat.completions.create(
+                                from app.utils.openai_client import create_openai_client
+                                from app.services.llm_telemetry import tracked_completion
+                                client = create_openai_client()
+                                response = tracked_completion(
+                                    client,
+                                    'crawler.title_translation',
                                     model='gpt-4.1-nano',
                                     messages=[
                                         {"role": "system", "content": "당신은 전문 번역가입니다. 제목을 간결하고 자연스러운 한글로 번역해주세요."},
@@ -221,18 +225,14 @@ class SiteCrawler:
                 'duration_seconds': duration,
                 'post_titles': post_titles
             }
-            update_crawl_log(log_id, log_update)
+            get_crawl_log_writer().update(log_id, log_update)
             
-            # 사이트 통계 업데이트
+            # 사이트 통계 업데이트 (Increment, 크롤링 시각과 함께 쓰기 1회)
             next_crawl_at = datetime.now(timezone.utc) + timedelta(minutes=site['crawl_interval'])
-            site_update = {
+            record_site_crawl(site_id, success=True, new_posts=len(new_posts), data={
                 'last_crawled_at': end_time,
-                'next_crawl_at': next_crawl_at,
-                'total_crawls': site.get('total_crawls', 0) + 1,
-                'success_count': site.get('success_count', 0) + 1,
-                'total_posts_found': site.get('total_posts_found', 0) + len(new_posts)
-            }
-            update_site(site_id, site_update)
+                'next_crawl_at': next_crawl_at
+            })
             
             logger.info(f"Crawl completed for site {site_id}: {len(new_posts)} new posts in {duration:.2f}s")
             
@@ -257,25 +257,19 @@ class SiteCrawler:
                     'completed_at': end_time,
                     'duration_seconds': duration
                 }
-                update_crawl_log(log_id, log_update)
+                get_crawl_log_writer().update(log_id, log_update)
             
-            # 사이트 에러 카운트 증가
-            try:
-                site = get_site(site_id)
-                if site:
-                    site_update = {
-                        'total_crawls': site.get('total_crawls', 0) + 1,
-                        'error_count': site.get('error_count', 0) + 1
-                    }
-                    
-                    # 에러가 5회 이상이면 상태를 'error'로 변경
-                    if site_update['error_count'] >= 5:
+            # 사이트 에러 카운트 증가 (크롤링 시작 시 읽은 사이트 기준으로 에러 상태 판단)
+            if site:
+                try:
+                    site_update = {}
+                    if site.get('error_count', 0) + 1 >= SITE_ERROR_THRESHOLD:
                         site_update['status'] = 'error'
-                        logger.warning(f"Site {site_id} marked as error (5+ failures)")
+                        logger.warning(f"Site {site_id} marked as error ({SITE_ERROR_THRESHOLD}+ failures)")
                     
-                    update_site(site_id, site_update)
-            except:
-                pass
+                    record_site_crawl(site_id, success=False, data=site_update)
+                except Exception as update_error:
+                    logger.error(f"Failed to record crawl failure for site {site_id}: {str(update_error)}")
             
             return {
                 'status': 'failed',
@@ -0,0 +1,290 @@
+"""
+백그라운드 작업(Job) 관리 - 오래 걸리는 요청을 작업 ID로 분리
+
+요청 핸들러는 작업을 제출하고 바로 작업 ID를 반환합니다.
+진행 상황은 GET /api/jobs/{id} 폴링 또는 SSE(GET /api/jobs/{id}/events)로 확인하고,
+POST /api/jobs/{id}/cancel로 취소합니다.
+
+작업은 API 프로세스 안의 asyncio 작업으로 실행되며 동시 실행 수가 제한됩니다.
+(작업 상태는 메모리에만 있으므로 작업을 제출한 프로세스에서 조회해야 합니다)
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import logging
+import time
+import uuid
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 완료 상태
+JOB_DONE_STATUSES = ('completed', 'failed', 'cancelled')
+
+
+class Job:
+    """백그라운드 작업 상태와 진행 이벤트"""
+    
+    def __init__(self, job_type: str, steps: Optional[List[str]] = None, max_events: int = 200):
+        self.id = str(uuid.uuid4())
+        self.type = job_type
+        self.status = 'queued'
+        self.steps = steps or []  # 진행 단계 이름 (progress 계산용)
+        self.step: Optional[str] = None
+        self.message: Optional[str] = None
+        self.result: Optional[Any] = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now(timezone.utc)
+        self.started_at: Optional[datetime] = None
+        self.completed_at: Optional[datetime] = None
+        self.finished_monotonic: Optional[float] = None
+        self.events: List[Dict] = []  # {'id', 'event', 'data'} (최근 max_events개)
+        self.max_events = max_events
+        self._next_event_id = 1
+        self._changed = asyncio.Condition()
+        self._task: Optional[asyncio.Task] = None
+        self._cancel_callbacks: List[Callable[[], Awaitable[None]]] = []
+    
+    @property
+    def done(self) -> bool:
+        return self.status in JOB_DONE_STATUSES
+    
+    @property
+    def progress(self) -> float:
+        """단계 기준 진행률 (0~1)"""
+        if self.status == 'completed':
+            return 1.0
+        if not self.steps or self.step not in self.steps:
+            return 0.0
+        return round(self.steps.index(self.step) / len(self.steps), 2)
+    
+    # ---- 진행 보고 (작업 함수에서 호출) ----
+    
+    async def report(self, step: str, message: Optional[str] = None, **data):
+        """
+        진행 단계 보고
+        
+        Args:
+            step: 단계 이름 (steps 중 하나면 progress 반영)
+            message: 사용자에게 보여줄 메시지
+            data: 이벤트에 함께 보낼 값 (예: current=2, total=5)
+        """
+        self.step = step
+        self.message = message
+        await self._emit('progress', {'step': step, 'message': message, 'progress': self.progress, **data})
+    
+    def on_cancel(self, callback: Callable[[], Awaitable[None]]):
+        """취소 시 실행할 정리 작업 등록 (예: 워커 작업 취소)"""
+        self._cancel_callbacks.append(callback)
+    
+    # ---- 내부 ----
+    
+    async def _set_status(self, status: str, **data):
+        self.status = status
+        await self._emit('status', {'status': status, **data})
+    
+    async def _emit(self, event: str, data: Dict):
+        async with self._changed:
+            self.events.append({'id': self._next_event_id, 'event': event, 'data': data})
+            self._next_event_id += 1
+            if len(self.events) > self.max_events:
+                del self.events[:len(self.events) - self.max_events]
+            self._changed.notify_all()
+    
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'type': self.type,
+            'status': self.status,
+            'step': self.step,
+            'message': self.message,
+            'progress': self.progress,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'completed_at': self.completed_at
+        }
+
+
+JobFunc = Callable[[Job], Awaitable[Any]]
+
+
+class JobManager:
+    """작업 제출/조회/취소 (동시 실행 수 제한)"""
+    
+    def __init__(self, max_concurrent: int = 4, retention: float = 3600, max_jobs: int = 1000):
+        self.max_concurrent = max_concurrent
+        self.retention = retention  # 완료된 작업 보관 시간 (초)
+        self.max_jobs = max_jobs
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+    
+    def submit(self, job_type: str, func: JobFunc, steps: Optional[List[str]] = None) -> Job:
+        """
+        작업 제출 (이벤트 루프 안에서 호출, 즉시 반환)
+        
+        Args:
+            job_type: 작업 종류
+            func: 작업 함수 (Job을 받아 결과를 반환하는 코루틴)
+            steps: 진행 단계 이름
+        
+        Returns:
+            제출된 작업 (status='queued')
+        """
+        self._prune()
+        
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        job = Job(job_type, steps=steps)
+        self._jobs[job.id] = job
+        job._task = asyncio.get_running_loop().create_task(self._run(job, func))
+        self.submitted += 1
+        
+        logger.info(f"Job submitted: {job_type} ({job.id})")
+        return job
+    
+    async def _run(self, job: Job, func: JobFunc):
+        try:
+            async with self._semaphore:
+                job.started_at = datetime.now(timezone.utc)
+                await job._set_status('running')
+                
+                job.result = await func(job)
+                job.step = None
+                job.message = None
+                self.completed += 1
+                await self._finish(job, 'completed')
+                logger.info(f"Job completed: {job.type} ({job.id})")
+        
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            await self._finish(job, 'cancelled')
+            logger.info(f"Job cancelled: {job.type} ({job.id})")
+        except Exception as e:
+            job.error = str(e)
+            self.failed += 1
+            await self._finish(job, 'failed')
+            logger.error(f"Job failed: {job.type} ({job.id}): {str(e)}", exc_info=True)
+    
+    async def _finish(self, job: Job, status: str):
+        job.completed_at = datetime.now(timezone.utc)
+        job.finished_monotonic = time.monotonic()
+        await job._set_status(status, result=job.result, error=job.error)
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        """작업 조회"""
+        return self._jobs.get(job_id)
+    
+    def recent(self, limit: int = 50) -> List[Job]:
+        """최근 작업 목록 (최신순)"""
+        self._prune()
+        return list(reversed(self._jobs.values()))[:limit]
+    
+    async def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        작업 취소 (이미 끝난 작업은 그대로 반환)
+        
+        Returns:
+            작업 (없으면 None)
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.done:
+            return job
+        
+        for callback in job._cancel_callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                logger.warning(f"Job cancel callback failed ({job.id}): {str(e)}")
+        
+        job._task.cancel()
+        try:
+            await job._task
+        except asyncio.CancelledError:
+            pass
+        
+        return job
+    
+    async def events(self, job_id: str, after: int = 0, keepalive: Optional[float] = None) -> AsyncIterator[Dict]:
+        """
+        작업 이벤트 스트림 (after 이후 이벤트부터, 작업이 끝나면 종료)
+        
+        Args:
+            job_id: 작업 ID
+            after: 마지막으로 받은 이벤트 ID (SSE Last-Event-ID)
+            keepalive: 이벤트 없이 이 시간(초)이 지나면 {'event': 'ping'} 반환 (프록시 유휴 연결 종료 방지)
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        
+        while True:
+            async with job._changed:
+                pending = [event for event in job.events if event['id'] > after]
+                if not pending:
+                    if job.done:
+                        return
+                    try:
+                        await asyncio.wait_for(job._changed.wait(), keepalive)
+                    except asyncio.TimeoutError:
+                        pending = [{'id': None, 'event': 'ping', 'data': None}]
+                    else:
+                        continue
+            
+            for event in pending:
+                after = event['id'] or after
+                yield event
+    
+    async def shutdown(self):
+        """실행 중인 작업 취소 (앱 종료 시 호출)"""
+        for job in list(self._jobs.values()):
+            if not job.done:
+                await self.cancel(job.id)
+    
+    def _prune(self):
+        """보관 시간이 지났거나 최대 개수를 넘은 완료 작업 삭제"""
+        now = time.monotonic()
+        for job_id in [
+            job.id for job in self._jobs.values()
+            if job.done and now - job.finished_monotonic > self.retention
+        ]:
+            del self._jobs[job_id]
+        
+        for job_id in [job.id for job in self._jobs.values() if job.done][:max(0, len(self._jobs) - self.max_jobs)]:
+            del self._jobs[job_id]
+    
+    def stats(self) -> Dict:
+        """작업 지표"""
+        running = sum(1 for job in self._jobs.values() if job.status == 'running')
+        queued = sum(1 for job in self._jobs.values() if job.status == 'queued')
+        return {
+            'max_concurrent': self.max_concurrent,
+            'running': running,
+            'queued': queued,
+            'tracked': len(self._jobs),
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'failed': self.failed,
+            'cancelled': self.cancelled
+        }
+
+
+# 전역 작업 관리자
+_job_manager = JobManager(
+    max_concurrent=settings.JOB_MAX_CONCURRENT,
+    retention=settings.JOB_RETENTION_SECONDS
+)
+
+
+def get_job_manager() -> JobManager:
+    """전역 작업 관리자 가져오기"""
+    return _job_manager
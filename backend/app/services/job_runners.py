@@ -0,0 +1,138 @@
+"""
+작업 종류별 실행 함수 (POST /api/jobs)
+
+- create_project: URL 스크래핑 후 프로젝트 저장 (API 프로세스에서 실행, URL별 진행 이벤트)
+- create_cardnews: 워커 작업으로 자동 생성 파이프라인 실행 (워커 작업 문서의 진행 단계를 전달)
+- trigger_crawl: 워커 작업으로 수동 크롤링 실행
+"""
+
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional
+import logging
+
+from fastapi.encoders import jsonable_encoder
+
+from app.models.job import (
+    CreateProjectJobRequest,
+    CreateCardnewsJobRequest,
+    TriggerCrawlJobRequest
+)
+from app.models.library import CreateCardnewsRequest
+from app.models.project import ProjectResponse
+from app.services.job_manager import Job, get_job_manager
+from app.services.project_service import create_project_from_request
+from app.services.task_queue import enqueue_task, wait_for_task, cancel_task
+from app.utils.firebase_async import get_rss_post, get_project
+
+logger = logging.getLogger(__name__)
+
+# 작업 종류별 진행 단계
+JOB_STEPS = {
+    'create_project': ['scrape', 'save'],
+    'create_cardnews': ['waiting_worker', 'scrape', 'create_project', 'summarize', 'generate_sections'],
+    'trigger_crawl': ['waiting_worker', 'crawl']
+}
+
+
+async def enqueue_cardnews_task(request: CreateCardnewsRequest, site: Dict) -> Dict:
+    """
+    RSS 게시물 카드뉴스 생성 워커 작업 추가
+    
+    Returns:
+        생성된 워커 작업
+    """
+    # 원본 게시일 유지 (라이브러리 피드 정렬 위치가 바뀌지 않도록)
+    rss_post = await get_rss_post(request.rss_post_id)
+    published = (rss_post or {}).get('published_at') or datetime.now()
+    
+    # RSS 게시물 형식으로 변환
+    post = {
+        'id': request.rss_post_id,
+        'title': request.title,
+        'link': request.url,
+        'content': request.content,
+        'summary': '',
+        'published': published,
+        'author': 'Unknown'
+    }
+    
+    return await enqueue_task('create_cardnews', {
+        'post': post,
+        'site_id': request.site_id,
+        'site_name': site['name']
+    })
+
+
+async def _run_worker_task(job: Job, task: Dict) -> Dict:
+    """워커 작업 완료 대기 (워커가 기록한 진행 단계를 작업 이벤트로 전달, 작업 취소 시 대기 중인 워커 작업도 취소)"""
+    job.on_cancel(lambda: cancel_task(task['id']))
+    
+    async def on_update(worker_task: Dict):
+        progress = worker_task.get('progress')
+        if progress and progress['step'] != job.step:
+            await job.report(progress['step'], progress.get('message'))
+        elif worker_task['status'] == 'queued':
+            await job.report('waiting_worker', '워커 대기 중', task_id=task['id'])
+    
+    worker_task = await wait_for_task(task['id'], on_update=on_update)
+    if worker_task['status'] != 'completed':
+        raise RuntimeError(worker_task.get('error') or f"Worker task {worker_task['status']}")
+    
+    return worker_task.get('result') or {}
+
+
+def _create_project_runner(request: CreateProjectJobRequest) -> Callable[[Job], Awaitable[Dict]]:
+    async def run(job: Job) -> Dict:
+        async def on_progress(current: int, total: int, url: str, ok: bool):
+            await job.report('scrape', f'URL 스크래핑 {current}/{total}', current=current, total=total, url=url, ok=ok)
+        
+        project_data = await create_project_from_request(request.params, on_progress=on_progress)
+        await job.report('save', '프로젝트 저장 완료')
+        return jsonable_encoder(ProjectResponse(**project_data))
+    
+    return run
+
+
+def _create_cardnews_runner(request: CreateCardnewsJobRequest, site: Dict) -> Callable[[Job], Awaitable[Dict]]:
+    async def run(job: Job) -> Dict:
+        task = await enqueue_cardnews_task(request.params, site)
+        result = await _run_worker_task(job, task)
+        
+        project = await get_project(result['project_id'])
+        return {
+            'project_id': result['project_id'],
+            'status': (project or {}).get('status', 'draft')
+        }
+    
+    return run
+
+
+def _trigger_crawl_runner(request: TriggerCrawlJobRequest) -> Callable[[Job], Awaitable[Dict]]:
+    async def run(job: Job) -> Dict:
+        task = await enqueue_task('crawl_site', {'site_id': request.params.site_id})
+        return await _run_worker_task(job, task)
+    
+    return run
+
+
+def submit_job(request, site: Optional[Dict] = None) -> Job:
+    """
+    작업 제출
+    
+    Args:
+        request: JobSubmitRequest (CreateProjectJobRequest | CreateCardnewsJobRequest | TriggerCrawlJobRequest)
+        site: 사이트 정보 (create_cardnews)
+    
+    Returns:
+        제출된 작업
+    """
+    if request.type == 'create_project':
+        func = _create_project_runner(request)
+    elif request.type == 'create_cardnews':
+        func = _create_cardnews_runner(request, site)
+    elif request.type == 'trigger_crawl':
+        func = _trigger_crawl_runner(request)
+    else:
+        raise ValueError(f"Unknown job type: {request.type}")
+    
+    return get_job_manager().submit(request.type, func, steps=JOB_STEPS[request.type])
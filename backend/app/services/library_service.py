@@ -1,12 +1,25 @@
 """RSS Library 서비스 - 통합 피드 제공"""
 
-from typing import List, Dict, Optional
+from typing import AsyncIterator, Dict, Optional
 from datetime import datetime, timedelta, timezone
+import asyncio
 import hashlib
+import json
 import logging
 
+from app.config import settings
 from app.services.rss_service import RSSService
-from app.utils.firebase import get_all_projects, get_all_sites, get_all_rss_posts
+from app.utils.cache import get_library_cache, invalidate_library_cache
+from app.utils.firebase import _encode_cursor, _decode_cursor, _published_range, _library_stats_view
+from app.utils.firebase_async import (
+    get_library_items_batch,
+    get_library_items,
+    get_all_library_items,
+    count_library_items,
+    get_library_items_updated_since,
+    get_library_stats
+)
+from app.utils.search_index import get_search_index, tokenize
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +29,8 @@ class LibraryService:
     
     def __init__(self):
         self.rss_service = RSSService()
-        self.cache = {}  # 메모리 캐시 (1시간)
-        self.cache_ttl = 3600
+        self.cache = get_library_cache()  # TTL + LRU + 버전 스탬프, 쓰기 시 무효화
+        self.search_index = get_search_index()  # 키워드 검색 역색인
     
     async def get_feed(
         self,
@@ -27,10 +40,14 @@ class LibraryService:
         keyword: Optional[str] = None,
         year_month: Optional[str] = None,
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        cursor: Optional[str] = None
     ) -> Dict:
         """
-        통합 RSS 피드 조회
+        통합 RSS 피드 조회 (키셋 페이지네이션)
+        
+        쓰기 시점에 유지되는 library_items 컬렉션을 (published_at DESC, key DESC)
+        순서로 인덱스 쿼리하여 한 페이지만 읽습니다.
         
         Args:
             site_id: 특정 사이트만 조회 (None이면 전체)
@@ -38,55 +55,113 @@ class LibraryService:
             end_date: 종료 날짜
             keyword: 키워드 검색
             year_month: 연월 필터 (YYYY-MM 형식)
-            page: 페이지 번호
+            page: 페이지 번호 (cursor가 없을 때만 사용)
             page_size: 페이지 크기
+            cursor: 이전 응답의 next_cursor
             
         Returns:
             {
                 'total': int,
                 'page': int,
                 'page_size': int,
-                'items': List[FeedItem]
+                'items': List[FeedItem],
+                'next_cursor': str | None,
+                'version': str           # 결과 버전 (ETag용, 조회 실패 시 없음)
             }
+            
+        Raises:
+            ValueError: 잘못된 커서 또는 year_month 형식
         """
+        after = _decode_cursor(cursor) if cursor else None
+        since, until = _published_range(start_date, end_date, year_month)
+        
+        # 필터 조합 단위 캐시 (키의 첫 요소는 site_id - 사이트별 무효화용)
+        cache_key = (
+            site_id,
+            start_date,
+            end_date,
+            keyword.lower() if keyword else None,
+            year_month,
+            None if cursor else page,
+            page_size,
+            cursor
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # 읽는 동안 무효화되면 결과를 캐시하지 않음 (오래된 페이지가 TTL 동안 남는 것 방지)
+        cache_version = self.cache.version()
+        
         try:
-            logger.info(f"Getting library feed (site_id={site_id}, keyword={keyword}, page={page})")
+            logger.info(f"Getting library feed (site_id={site_id}, keyword={keyword}, page={page}, cursor={bool(cursor)})")
             
-            # 1. Firestore에서 RSS 프로젝트 가져오기
-            projects = self._get_projects_feed(site_id, start_date, end_date)
-            logger.info(f"Found {len(projects)} projects from Firestore")
+            start_date = _as_utc(start_date)
+            end_date = _as_utc(end_date)
             
-            # 2. DB에 저장된 RSS 게시물 가져오기
-            rss_posts = self._get_rss_posts_from_db(site_id, start_date, end_date, year_month)
-            logger.info(f"Found {len(rss_posts)} posts from DB")
+            # 키워드 검색은 역색인 사용 (색인 준비 전이나 토큰이 없는 검색어(기호, 다른 문자 등)는
+            # 아래 스캔으로 처리, 스캔에서 받은 키셋 커서는 스캔으로 이어서 조회)
+            if keyword and tokenize(keyword) and self.search_index.ready and (after is None or 'offset' in after):
+                result = await self._search_feed(
+                    site_id, start_date, end_date, keyword, year_month, page, page_size, after
+                )
+                result['version'] = _feed_version(cache_key, result)
+                self.cache.put(cache_key, result, cache_version)
+                return result
             
-            # 3. 통합 및 중복 제거
-            combined = self._merge_feeds(projects, rss_posts)
-            logger.info(f"Combined total: {len(combined)} items")
+            # 커서가 없으면 page 번호만큼 건너뜀 (기존 page 파라미터 호환)
+            skip = 0 if after else (page - 1) * page_size
+            if after and 'offset' in after:
+                # 검색 결과 커서 (색인 준비 전 요청)
+                skip, after = int(after['offset']), None
+            skipped = 0
+            items = []
             
-            # 4. 필터링
-            filtered = self._apply_filters(combined, keyword, start_date, end_date)
-            logger.info(f"Filtered: {len(filtered)} items")
+            # 날짜 필터는 published_at 범위 쿼리로 처리 (범위 안의 문서만 읽음)
+            stream = self._item_stream(site_id, after, since, until, batch_size=page_size + 1)
+            try:
+                async for item in stream:
+                    if keyword and not self._matches_keyword(item, keyword):
+                        continue
+                    
+                    if skipped < skip:
+                        skipped += 1
+                        continue
+                    
+                    items.append(item)
+                    if len(items) > page_size:
+                        break
+            finally:
+                await stream.aclose()
             
-            # 5. 정렬 (최신순)
-            sorted_feed = sorted(
-                filtered,
-                key=lambda x: x['published_at'] or datetime.min.replace(tzinfo=timezone.utc),
-                reverse=True
-            )
+            next_cursor = None
+            if len(items) > page_size:
+                items = items[:page_size]
+                next_cursor = _encode_cursor({
+                    'published_at': items[-1]['published_at'],
+                    'key': items[-1]['key']
+                })
             
-            # 6. 페이지네이션
-            total = len(sorted_feed)
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            items = sorted_feed[start_idx:end_idx]
+            # 전체 개수: 키워드가 있으면 현재까지 확인된 개수 (다음 페이지 존재 시 +1),
+            # 없으면 사전 집계 카운터 (임의 날짜 범위나 카운터가 없으면 count 집계)
+            if keyword:
+                total = skipped + len(items) + (1 if next_cursor else 0)
+            else:
+                total = await self._count(site_id, start_date, end_date, year_month, since, until)
             
-            return {
+            logger.info(f"Library feed page: {len(items)} items (has_next={next_cursor is not None})")
+            
+            result = {
                 'total': total,
                 'page': page,
                 'page_size': page_size,
-                'items': items
+                'items': items,
+                'next_cursor': next_cursor
             }
+            result['version'] = _feed_version(cache_key, result)
+            self.cache.put(cache_key, result, cache_version)
+            
+            return result
             
         except Exception as e:
             logger.error(f"Failed to get library feed: {str(e)}", exc_info=True)
@@ -94,165 +169,206 @@ class LibraryService:
                 'total': 0,
                 'page': page,
                 'page_size': page_size,
-                'items': []
+                'items': [],
+                'next_cursor': None
+            }
+    
+    async def get_facets(self, site_id: Optional[str] = None) -> Dict:
+        """
+        라이브러리 집계 조회 (전체/카드뉴스 개수, 사이트별, 월별)
+        
+        사전 집계 카운터 문서 1개를 읽습니다. 카운터가 아직 없으면
+        count 집계로 전체 개수만 반환합니다.
+        
+        Args:
+            site_id: 특정 사이트만 집계 (None이면 전체 + 사이트별)
+            
+        Returns:
+            {
+                'total': int,
+                'cardnews': int | None,
+                'sites': List[{'key', 'items', 'cardnews'}],
+                'months': List[{'key', 'items', 'cardnews'}],
+                'precomputed': bool
             }
+        """
+        cache_key = (site_id, 'facets')
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        cache_version = self.cache.version()
+        stats = await get_library_stats(site_id)
+        
+        if stats is None:
+            result = {
+                'total': await count_library_items(site_id=site_id),
+                'cardnews': None,
+                'sites': [],
+                'months': [],
+                'precomputed': False
+            }
+        else:
+            result = {
+                'total': stats.get('items', 0),
+                'cardnews': stats.get('cardnews', 0),
+                'sites': _facet_counts(stats.get('sites')),
+                'months': _facet_counts(stats.get('months')),
+                'precomputed': True
+            }
+        
+        self.cache.put(cache_key, result, cache_version)
+        return result
     
-    def _get_projects_feed(
+    async def _count(
         self,
         site_id: Optional[str],
         start_date: Optional[datetime],
-        end_date: Optional[datetime]
-    ) -> List[Dict]:
-        """Firestore에서 RSS 프로젝트 조회"""
-        try:
-            # Firestore 쿼리 (source_type='rss')
-            all_projects = get_all_projects(limit=1000)
-            
-            # RSS 타입만 필터링
-            projects = [p for p in all_projects if p.get('source_type') == 'rss']
-            
-            # 사이트 필터링
-            if site_id:
-                projects = [p for p in projects if p.get('source_site_id') == site_id]
-            
-            # FeedItem 형식으로 변환
-            feed_items = []
-            for project in projects:
-                published_at = project.get('original_published_at') or project.get('created_at')
-                
-                # 날짜 필터링
-                if start_date and published_at and published_at < start_date:
-                    continue
-                if end_date and published_at and published_at > end_date:
-                    continue
-                
-                feed_items.append({
-                    'id': project['id'],
-                    'type': 'project',
-                    'title': project.get('title') or 'Untitled',
-                    'source': {
-                        'site_id': project.get('source_site_id'),
-                        'site_name': project.get('source_site_name') or 'Unknown',
-                        'site_url': project.get('source_url') or ''
-                    },
-                    'keywords': project.get('keywords') or [],
-                    'summary': project.get('summary') or '',
-                    'published_at': published_at,
-                    'url': project.get('source_url') or '',
-                    'has_cardnews': True,
-                    'project_id': project['id'],
-                    'status': project.get('status', 'draft'),
-                    'is_new': self._is_new(project.get('created_at'))
-                })
-            
-            return feed_items
-            
-        except Exception as e:
-            logger.error(f"Failed to get projects feed: {str(e)}")
-            return []
+        end_date: Optional[datetime],
+        year_month: Optional[str],
+        since: Optional[datetime],
+        until: Optional[datetime]
+    ) -> int:
+        """피드 전체 개수 (카운터는 사이트/월 단위이므로 임의 날짜 범위는 count 집계)"""
+        if not (start_date or end_date):
+            counts = _library_stats_view(await get_library_stats(site_id), year_month)
+            if counts is not None:
+                return counts['items']
+        
+        return await count_library_items(site_id=site_id, since=since, until=until)
     
-    def _get_rss_posts_from_db(
+    async def _search_feed(
         self,
         site_id: Optional[str],
         start_date: Optional[datetime],
         end_date: Optional[datetime],
-        year_month: Optional[str]
-    ) -> List[Dict]:
-        """DB에 저장된 RSS 게시물 조회"""
-        try:
-            logger.info(f"Fetching RSS posts from Firestore (site_id={site_id}, year_month={year_month})")
-            
-            # Firestore에서 RSS 게시물 조회 (limit=500으로 제한)
-            rss_posts = get_all_rss_posts(
+        keyword: str,
+        year_month: Optional[str],
+        page: int,
+        page_size: int,
+        after: Optional[Dict]
+    ) -> Dict:
+        """
+        역색인 키워드 검색 (관련도순)
+        
+        전체 코퍼스에서 일치 항목을 찾고, 현재 페이지의 항목만 Firestore에서 읽습니다.
+        커서는 결과 목록의 offset입니다.
+        """
+        hits = self.search_index.search(
+            keyword,
+            site_id=site_id,
+            start_date=start_date,
+            end_date=end_date,
+            year_month=year_month
+        )
+        
+        if after is not None:
+            offset = int(after.get('offset', 0))
+        else:
+            offset = (page - 1) * page_size
+        
+        page_keys = [key for key, _ in hits[offset:offset + page_size]]
+        docs = await get_library_items(page_keys)
+        items = [self._to_feed_item(doc) for doc in docs]
+        
+        next_offset = offset + page_size
+        next_cursor = _encode_cursor({'offset': next_offset}) if next_offset < len(hits) else None
+        
+        logger.info(f"Library search '{keyword}': {len(hits)} hits, page {len(items)} items")
+        
+        return {
+            'total': len(hits),
+            'page': page,
+            'page_size': page_size,
+            'items': items,
+            'next_cursor': next_cursor
+        }
+    
+    async def _item_stream(
+        self,
+        site_id: Optional[str],
+        after: Optional[Dict],
+        since: Optional[datetime],
+        until: Optional[datetime],
+        batch_size: int
+    ) -> AsyncIterator[Dict]:
+        """published_at 범위 [since, until)의 라이브러리 항목을 키셋 순서대로 batch_size씩 읽어 FeedItem으로 변환"""
+        while True:
+            batch = await get_library_items_batch(
                 site_id=site_id,
-                start_date=start_date,
-                end_date=end_date,
-                year_month=year_month,
-                limit=500  # 성능 향상을 위해 500개로 제한
+                after=after,
+                limit=batch_size,
+                since=since,
+                until=until
             )
             
-            logger.info(f"Successfully fetched {len(rss_posts)} RSS posts from Firestore")
+            for doc in batch:
+                yield self._to_feed_item(doc)
             
-            # FeedItem 형식으로 변환
-            feed_items = []
-            for post in rss_posts:
-                feed_items.append({
-                    'id': post['id'],
-                    'type': 'rss_post',
-                    'title': post['title'],
-                    'title_original': post.get('title_original'),  # 원본 제목
-                    'source': {
-                        'site_id': post['site_id'],
-                        'site_name': post['site_name'],
-                        'site_url': ''
-                    },
-                    'keywords': post.get('keywords', []),  # DB에 저장된 키워드
-                    'summary': post.get('summary', ''),  # 전체 요약 표시
-                    'published_at': post['published_at'],
-                    'url': post['url'],
-                    'has_cardnews': post.get('has_cardnews', False),
-                    'project_id': post.get('project_id'),
-                    'status': None,
-                    'is_new': self._is_new(post.get('crawled_at'))
-                })
+            if len(batch) < batch_size:
+                return
             
-            return feed_items
-            
-        except Exception as e:
-            logger.error(f"Failed to get RSS posts from DB: {str(e)}")
-            return []
+            after = {'published_at': batch[-1].get('published_at'), 'key': batch[-1]['key']}
     
-    def _merge_feeds(
-        self,
-        projects: List[Dict],
-        rss_posts: List[Dict]
-    ) -> List[Dict]:
-        """두 피드를 병합하고 중복 제거"""
-        # URL 기반으로 중복 제거
-        seen_urls = set()
-        merged = []
+    def _to_feed_item(self, doc: Dict) -> Dict:
+        """
+        라이브러리 항목을 FeedItem 형식으로 변환
         
-        # 프로젝트 우선 (이미 생성된 것)
-        for item in projects:
-            url = item['url']
-            if url and url not in seen_urls:
-                merged.append(item)
-                seen_urls.add(url)
+        프로젝트 정보가 있으면 프로젝트로, 없으면 RSS 게시물로 표시합니다.
+        ('key'는 커서 생성용 내부 필드)
+        """
+        post = doc.get('post') or {}
+        project = doc.get('project')
         
-        # RSS 게시물 추가 (프로젝트에 없는 것만)
-        for item in rss_posts:
-            url = item['url']
-            if url and url not in seen_urls:
-                merged.append(item)
-                seen_urls.add(url)
+        if project:
+            return {
+                'key': doc['key'],
+                'id': project['id'],
+                'type': 'project',
+                'title': project.get('title') or post.get('title') or 'Untitled',
+                'title_original': post.get('title_original'),
+                'source': {
+                    'site_id': doc.get('site_id'),
+                    'site_name': project.get('site_name') or post.get('site_name') or 'Unknown',
+                    'site_url': project.get('site_url') or ''
+                },
+                'keywords': project.get('keywords') or [],
+                'summary': project.get('summary') or '',
+                'published_at': doc.get('published_at'),
+                'url': doc.get('url') or '',
+                'has_cardnews': True,
+                'project_id': project['id'],
+                'status': project.get('status') or 'draft',
+                'is_new': self._is_new(project.get('created_at'))
+            }
         
-        return merged
+        return {
+            'key': doc['key'],
+            'id': post.get('id') or doc['key'],
+            'type': 'rss_post',
+            'title': post.get('title') or 'Untitled',
+            'title_original': post.get('title_original'),  # 원본 제목
+            'source': {
+                'site_id': doc.get('site_id'),
+                'site_name': post.get('site_name') or 'Unknown',
+                'site_url': ''
+            },
+            'keywords': post.get('keywords') or [],  # DB에 저장된 키워드
+            'summary': post.get('summary') or '',  # 전체 요약 표시
+            'published_at': doc.get('published_at'),
+            'url': doc.get('url') or '',
+            'has_cardnews': False,
+            'project_id': None,
+            'status': None,
+            'is_new': self._is_new(post.get('crawled_at'))
+        }
     
-    def _apply_filters(
-        self,
-        items: List[Dict],
-        keyword: Optional[str],
-        start_date: Optional[datetime],
-        end_date: Optional[datetime]
-    ) -> List[Dict]:
-        """필터 적용"""
-        filtered = items
-        
-        # 키워드 필터
-        if keyword:
-            keyword_lower = keyword.lower()
-            filtered = []
-            
-            for item in items:
-                # 제목, 요약, 키워드에서 검색
-                if (keyword_lower in item['title'].lower() or
-                    keyword_lower in item['summary'].lower() or
-                    any(keyword_lower in k.lower() for k in item['keywords'])):
-                    filtered.append(item)
-        
-        # 날짜 필터는 이미 _get_projects_feed에서 적용됨
-        
-        return filtered
+    def _matches_keyword(self, item: Dict, keyword: str) -> bool:
+        """키워드 필터 (제목, 요약, 키워드에서 검색)"""
+        keyword_lower = keyword.lower()
+        return (keyword_lower in item['title'].lower() or
+                keyword_lower in item['summary'].lower() or
+                any(keyword_lower in k.lower() for k in item['keywords']))
     
     def _is_new(self, published_at: Optional[datetime]) -> bool:
         """24시간 이내 게시물인지 확인"""
@@ -271,6 +387,134 @@ class LibraryService:
         return hashlib.md5(url.encode()).hexdigest()
 
 
+def _feed_version(cache_key: tuple, result: Dict) -> str:
+    """
+    피드 결과 버전 (필터 + 결과 내용 해시)
+    
+    캐시에 저장할 때 한 번만 계산하므로 캐시 적중 요청은 ETag 비교만 합니다.
+    내용 기준이라 같은 결과면 프로세스가 달라도 같은 버전입니다.
+    """
+    payload = json.dumps([repr(cache_key), result], default=str, sort_keys=True, ensure_ascii=False)
+    return hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """naive datetime을 UTC로 간주하여 timezone-aware로 변환 (Firestore 값과 비교용)"""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _facet_counts(counters: Optional[Dict]) -> list:
+    """{key: {items, cardnews}} → 0이 아닌 항목만 key 내림차순 리스트"""
+    return [
+        {'key': key, 'items': counts.get('items', 0), 'cardnews': counts.get('cardnews', 0)}
+        for key, counts in sorted((counters or {}).items(), reverse=True)
+        if counts.get('items')
+    ]
+
+
+# 검색 색인 백그라운드 작업 (로드/재구축 후 주기적 저장)
+_indexer_task: Optional[asyncio.Task] = None
+
+# 스냅샷 보정 시 저장 시각보다 앞당겨 다시 읽는 여유 (프로세스 간 시계 차이, 저장 직전 쓰기)
+SEARCH_INDEX_RECONCILE_SKEW = timedelta(minutes=5)
+
+
+async def _reconcile_search_index(index) -> bool:
+    """
+    로드한 스냅샷을 library_items와 맞춤
+    
+    스냅샷 저장 이후(API 중지 중 워커 쓰기, 저장 전 종료 등) 변경된 항목을 다시 읽어 반영하고,
+    항목 수가 다르면 (삭제된 항목 등) False를 반환하여 전체 재구축하게 합니다.
+    
+    Returns:
+        보정 성공 여부
+    """
+    if index.saved_at is None:
+        return False
+    
+    changed = await get_library_items_updated_since(index.saved_at - SEARCH_INDEX_RECONCILE_SKEW)
+    for item in changed:
+        index.put(item)
+    
+    total = await count_library_items()
+    documents = index.stats()['documents']
+    if total != documents:
+        logger.info(f"Search index snapshot out of date ({documents} documents, {total} items), rebuilding")
+        return False
+    
+    logger.info(f"Search index reconciled: {len(changed)} items updated since snapshot")
+    return True
+
+
+async def _load_search_index():
+    """디스크에서 색인 로드 후 보정, 없거나 맞지 않으면 library_items 전체로 재구축"""
+    index = get_search_index()
+    
+    if await asyncio.to_thread(index.load) and await _reconcile_search_index(index):
+        await asyncio.to_thread(index.save_if_dirty)
+        return
+    
+    items = await get_all_library_items()
+    await asyncio.to_thread(index.rebuild, items)
+    await asyncio.to_thread(index.save_if_dirty)
+
+
+async def _indexer_loop(interval: int):
+    """색인 준비 후 변경분을 주기적으로 디스크에 저장"""
+    try:
+        await _load_search_index()
+        # 색인 준비 전 스캔으로 캐시된 키워드 검색 결과 삭제
+        invalidate_library_cache()
+    except Exception as e:
+        logger.error(f"Search index load failed: {str(e)}", exc_info=True)
+    
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(get_search_index().save_if_dirty)
+        except Exception as e:
+            logger.error(f"Search index save failed: {str(e)}")
+
+
+def start_search_indexer(interval: Optional[int] = None):
+    """
+    검색 색인 백그라운드 작업 시작 (앱 시작 시 호출)
+    
+    Args:
+        interval: 저장 주기 (초, 기본값: 설정값)
+    """
+    global _indexer_task
+    
+    if _indexer_task and not _indexer_task.done():
+        return
+    
+    interval = interval or settings.SEARCH_INDEX_SAVE_INTERVAL
+    _indexer_task = asyncio.get_running_loop().create_task(_indexer_loop(interval))
+    logger.info(f"Search indexer started (save every {interval}s)")
+
+
+async def stop_search_indexer():
+    """검색 색인 백그라운드 작업 중지 및 마지막 저장 (앱 종료 시 호출)"""
+    global _indexer_task
+    
+    if _indexer_task:
+        _indexer_task.cancel()
+        try:
+            await _indexer_task
+        except asyncio.CancelledError:
+            pass
+        _indexer_task = None
+    
+    try:
+        get_search_index().save_if_dirty()
+    except Exception as e:
+        logger.error(f"Search index save failed: {str(e)}")
+    
+    logger.info("Search indexer stopped")
+
+
 # 싱글톤 인스턴스
 _library_service: Optional[LibraryService] = None
 
@@ -0,0 +1,333 @@
+"""
+LLM 호출 텔레메트리 - 토큰, 지연시간, 비용을 호출 지점별로 집계
+"""
+
+from typing import Dict, List, Optional, Tuple
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# 지연시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS: Tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 토큰 수 히스토그램 버킷
+TOKEN_BUCKETS: Tuple[float, ...] = (50, 100, 250, 500, 1000, 2000, 4000, 8000)
+
+# 모델별 단가 (USD / 1M tokens) - (prompt, completion)
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    'gpt-4.1-nano': (0.10, 0.40),
+    'gpt-4.1-mini': (0.40, 1.60),
+    'gpt-4o-mini': (0.15, 0.60),
+    'gpt-5-nano': (0.05, 0.40),
+    'gpt-5-mini': (0.25, 2.00),
+}
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus 호환)"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._samples: List[float] = []  # 백분위 계산용 (최근 N개)
+
+    def observe(self, value: float):
+        """값 기록"""
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+        self._samples.append(value)
+        if len(self._samples) > 1000:
+            self._samples = self._samples[-1000:]
+
+    def percentile(self, p: float) -> Optional[float]:
+        """최근 샘플 기준 백분위 값"""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        idx = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+        return ordered[idx]
+
+    def to_dict(self) -> Dict:
+        """JSON 직렬화용 딕셔너리"""
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'buckets': {str(b): c for b, c in zip(self.buckets, self.counts)},
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99)
+        }
+
+
+class CallSiteStats:
+    """호출 지점 + 모델 + 결과 단위 통계"""
+
+    def __init__(self):
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost_usd = 0.0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.total_tokens = Histogram(TOKEN_BUCKETS)
+
+
+class LLMTelemetry:
+    """LLM 호출 지표 저장소 (프로세스 내)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str, str], CallSiteStats] = {}  # (call_site, model, outcome) -> stats
+        self.started_at = time.time()
+
+    def record(
+        self,
+        call_site: str,
+        model: str,
+        outcome: str,
+        latency_seconds: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0
+    ):
+        """
+        LLM 호출 1건 기록
+
+        Args:
+            call_site: 호출 지점 (예: 'summarizer.summary')
+            model: 모델 이름
+            outcome: 'success' 또는 에러 타입 이름
+            latency_seconds: 응답 지연시간 (초)
+            prompt_tokens: 프롬프트 토큰 수
+            completion_tokens: 응답 토큰 수
+        """
+        cost = estimate_cost(model, prompt_tokens, completion_tokens)
+        key = (call_site, model, outcome)
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = CallSiteStats()
+                self._stats[key] = stats
+
+            stats.calls += 1
+            stats.prompt_tokens += prompt_tokens
+            stats.completion_tokens += completion_tokens
+            stats.cost_usd += cost
+            stats.latency.observe(latency_seconds)
+            if outcome == 'success':
+                stats.total_tokens.observe(prompt_tokens + completion_tokens)
+
+    def snapshot(self) -> Dict:
+        """
+        현재 지표 스냅샷
+
+        Returns:
+            {
+                'uptime_seconds': float,
+                'totals': {...},
+                'call_sites': List[Dict]
+            }
+        """
+        with self._lock:
+            call_sites = []
+            totals = {
+                'calls': 0,
+                'errors': 0,
+                'prompt_tokens': 0,
+                'completion_tokens': 0,
+                'cost_usd': 0.0
+            }
+
+            for (call_site, model, outcome), stats in sorted(self._stats.items()):
+                call_sites.append({
+                    'call_site': call_site,
+                    'model': model,
+                    'outcome': outcome,
+                    'calls': stats.calls,
+                    'prompt_tokens': stats.prompt_tokens,
+                    'completion_tokens': stats.completion_tokens,
+                    'cost_usd': round(stats.cost_usd, 6),
+                    'latency_seconds': stats.latency.to_dict(),
+                    'total_tokens': stats.total_tokens.to_dict()
+                })
+
+                totals['calls'] += stats.calls
+                if outcome != 'success':
+                    totals['errors'] += stats.calls
+                totals['prompt_tokens'] += stats.prompt_tokens
+                totals['completion_tokens'] += stats.completion_tokens
+                totals['cost_usd'] += stats.cost_usd
+
+            totals['cost_usd'] = round(totals['cost_usd'], 6)
+
+            return {
+                'uptime_seconds': round(time.time() - self.started_at, 1),
+                'totals': totals,
+                'call_sites': call_sites
+            }
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition 형식으로 변환"""
+        lines = [
+            '# HELP llm_calls_total Total LLM chat completion calls',
+            '# TYPE llm_calls_total counter',
+        ]
+
+        with self._lock:
+            items = sorted(self._stats.items())
+
+            for (call_site, model, outcome), stats in items:
+                labels = _labels(call_site=call_site, model=model, outcome=outcome)
+                lines.append(f'llm_calls_total{{{labels}}} {stats.calls}')
+
+            lines += [
+                '# HELP llm_tokens_total Tokens consumed by LLM calls',
+                '# TYPE llm_tokens_total counter',
+            ]
+            for (call_site, model, outcome), stats in items:
+                for kind, value in (('prompt', stats.prompt_tokens), ('completion', stats.completion_tokens)):
+                    labels = _labels(call_site=call_site, model=model, outcome=outcome, kind=kind)
+                    lines.append(f'llm_tokens_total{{{labels}}} {value}')
+
+            lines += [
+                '# HELP llm_cost_usd_total Estimated LLM cost in USD',
+                '# TYPE llm_cost_usd_total counter',
+            ]
+            for (call_site, model, outcome), stats in items:
+                labels = _labels(call_site=call_site, model=model, outcome=outcome)
+                lines.append(f'llm_cost_usd_total{{{labels}}} {stats.cost_usd:.6f}')
+
+            lines += [
+                '# HELP llm_latency_seconds LLM call latency',
+                '# TYPE llm_latency_seconds histogram',
+            ]
+            for (call_site, model, outcome), stats in items:
+                lines += _histogram_lines(
+                    'llm_latency_seconds', stats.latency,
+                    call_site=call_site, model=model, outcome=outcome
+                )
+
+            lines += [
+                '# HELP llm_call_tokens LLM tokens per successful call',
+                '# TYPE llm_call_tokens histogram',
+            ]
+            for (call_site, model, outcome), stats in items:
+                if outcome != 'success':
+                    continue
+                lines += _histogram_lines(
+                    'llm_call_tokens', stats.total_tokens,
+                    call_site=call_site, model=model
+                )
+
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        """모든 지표 초기화 (테스트/벤치마크용)"""
+        with self._lock:
+            self._stats.clear()
+            self.started_at = time.time()
+
+
+def _labels(**labels) -> str:
+    """Prometheus 라벨 문자열 생성"""
+    parts = []
+    for key, value in labels.items():
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{key}="{escaped}"')
+    return ','.join(parts)
+
+
+def _histogram_lines(name: str, histogram: Histogram, **labels) -> List[str]:
+    """히스토그램을 Prometheus 라인으로 변환"""
+    lines = []
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        lines.append(f'{name}_bucket{{{_labels(**labels, le=bound)}}} {count}')
+    lines.append(f'{name}_bucket{{{_labels(**labels, le="+Inf")}}} {histogram.count}')
+    lines.append(f'{name}_sum{{{_labels(**labels)}}} {histogram.sum:.6f}')
+    lines.append(f'{name}_count{{{_labels(**labels)}}} {histogram.count}')
+    return lines
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """
+    모델 단가표 기반 비용 추정 (USD)
+
+    Args:
+        model: 모델 이름
+        prompt_tokens: 프롬프트 토큰 수
+        completion_tokens: 응답 토큰 수
+
+    Returns:
+        추정 비용 (단가 정보가 없으면 0)
+    """
+    pricing = MODEL_PRICING.get(model)
+    if pricing is None:
+        # 날짜 접미사가 붙은 모델명 처리 (예: gpt-4.1-nano-2025-04-14)
+        for name, price in MODEL_PRICING.items():
+            if model and model.startswith(name):
+                pricing = price
+                break
+
+    if pricing is None:
+        return 0.0
+
+    prompt_price, completion_price = pricing
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+def tracked_completion(client, call_site: str, **kwargs):
+    """
+    chat.completions.create 호출 후 텔레메트리 기록
+
+    Args:
+        client: OpenAI 클라이언트
+        call_site: 호출 지점 이름
+        **kwargs: chat.completions.create 인자
+
+    Returns:
+        OpenAI 응답 객체 (예외는 그대로 전파)
+    """
+    model = kwargs.get('model', 'unknown')
+    started = time.perf_counter()
+
+    try:
+        response = client.chat.completions.create(**kwargs)
+    except Exception as e:
+        get_telemetry().record(
+            call_site=call_site,
+            model=model,
+            outcome=type(e).__name__,
+            latency_seconds=time.perf_counter() - started
+        )
+        raise
+
+    latency = time.perf_counter() - started
+    usage = getattr(response, 'usage', None)
+
+    get_telemetry().record(
+        call_site=call_site,
+        model=model,
+        outcome='success',
+        latency_seconds=latency,
+        prompt_tokens=getattr(usage, 'prompt_tokens', 0) or 0,
+        completion_tokens=getattr(usage, 'completion_tokens', 0) or 0
+    )
+
+    return response
+
+
+# 전역 텔레메트리 인스턴스
+_telemetry = LLMTelemetry()
+
+
+def get_telemetry() -> LLMTelemetry:
+    """전역 텔레메트리 인스턴스 가져오기"""
+    return _telemetry
@@ -4,29 +4,38 @@ OpenAI API 상태 확인 서비스
 
 import openai
 from app.config import settings
+from app.utils.openai_client import create_openai_client
+from datetime import datetime, timezone
 from typing import Dict, Optional
+import asyncio
+import threading
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
 # OpenAI 클라이언트 초기화
-client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+client = create_openai_client()
+
+# 마지막 상태 확인 결과 캐시
+_status_cache: Optional[Dict] = None
+_status_checked_monotonic: float = 0.0
+_status_lock = threading.Lock()
+_prober_task: Optional[asyncio.Task] = None
 
 
 def check_api_status() -> Dict:
     """
     OpenAI API 연결 상태 확인
     
+    과금되지 않는 모델 목록 조회로 연결 및 인증을 확인합니다.
+    
     Returns:
         상태 정보 딕셔너리
     """
     try:
-        # 간단한 API 호출로 연결 테스트
-        response = client.chat.completions.create(
-            model=settings.OPENAI_MODEL,
-            messages=[{"role": "user", "content": "test"}],
-            max_tokens=5
-        )
+        # 모델 목록 조회로 연결 테스트 (토큰 소모 없음)
+        client.models.list()
         
         return {
             "connected": True,
@@ -61,6 +70,102 @@ def check_api_status() -> Dict:
         }
 
 
+def refresh_api_status() -> Dict:
+    """
+    상태를 새로 확인하고 캐시에 저장
+    
+    Returns:
+        확인 시각이 포함된 상태 정보
+    """
+    global _status_cache, _status_checked_monotonic
+    
+    status = check_api_status()
+    status['checked_at'] = datetime.now(timezone.utc).isoformat()
+    
+    with _status_lock:
+        _status_cache = status
+        _status_checked_monotonic = time.monotonic()
+    
+    return status
+
+
+def get_cached_api_status() -> Optional[Dict]:
+    """
+    캐시된 상태 조회 (API 호출 없음)
+    
+    Returns:
+        상태 정보 (cache_age_seconds 포함) 또는 None (아직 확인 전)
+    """
+    with _status_lock:
+        if _status_cache is None:
+            return None
+        status = dict(_status_cache)
+        status['cache_age_seconds'] = round(time.monotonic() - _status_checked_monotonic, 3)
+    
+    return status
+
+
+async def get_api_status(force_refresh: bool = False) -> Dict:
+    """
+    상태 조회 (캐시 우선)
+    
+    Args:
+        force_refresh: True면 캐시를 무시하고 즉시 재확인
+        
+    Returns:
+        상태 정보
+    """
+    if not force_refresh:
+        cached = get_cached_api_status()
+        if cached is not None:
+            return cached
+    
+    # 이벤트 루프를 막지 않도록 스레드에서 실행
+    await asyncio.to_thread(refresh_api_status)
+    return get_cached_api_status()
+
+
+async def _prober_loop(interval: int):
+    """주기적으로 상태를 갱신하는 백그라운드 루프"""
+    while True:
+        try:
+            await asyncio.to_thread(refresh_api_status)
+        except Exception as e:
+            logger.error(f"OpenAI status probe failed: {str(e)}")
+        await asyncio.sleep(interval)
+
+
+def start_status_prober(interval: Optional[int] = None):
+    """
+    백그라운드 상태 확인 시작 (앱 시작 시 호출)
+    
+    Args:
+        interval: 갱신 주기 (초, 기본값: 설정값)
+    """
+    global _prober_task
+    
+    if _prober_task and not _prober_task.done():
+        return
+    
+    interval = interval or settings.OPENAI_STATUS_PROBE_INTERVAL
+    _prober_task = asyncio.get_running_loop().create_task(_prober_loop(interval))
+    logger.info(f"OpenAI status prober started (every {interval}s)")
+
+
+async def stop_status_prober():
+    """백그라운드 상태 확인 중지 (앱 종료 시 호출)"""
+    global _prober_task
+    
+    if _prober_task:
+        _prober_task.cancel()
+        try:
+            await _prober_task
+        except asyncio.CancelledError:
+            pass
+        _prober_task = None
+        logger.info("OpenAI status prober stopped")
+
+
 def get_usage_info() -> Optional[Dict]:
     """
     OpenAI API 사용량 정보 조회
@@ -69,10 +174,16 @@ def get_usage_info() -> Optional[Dict]:
     실제 크레딧은 OpenAI 대시보드에서 확인해야 합니다.
     
     Returns:
-        사용량 정보 (현재는 모의 데이터)
+        사용량 정보 (프로세스 시작 이후 LLM 호출 집계 포함)
     """
+    from app.services.llm_telemetry import get_telemetry
+    
+    snapshot = get_telemetry().snapshot()
+    
     return {
         "note": "크레딧 정보는 OpenAI 대시보드에서 확인하세요",
-        "dashboard_url": "https://platform.openai.com/usage"
+        "dashboard_url": "https://platform.openai.com/usage",
+        "since_startup": snapshot['totals'],
+        "uptime_seconds": snapshot['uptime_seconds']
     }
 
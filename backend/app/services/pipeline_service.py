@@ -1,13 +1,19 @@
 """자동 생성 파이프라인 - RSS 게시물 → 카드뉴스 자동 생성"""
 
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 import logging
 from datetime import datetime
 
 from app.services.scraper import WebScraper
 from app.services.summarizer import AISummarizer
 from app.services.card_generator import CardNewsGenerator
-from app.utils.firebase import create_project, create_sections, update_project
+from app.utils.firebase import (
+    create_project,
+    create_sections,
+    update_project,
+    update_rss_post_project_link,
+    _rss_post_id
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +31,8 @@ class AutoGenerationPipeline:
         self,
         post: Dict,
         site_id: str,
-        site_name: str
+        site_name: str,
+        on_progress: Optional[Callable[[str, str], None]] = None
     ) -> Optional[str]:
         """
         RSS 게시물로부터 카드뉴스 자동 생성
@@ -42,15 +49,19 @@ class AutoGenerationPipeline:
                 }
             site_id: 사이트 ID
             site_name: 사이트 이름
+            on_progress: 단계 시작 시 호출 (단계 이름, 메시지)
             
         Returns:
             생성된 프로젝트 ID 또는 None (실패 시)
         """
+        report = on_progress or (lambda step, message: None)
+        
         try:
             logger.info(f"Starting auto-generation pipeline for post: {post['title']}")
             
             # Step 1: URL 스크래핑
             logger.info(f"Step 1/4: Scraping URL: {post['link']}")
+            report('scrape', '원문 스크래핑 중')
             try:
                 scraped_data = self.scraper.scrape_url(post['link'])
                 content = scraped_data.get('main_content', '') or scraped_data.get('content', '')
@@ -68,6 +79,7 @@ class AutoGenerationPipeline:
             
             # Step 2: 프로젝트 생성 (모든 피드 보존)
             logger.info("Step 2/4: Creating project")
+            report('create_project', '프로젝트 생성 중')
             
             # 내용 길이에 관계없이 프로젝트 생성 (최소 10자 이상만)
             if len(content.strip()) < 10:
@@ -92,6 +104,13 @@ class AutoGenerationPipeline:
             project_id = project['id']
             logger.info(f"Project created: {project_id}")
             
+            # 원본 RSS 게시물 연결 (라이브러리 피드에서 프로젝트로 표시)
+            if post.get('link'):
+                try:
+                    update_rss_post_project_link(_rss_post_id(post['link']), project_id)
+                except Exception as e:
+                    logger.warning(f"Failed to link RSS post to project {project_id}: {str(e)}")
+            
             # 내용이 너무 짧으면 요약/생성 스킵하고 draft로 유지
             if len(content.strip()) < 200:
                 logger.warning(f"Content too short ({len(content)} chars), keeping as draft for manual review")
@@ -99,11 +118,12 @@ class AutoGenerationPipeline:
                     'status': 'draft',
                     'summary': f"⚠️ 내용이 짧아 자동 생성을 건너뛰었습니다. ({len(content)}자)\n\n수동으로 완성해주세요.",
                     'last_error': f'Content too short: {len(content)} chars'
-                })
+                }, current=project)
                 return project_id  # draft 상태로 유지
             
             # Step 3: AI 요약 생성
             logger.info("Step 3/4: Generating summary")
+            report('summarize', 'AI 요약 생성 중')
             try:
                 summary_result = self.summarizer.summarize(content, max_length=200)
                 
@@ -113,7 +133,7 @@ class AutoGenerationPipeline:
                     'keywords': summary_result['keywords'],
                     'recommended_card_count': summary_result['card_count'],
                     'status': 'summarized'
-                })
+                }, current=project)
                 logger.info(f"Summary generated: {len(summary_result['summary'])} chars")
                 
             except Exception as e:
@@ -123,12 +143,13 @@ class AutoGenerationPipeline:
                     'status': 'draft',
                     'summary': f"⚠️ 요약 생성에 실패했습니다.\n\n오류: {str(e)}\n\n수동으로 완성해주세요.",
                     'last_error': f'Summary generation failed: {str(e)}'
-                })
+                }, current=project)
                 logger.warning(f"Summary failed, keeping project {project_id} as draft")
                 return project_id  # draft 상태로 유지
             
             # Step 4: 카드뉴스 생성
             logger.info("Step 4/4: Generating card news sections")
+            report('generate_sections', '카드뉴스 섹션 생성 중')
             try:
                 sections = self.card_generator.generate_sections(
                     summary=summary_result['summary'],
@@ -143,7 +164,7 @@ class AutoGenerationPipeline:
                 update_project(project_id, {
                     'status': 'completed',
                     'last_error': None  # 에러 초기화
-                })
+                }, current=project)
                 
                 logger.info(f"✅ Auto-generation completed: {project_id} ({len(sections)} sections)")
                 return project_id
@@ -155,7 +176,7 @@ class AutoGenerationPipeline:
                 update_project(project_id, {
                     'status': 'summarized',
                     'last_error': f'Card generation failed: {str(e)}'
-                })
+                }, current=project)
                 logger.warning(f"Card generation failed, keeping project {project_id} as summarized (요약까지 완료)")
                 return project_id  # summarized 상태로 유지
             
@@ -0,0 +1,180 @@
+"""
+프로젝트 생성 서비스
+
+POST /api/projects와 프로젝트 생성 작업(/api/jobs)이 함께 사용합니다.
+URL 소스는 동시에 스크래핑하여 출처별 구분선과 함께 하나의 원문으로 합치고,
+요약/카드 생성 시 split_sources로 다시 출처별로 나눠 모든 출처를 반영합니다.
+"""
+
+from typing import Awaitable, Callable, Dict, List, Optional
+import asyncio
+import logging
+import re
+
+from app.config import settings
+from app.models.project import ProjectCreate
+from app.services.scraper import WebScraper
+from app.utils import firebase_async as firebase
+
+logger = logging.getLogger(__name__)
+
+# 스크래핑 진행 콜백: (완료 수, 전체 수, URL, 성공 여부)
+ScrapeProgress = Callable[[int, int, str, bool], Awaitable[None]]
+
+scraper = WebScraper()
+
+# join_sources 형식 (split_sources에서 출처별로 다시 분리)
+_SOURCE_SEPARATOR = "\n\n" + "=" * 60 + "\n\n"
+_SOURCE_SPLIT = re.compile(r"\n\n={60}\n\n(?=━━━ 출처 \d+: )")
+_SOURCES_HEADER = re.compile(r"📚 총 \d+개의 소스에서 수집된 내용\n={60}\n\n")
+_SOURCE_BLOCK = re.compile(
+    r"━━━ 출처 (?P<index>\d+): (?P<title>.*) ━━━\nURL: (?P<url>.*)\n━+\n\n(?P<content>.*)",
+    re.DOTALL
+)
+
+
+def parse_source_urls(source_content: str) -> List[str]:
+    """줄바꿈으로 구분된 URL 목록"""
+    return [url.strip() for url in source_content.split('\n') if url.strip()]
+
+
+async def scrape_sources(urls: List[str], on_progress: Optional[ScrapeProgress] = None) -> List[Dict]:
+    """
+    URL 동시 스크래핑 (SCRAPE_MAX_CONCURRENT개씩, URL당 SCRAPE_TIMEOUT초 제한)
+    
+    실패하거나 시간을 넘긴 URL은 건너뜁니다. 동기 스크래퍼는 스레드에서 실행하며,
+    제한 시간은 스크래퍼의 HTTP 요청 timeout으로 적용되므로 시간을 넘긴 스레드도 함께 끝납니다.
+    전체 소요 시간은 가장 느린 URL 기준입니다.
+    
+    Returns:
+        [{'index', 'url', 'title', 'content'}] (입력 순서)
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.SCRAPE_MAX_CONCURRENT))
+    total = len(urls)
+    finished = 0
+    
+    async def scrape(idx: int, url: str) -> Optional[Dict]:
+        nonlocal finished
+        
+        async with semaphore:
+            try:
+                logger.info(f"Scraping [{idx}/{total}]: {url}")
+                scraped_data = await asyncio.to_thread(scraper.scrape_url, url, settings.SCRAPE_TIMEOUT)
+                source = {
+                    'index': idx,
+                    'url': url,
+                    'title': scraped_data['title'],
+                    'content': scraped_data['content']
+                }
+                logger.info(f"Successfully scraped [{idx}/{total}]: {scraped_data['title']}")
+            except TimeoutError:
+                logger.warning(f"Scraping timed out after {settings.SCRAPE_TIMEOUT}s [{idx}/{total}]: {url}")
+                source = None
+            except Exception as e:
+                logger.warning(f"Failed to scrape [{idx}/{total}] {url}: {str(e)}")
+                source = None
+        
+        # 진행 콜백은 완료 순서대로 (완료 수, 전체 수)
+        finished += 1
+        if on_progress:
+            await on_progress(finished, total, url, source is not None)
+        
+        return source
+    
+    results = await asyncio.gather(*(scrape(idx, url) for idx, url in enumerate(urls, 1)))
+    return [source for source in results if source]
+
+
+def join_sources(sources: List[Dict]) -> str:
+    """출처별 구분선과 함께 하나의 원문으로 합침"""
+    all_content = []
+    for source in sources:
+        # 출처와 내용을 명확히 구분
+        source_info = f"━━━ 출처 {source['index']}: {source['title']} ━━━\n"
+        source_info += f"URL: {source['url']}\n"
+        source_info += "━━━━━━━━━━━━━━━━━━━━\n\n"
+        source_info += source['content']
+        all_content.append(source_info)
+    
+    # 모든 내용을 합침 (명확한 구분선 사용)
+    content = _SOURCE_SEPARATOR.join(all_content)
+    
+    # 최종 정보 추가
+    header = f"📚 총 {len(all_content)}개의 소스에서 수집된 내용\n"
+    header += "=" * 60 + "\n\n"
+    return header + content
+
+
+def split_sources(content: str) -> List[Dict]:
+    """
+    join_sources로 합친 원문을 출처별로 분리
+    
+    Returns:
+        [{'index', 'url', 'title', 'content'}] (여러 URL로 만든 원문이 아니면 빈 목록)
+    """
+    match = _SOURCES_HEADER.match(content or '')
+    if not match:
+        return []
+    
+    sources = []
+    for block in _SOURCE_SPLIT.split(content[match.end():]):
+        source = _SOURCE_BLOCK.match(block)
+        if not source:
+            return []
+        sources.append({
+            'index': int(source.group('index')),
+            'url': source.group('url'),
+            'title': source.group('title'),
+            'content': source.group('content')
+        })
+    
+    return sources
+
+
+def source_excerpt(content: str, max_chars: int = 3000) -> str:
+    """
+    카드 생성용 원문 발췌 (여러 출처면 출처마다 같은 길이씩 잘라서 모든 출처 포함)
+    
+    Args:
+        content: 프로젝트 원문
+        max_chars: 발췌 최대 길이 (출처 구분선 포함)
+    """
+    sources = split_sources(content)
+    if len(sources) <= 1:
+        return content[:max_chars]
+    
+    # 출처 구분선을 뺀 길이를 출처마다 나눔
+    overhead = len(join_sources([{**source, 'content': ''} for source in sources]))
+    per_source = max(0, max_chars - overhead) // len(sources)
+    return join_sources([{**source, 'content': source['content'][:per_source]} for source in sources])
+
+
+async def create_project_from_request(project: ProjectCreate, on_progress: Optional[ScrapeProgress] = None) -> Dict:
+    """
+    프로젝트 생성 (URL 소스면 스크래핑 후 저장)
+    
+    Raises:
+        ValueError: 모든 URL 스크래핑 실패
+    """
+    if project.source_type == 'url':
+        # 여러 URL을 줄바꿈으로 구분하여 처리
+        urls = parse_source_urls(project.source_content)
+        logger.info(f"Scraping {len(urls)} URL(s)")
+        
+        sources = await scrape_sources(urls, on_progress)
+        if not sources:
+            raise ValueError("모든 URL 스크래핑에 실패했습니다")
+        
+        content = join_sources(sources)
+    else:
+        content = project.source_content
+    
+    project_data = await firebase.create_project({
+        'source_type': project.source_type,
+        'source_content': content,
+        'model': project.model,
+        'card_start_type': project.card_start_type
+    })
+    logger.info(f"Project saved: {project_data['id']} (model: {project.model})")
+    
+    return project_data
@@ -3,11 +3,33 @@
 from bs4 import BeautifulSoup
 import requests
 from newspaper import Article
-from typing import Dict
+from typing import Dict, Optional
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# 요청별 기본 제한 시간 (초, scrape_url에 timeout이 없을 때)
+ARTICLE_REQUEST_TIMEOUT = 7
+FALLBACK_REQUEST_TIMEOUT = 10
+LINKEDIN_REQUEST_TIMEOUT = 15
+
+
+def _request_timeout(deadline: Optional[float], default: float) -> float:
+    """
+    다음 HTTP 요청의 timeout (전체 마감까지 남은 시간, 기본값 이하)
+    
+    Raises:
+        TimeoutError: 마감 시간이 지남
+    """
+    if deadline is None:
+        return default
+    
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError("Scraping timed out")
+    return min(default, remaining)
+
 
 class WebScraper:
     """웹 페이지에서 본문 텍스트를 추출하는 서비스"""
@@ -17,12 +39,14 @@ class WebScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
     
-    def scrape_url(self, url: str) -> Dict[str, str]:
+    def scrape_url(self, url: str, timeout: Optional[float] = None) -> Dict[str, str]:
         """
         URL에서 제목과 본문을 추출
         
         Args:
             url: 스크래핑할 웹 페이지 URL
+            timeout: 전체 제한 시간 (초). 각 HTTP 요청에 남은 시간을 timeout으로 전달하므로
+                     시간을 넘기면 요청이 끊기고 TimeoutError (None이면 요청별 기본값)
             
         Returns:
             {
@@ -30,50 +54,41 @@ class WebScraper:
                 'content': str,
                 'authors': list,
                 'publish_date': str,
-                'top_image': str
-            }
+            
+        Raises:
+            TimeoutError: timeout 초과
         """
+        deadline = time.monotonic() + timeout if timeout else None
+        
         try:
             logger.info(f"Scraping URL: {url}")
             
             # LinkedIn 게시물인 경우 전용 스크래핑
             if 'linkedin.com/posts/' in url or 'linkedin.com/feed/update/' in url:
                 logger.info("Detected LinkedIn post, using specialized scraper")
-                return self._scrape_linkedin_post(url)
+                return self._scrape_linkedin_post(url, deadline)
             
             # newspaper3k 사용 (뉴스 기사에 최적화)
             # 언어 자동 감지 시도 (한국어 우선, 실패 시 영어)
             article = None
             content = ""
+            html = None
             
-            # 먼저 언어 지정 없이 시도
-            try:
-                article = Article(url)
-                article.download()
-                article.parse()
-                content = article.text or ""
-            except:
-                pass
-            
-            # content가 없으면 한국어로 시도
-            if not content:
+            # 먼저 언어 지정 없이 시도 (내려받은 HTML은 다른 언어로 다시 파싱할 때 재사용)
+            for language in (None, 'ko', 'en'):
+                options = {'language': language} if language else {}
                 try:
-                    article = Article(url, language='ko')
-                    article.download()
-                    article.parse()
-                    content = article.text or ""
-                except:
-                    pass
-            
-            # 여전히 없으면 영어로 시도
-            if not content:
-                try:
-                    article = Article(url, language='en')
-                    article.download()
+                    article = Article(url, request_timeout=_request_timeout(deadline, ARTICLE_REQUEST_TIMEOUT), **options)
+                    article.download(input_html=html)
+                    html = html or article.html or None
                     article.parse()
                     content = article.text or ""
+                except TimeoutError:
+                    raise
                 except:
                     pass
+                if content:
+                    break
             
             if not article:
                 raise Exception("Failed to parse article with newspaper3k")
@@ -89,23 +104,28 @@ class WebScraper:
             logger.info(f"Successfully scraped: {result['title']} ({len(content)} chars)")
             return result
             
+        except TimeoutError:
+            raise
         except Exception as e:
             logger.warning(f"newspaper3k failed: {str(e)}, trying BeautifulSoup fallback")
             # Fallback: BeautifulSoup 사용
-            return self._fallback_scrape(url)
+            return self._fallback_scrape(url, deadline)
     
-    def _fallback_scrape(self, url: str) -> Dict[str, str]:
+    def _fallback_scrape(self, url: str, deadline: Optional[float] = None) -> Dict[str, str]:
         """
         newspaper3k 실패 시 BeautifulSoup으로 스크래핑
         
         Args:
             url: 스크래핑할 웹 페이지 URL
+            deadline: 전체 마감 시각 (time.monotonic 기준, None이면 요청별 기본값)
             
         Returns:
             기본 스크래핑 결과
         """
+        timeout = _request_timeout(deadline, FALLBACK_REQUEST_TIMEOUT)
+        
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = requests.get(url, headers=self.headers, timeout=timeout)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -137,7 +157,7 @@ class WebScraper:
             logger.error(f"Fallback scraping failed: {str(e)}")
             raise ValueError(f"웹 페이지를 스크래핑할 수 없습니다: {str(e)}")
     
-    def _scrape_linkedin_post(self, url: str) -> Dict[str, str]:
+    def _scrape_linkedin_post(self, url: str, deadline: Optional[float] = None) -> Dict[str, str]:
         """
         LinkedIn 게시물 전용 스크래핑
         - 게시물 본문만 추출 (댓글 제외)
@@ -145,6 +165,7 @@ class WebScraper:
         
         Args:
             url: LinkedIn 게시물 URL
+            deadline: 전체 마감 시각 (time.monotonic 기준, None이면 요청별 기본값)
             
         Returns:
             {
@@ -155,11 +176,13 @@ class WebScraper:
                 'top_image': None
             }
         """
+        timeout = _request_timeout(deadline, LINKEDIN_REQUEST_TIMEOUT)
+        
         try:
             logger.info(f"Scraping LinkedIn post: {url}")
             
             # LinkedIn 페이지 요청
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = requests.get(url, headers=self.headers, timeout=timeout)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -244,12 +267,14 @@ class WebScraper:
                 return text
             
             # OpenAI로 번역
-            from openai import OpenAI
-            from app.config import settings
+            from app.utils.openai_client import create_openai_client
+            from app.services.llm_telemetry import tracked_completion
             
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
+            client = create_openai_client()
             
-            response = client.chat.completions.create(
+            response = tracked_completion(
+                client,
+                'scraper.linkedin_translation',
                 model='gpt-4.1-nano',
                 messages=[
                     {
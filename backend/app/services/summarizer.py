@@ -1,9 +1,11 @@
 """AI 요약 서비스"""
 
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from app.config import settings
-from app.utils.prompts import SUMMARIZE_PROMPT, KEYWORD_EXTRACTION_PROMPT
+from app.utils.openai_client import create_openai_client
+from app.utils.prompts import SUMMARIZE_PROMPT, KEYWORD_EXTRACTION_PROMPT, MERGE_SUMMARIES_PROMPT
+from app.services.llm_telemetry import tracked_completion
 import logging
 import re
 
@@ -14,7 +16,7 @@ class AISummarizer:
     """OpenAI API를 사용한 텍스트 요약 서비스"""
     
     def __init__(self, model: str = None):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = create_openai_client()
         self.model = model or settings.OPENAI_MODEL
     
     def summarize(
@@ -60,6 +62,108 @@ class AISummarizer:
             'card_count': card_count
         }
     
+    def summarize_sources(
+        self,
+        sources: List[str],
+        max_length: int = 200,
+        additional_instructions: Optional[str] = None
+    ) -> Dict:
+        """
+        여러 출처를 출처별로 동시에 요약한 뒤 하나로 병합 (map-reduce)
+        
+        원문을 합쳐서 요약하면 앞부분 3000자만 반영되므로,
+        출처마다 앞부분 3000자를 각각 요약하여 모든 출처가 요약에 포함되게 합니다.
+        
+        Args:
+            sources: 출처별 원문
+            max_length: 최종 요약문 최대 길이
+            
+        Returns:
+            summarize()와 같은 형식
+        """
+        if len(sources) <= 1:
+            return self.summarize(sources[0] if sources else '', max_length, additional_instructions)
+        
+        logger.info(f"Starting per-source summarization for {len(sources)} sources")
+        
+        # 1. 출처별 요약 (동시 실행, 실패한 출처는 건너뜀)
+        def summarize_source(text: str) -> Optional[str]:
+            try:
+                return self._generate_summary(self._truncate_text(text, max_chars=3000), max_length)
+            except ValueError as e:
+                logger.warning(f"Source summary failed, skipping: {str(e)}")
+                return None
+        
+        workers = max(1, min(len(sources), settings.SUMMARIZE_MAX_CONCURRENT))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='summarize') as executor:
+            source_summaries = [s for s in executor.map(summarize_source, sources) if s]
+        
+        if not source_summaries:
+            raise ValueError("요약 생성 실패: 모든 출처 요약에 실패했습니다")
+        
+        # 2. 출처별 요약 병합
+        summary = self._merge_summaries(source_summaries, max_length, additional_instructions)
+        logger.info(f"Summary merged from {len(source_summaries)} sources: {summary[:50]}...")
+        
+        # 3. 키워드 추출 (출처별 요약 기준 - 모든 출처 반영)
+        keywords = self._extract_keywords("\n\n".join(source_summaries))
+        logger.info(f"Keywords extracted: {keywords}")
+        
+        # 4. 카드 수 추천 (전체 원문 길이 기반)
+        card_count = self._recommend_card_count("".join(sources))
+        logger.info(f"Recommended card count: {card_count}")
+        
+        return {
+            'summary': summary,
+            'keywords': keywords,
+            'card_count': card_count
+        }
+    
+    def _merge_summaries(
+        self,
+        summaries: List[str],
+        max_length: int,
+        additional_instructions: Optional[str] = None
+    ) -> str:
+        """
+        출처별 요약을 하나의 요약으로 병합
+        
+        Args:
+            summaries: 출처별 요약
+            max_length: 최대 길이
+            
+        Returns:
+            병합된 요약문
+        """
+        numbered = "\n\n".join(f"[출처 {idx}] {summary}" for idx, summary in enumerate(summaries, 1))
+        prompt = MERGE_SUMMARIES_PROMPT.format(
+            source_count=len(summaries),
+            max_length=max_length,
+            summaries=numbered
+        )
+        
+        if additional_instructions:
+            prompt += f"\n\n추가 요구사항: {additional_instructions}"
+        
+        try:
+            response = tracked_completion(
+                self.client,
+                'summarizer.merge',
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": "You are a professional content summarization expert. Respond in the same language as the given summaries."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=500
+            )
+            
+            return response.choices[0].message.content.strip()
+            
+        except Exception as e:
+            logger.error(f"Summary merge failed: {str(e)}")
+            raise ValueError(f"요약 생성 실패: {str(e)}")
+    
     def _generate_summary(
         self, 
         text: str, 
@@ -95,7 +199,9 @@ class AISummarizer:
             prompt += f"\n\n추가 요구사항: {additional_instructions}"
         
         try:
-            response = self.client.chat.completions.create(
+            response = tracked_completion(
+                self.client,
+                'summarizer.summary',
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_message},
@@ -136,7 +242,9 @@ class AISummarizer:
         prompt = KEYWORD_EXTRACTION_PROMPT.format(text=text, count=count)
         
         try:
-            response = self.client.chat.completions.create(
+            response = tracked_completion(
+                self.client,
+                'summarizer.keywords',
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_message},
@@ -0,0 +1,271 @@
+"""
+워커 작업 큐 (API 프로세스 쪽)
+
+API 프로세스는 크롤링/카드뉴스 생성을 직접 실행하지 않고 worker_tasks에 넣기만 합니다.
+워커 프로세스(python -m app.worker)가 실행한 결과는 작업 문서로 읽고,
+워커가 쓴 라이브러리 항목/프로젝트는 worker_events를 주기적으로 읽어 검색 색인과 캐시에 반영합니다.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import time
+
+from app.config import settings
+from app.utils.cache import invalidate_library_cache, invalidate_project_cache
+from app.utils.firebase import WORKER_EVENT_RETENTION
+from app.utils.firebase_async import (
+    create_worker_task,
+    get_worker_task,
+    transition_worker_task,
+    get_worker_events,
+    get_worker_heartbeat,
+    get_library_items
+)
+from app.utils.search_index import get_search_index
+
+logger = logging.getLogger(__name__)
+
+# 완료 상태
+TASK_DONE_STATUSES = ('completed', 'failed', 'cancelled')
+
+
+class WorkerUnavailableError(RuntimeError):
+    """실행 중인 워커가 없음 (최근 heartbeat 없음)"""
+
+
+def is_worker_alive(heartbeat: Optional[Dict]) -> bool:
+    """heartbeat가 실행 중 상태이고 WORKER_HEARTBEAT_INTERVAL의 3배 이내인지"""
+    if not heartbeat or heartbeat.get('status') != 'running':
+        return False
+    age = (datetime.now(timezone.utc) - heartbeat['updated_at']).total_seconds()
+    return age <= settings.WORKER_HEARTBEAT_INTERVAL * 3
+
+
+async def worker_available() -> bool:
+    """작업을 처리할 워커가 있는지 (WORKER_EMBEDDED면 항상 True)"""
+    if settings.WORKER_EMBEDDED:
+        return True
+    return is_worker_alive(await get_worker_heartbeat())
+
+
+async def enqueue_task(task_type: str, payload: Dict, require_worker: bool = True) -> Dict:
+    """
+    워커 작업 추가
+    
+    Args:
+        task_type: sync_site | crawl_site | create_cardnews
+        payload: 작업 인자
+        require_worker: True면 실행 중인 워커가 없을 때 작업을 넣지 않고 예외,
+            False면 경고만 남기고 작업 추가 (워커가 시작되면 처리)
+    
+    Returns:
+        생성된 작업 (id, status='queued')
+    
+    Raises:
+        WorkerUnavailableError: 실행 중인 워커가 없음 (require_worker=True)
+    """
+    if not await worker_available():
+        if require_worker:
+            raise WorkerUnavailableError(
+                f"No running worker for task {task_type} (start python -m app.worker or set WORKER_EMBEDDED=true)"
+            )
+        logger.warning(f"No running worker, task {task_type} stays queued until a worker starts")
+    
+    return await create_worker_task(task_type, payload)
+
+
+async def wait_for_task(
+    task_id: str,
+    timeout: Optional[float] = None,
+    interval: float = 0.5,
+    on_update: Optional[Callable[[Dict], Awaitable[None]]] = None
+) -> Dict:
+    """
+    작업 완료 대기 (작업 문서 폴링)
+    
+    Args:
+        task_id: 작업 ID
+        timeout: 최대 대기 시간 (초, 기본: WORKER_TASK_TIMEOUT)
+        interval: 확인 주기 (초)
+        on_update: 상태나 진행 단계(progress)가 바뀔 때 호출
+    
+    Returns:
+        완료된 작업 (status: completed | failed | cancelled)
+    
+    Raises:
+        TimeoutError: 시간 안에 끝나지 않음 (워커가 실행 중이 아니거나 작업이 밀림)
+    """
+    deadline = time.monotonic() + (timeout or settings.WORKER_TASK_TIMEOUT)
+    last_state = None
+    
+    while True:
+        task = await get_worker_task(task_id)
+        if task is None:
+            raise ValueError(f"Worker task not found: {task_id}")
+        
+        state = (task['status'], task.get('progress'))
+        if on_update and state != last_state:
+            last_state = state
+            await on_update(task)
+        
+        if task['status'] in TASK_DONE_STATUSES:
+            return task
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Worker task not finished: {task_id} ({task['status']})")
+        
+        await asyncio.sleep(interval)
+
+
+async def cancel_task(task_id: str) -> bool:
+    """
+    대기 중인 작업 취소 (워커가 아직 꺼내지 않은 작업만)
+    
+    Returns:
+        취소 여부 (이미 실행 중이거나 끝난 작업이면 False)
+    """
+    task = await get_worker_task(task_id)
+    if task is None or task['status'] != 'queued':
+        return False
+    
+    # 워커가 그 사이 꺼냈으면 (queued → running) 취소하지 않음
+    if not await transition_worker_task(task_id, 'queued', {
+        'status': 'cancelled',
+        'completed_at': datetime.now(timezone.utc)
+    }):
+        return False
+    logger.info(f"Worker task cancelled: {task['type']} ({task_id})")
+    return True
+
+
+async def apply_worker_event(event: Dict):
+    """워커가 쓴 라이브러리 항목/프로젝트를 이 프로세스의 검색 색인과 캐시에 반영"""
+    keys = event.get('library_keys') or []
+    if keys:
+        items = {item['key']: item for item in await get_library_items(keys)}
+        index = get_search_index()
+        
+        site_ids = set()
+        for key in keys:
+            item = items.get(key)
+            if item is None:
+                index.remove(key)
+                site_ids.add(None)  # 삭제된 항목은 사이트를 알 수 없음
+            else:
+                index.put(item)
+                site_ids.add(item.get('site_id'))
+        
+        if None in site_ids:
+            invalidate_library_cache()
+        else:
+            for site_id in site_ids:
+                invalidate_library_cache(site_id)
+    
+    for project_id in event.get('project_ids') or []:
+        invalidate_project_cache(project_id)
+
+
+def _merge_events(events: List[Dict]) -> Dict:
+    """여러 알림을 하나로 합침 (같은 항목은 한 번만 다시 읽음)"""
+    return {
+        'library_keys': list(dict.fromkeys(key for event in events for key in event.get('library_keys') or [])),
+        'project_ids': list(dict.fromkeys(pid for event in events for pid in event.get('project_ids') or []))
+    }
+
+
+def _advance_events(since: datetime, seen: set, events: List[Dict]) -> Tuple[datetime, set]:
+    """
+    다음 조회 시작 시각과 그 시각에 반영한 알림 id
+    
+    Returns:
+        (since, seen)
+    """
+    last = events[-1]['created_at']
+    ids = {event['id'] for event in events if event['created_at'] == last}
+    return last, (seen | ids) if last == since else ids
+
+
+# 워커 변경 알림 백그라운드 작업
+_event_task: Optional[asyncio.Task] = None
+
+# 시작 시 알림을 다시 읽을 때 앞당기는 여유 (프로세스 간 시계 차이)
+WORKER_EVENT_SKEW = timedelta(minutes=1)
+
+# 한 번에 읽는 알림 수
+WORKER_EVENT_BATCH = 100
+
+# 검색 색인 준비를 기다리는 최대 시간 (초, 로드 실패 시에도 알림 반영은 시작)
+_INDEX_WAIT_SECONDS = 120
+
+
+async def _replay_since(started_at: datetime, interval: float) -> datetime:
+    """
+    시작 시 다시 읽을 알림의 시작 시각
+    
+    검색 색인이 준비될 때까지 기다린 뒤 (로드 전에 반영하면 스냅샷 로드가 덮어씀)
+    스냅샷 저장 시각과 프로세스 시작 시각 중 이른 시각부터, 보존 기간(1시간) 안에서 다시 읽습니다.
+    API가 멈춰 있던 동안 워커가 쓴 변경도 반영됩니다.
+    """
+    index = get_search_index()
+    waited = 0.0
+    while not index.ready and waited < _INDEX_WAIT_SECONDS:
+        await asyncio.sleep(interval)
+        waited += interval
+    
+    since = min(index.saved_at or started_at, started_at) - WORKER_EVENT_SKEW
+    return max(since, datetime.now(timezone.utc) - WORKER_EVENT_RETENTION)
+
+
+async def _event_loop(interval: float):
+    """worker_events를 주기적으로 읽어 반영 (시작 시 색인 스냅샷 이후 알림부터 다시 읽음)"""
+    since = await _replay_since(datetime.now(timezone.utc), interval)
+    logger.info(f"Replaying worker events since {since.isoformat()}")
+    seen = set()  # since 시각에 이미 반영한 알림 id (조회가 since를 포함하므로)
+    
+    while True:
+        try:
+            events = await get_worker_events(since, limit=WORKER_EVENT_BATCH)
+            fresh = [event for event in events if event['id'] not in seen]
+            if fresh:
+                await apply_worker_event(_merge_events(fresh))
+                logger.debug(f"Worker events applied: {len(fresh)}")
+            if events:
+                since, seen = _advance_events(since, seen, events)
+        except Exception as e:
+            logger.error(f"Worker event sync failed: {str(e)}")
+            events = []
+        
+        # 밀린 알림을 다시 읽는 중이면 (가득 찬 조회) 바로 다음 알림 조회
+        if len(events) < WORKER_EVENT_BATCH:
+            await asyncio.sleep(interval)
+
+
+def start_worker_event_listener(interval: Optional[float] = None):
+    """
+    워커 변경 알림 반영 작업 시작 (앱 시작 시 호출)
+    
+    Args:
+        interval: 확인 주기 (초, 기본값: WORKER_POLL_INTERVAL)
+    """
+    global _event_task
+    
+    if _event_task and not _event_task.done():
+        return
+    
+    interval = interval or settings.WORKER_POLL_INTERVAL
+    _event_task = asyncio.get_running_loop().create_task(_event_loop(interval))
+    logger.info(f"Worker event listener started (every {interval}s)")
+
+
+async def stop_worker_event_listener():
+    """워커 변경 알림 반영 작업 중지 (앱 종료 시 호출)"""
+    global _event_task
+    
+    if _event_task:
+        _event_task.cancel()
+        try:
+            await _event_task
+        except asyncio.CancelledError:
+            pass
+        _event_task = None
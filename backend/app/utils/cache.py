@@ -0,0 +1,289 @@
+"""
+쿼리 결과 캐시 (TTL + LRU)
+
+라이브러리 피드처럼 같은 조회가 반복되는 API의 결과와 편집 중인 프로젝트/섹션 문서를
+프로세스 내에 보관합니다. 데이터가 바뀌는 쓰기 경로(app.utils.firebase / firebase_async)에서
+invalidate_library_cache() / invalidate_project_cache()를 호출하여 무효화합니다.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+import threading
+import time
+
+from app.config import settings
+from app.utils.change_feed import get_change_recorder
+
+
+class TTLCache:
+    """TTL + LRU 캐시 (스레드 안전, 적중률 지표 포함)"""
+    
+    def __init__(self, maxsize: int = 256, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        캐시 조회
+        
+        Returns:
+            캐시된 값 (없거나 만료되었으면 default)
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            
+            if entry is None:
+                self.misses += 1
+                return default
+            
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: Hashable, value: Any):
+        """캐시 저장 (용량 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        with self._lock:
+            self._store(key, value)
+    
+    def _store(self, key: Hashable, value: Any):
+        """저장 (잠금을 가진 상태에서 호출)"""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """
+        캐시 무효화
+        
+        Args:
+            predicate: 키를 받아 삭제 여부를 반환하는 함수 (None이면 전체 삭제)
+        
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            if predicate is None:
+                keys = list(self._data)
+            else:
+                keys = [key for key in self._data if predicate(key)]
+            
+            for key in keys:
+                del self._data[key]
+            
+            self.invalidations += len(keys)
+            return len(keys)
+    
+    def stats(self) -> Dict:
+        """캐시 지표"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
+
+
+class VersionedCache(TTLCache):
+    """
+    read-through 문서 캐시 (버전 스탬프)
+    
+    읽기 전에 version()을 받아 두고 put()에 넘기면, 읽는 동안 같은 키가 무효화된 경우
+    읽은 값을 저장하지 않습니다. 쓰기와 겹친 읽기가 오래된 문서를 캐시에 남기는 것을 막습니다.
+    """
+    
+    def __init__(self, maxsize: int = 256, ttl: float = 3600, max_versions: Optional[int] = None):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.max_versions = max_versions or maxsize * 4
+        self._clock = 0
+        self._invalidated_at: "OrderedDict[Hashable, int]" = OrderedDict()  # key -> 무효화 시점
+        self._invalidated_where: list = []  # (무효화 시점, 조건) - 조건 무효화 기록
+        self._floor = 0  # 기록에서 밀려난 키들의 무효화 시점 상한
+        self.stale_puts = 0
+    
+    def version(self) -> int:
+        """현재 버전 (읽기 시작 시 호출)"""
+        with self._lock:
+            return self._clock
+    
+    def put(self, key: Hashable, value: Any, version: int) -> bool:
+        """
+        읽은 값 저장
+        
+        Args:
+            version: 읽기 전에 받은 version()
+        
+        Returns:
+            저장 여부 (그 사이 무효화되었으면 False)
+        """
+        with self._lock:
+            if self._invalidated_at.get(key, self._floor) > version or self._matched_since(key, version):
+                self.stale_puts += 1
+                return False
+            self._store(key, value)
+            return True
+    
+    def _matched_since(self, key: Hashable, version: int) -> bool:
+        """version 이후의 조건 무효화가 키에 해당하는지 (잠금을 가진 상태에서 호출)"""
+        for stamp, predicate in reversed(self._invalidated_where):
+            if stamp <= version:
+                break
+            if predicate is None or predicate(key):
+                return True
+        return False
+    
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """
+        조건 무효화 (진행 중인 읽기 중 조건에 해당하는 키의 put()도 거부)
+        
+        Args:
+            predicate: 키를 받아 삭제 여부를 반환하는 함수 (None이면 전체 삭제)
+        
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            self._clock += 1
+            self._invalidated_where.append((self._clock, predicate))
+            
+            while len(self._invalidated_where) > self.max_versions:
+                stamp, _ = self._invalidated_where.pop(0)
+                self._floor = max(self._floor, stamp)
+            
+            if predicate is None:
+                keys = list(self._data)
+            else:
+                keys = [key for key in self._data if predicate(key)]
+            
+            for key in keys:
+                del self._data[key]
+            
+            self.invalidations += len(keys)
+            return len(keys)
+    
+    def invalidate_keys(self, keys) -> int:
+        """
+        키 무효화 (진행 중인 읽기의 put()도 거부)
+        
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            self._clock += 1
+            removed = 0
+            for key in keys:
+                self._invalidated_at[key] = self._clock
+                self._invalidated_at.move_to_end(key)
+                if self._data.pop(key, None) is not None:
+                    removed += 1
+            
+            while len(self._invalidated_at) > self.max_versions:
+                _, stamp = self._invalidated_at.popitem(last=False)
+                self._floor = max(self._floor, stamp)
+            
+            self.invalidations += removed
+            return removed
+    
+    def stats(self) -> Dict:
+        """캐시 지표"""
+        stats = super().stats()
+        stats['stale_puts'] = self.stale_puts
+        return stats
+
+
+# 라이브러리 피드 캐시 (키의 첫 요소는 site_id)
+_library_cache = VersionedCache(
+    maxsize=settings.LIBRARY_CACHE_SIZE,
+    ttl=settings.LIBRARY_CACHE_TTL
+)
+
+
+def get_library_cache() -> VersionedCache:
+    """라이브러리 피드 캐시 인스턴스 가져오기"""
+    return _library_cache
+
+
+def invalidate_library_cache(site_id: Optional[str] = None) -> int:
+    """
+    라이브러리 피드 캐시 무효화
+    
+    Args:
+        site_id: 변경된 항목의 사이트 (해당 사이트 조회와 전체 사이트 조회만 삭제).
+                 None이면 사이트를 알 수 없으므로 전체 삭제
+    
+    Returns:
+        삭제된 항목 수
+    """
+    if site_id is None:
+        return _library_cache.invalidate()
+    
+    return _library_cache.invalidate(lambda key: key[0] is None or key[0] == site_id)
+
+
+# 직렬화된 목록 응답 본문 (키: ETag - 버전 스탬프가 내용을 대표하므로 쓰기 무효화 불필요)
+_response_body_cache = TTLCache(
+    maxsize=settings.RESPONSE_BODY_CACHE_SIZE,
+    ttl=settings.RESPONSE_BODY_CACHE_TTL
+)
+
+
+def get_response_body_cache() -> TTLCache:
+    """직렬화된 응답 본문 캐시 인스턴스 가져오기"""
+    return _response_body_cache
+
+
+# 프로젝트/섹션 문서 캐시 (키: ('project' | 'sections', project_id))
+_project_cache = VersionedCache(
+    maxsize=settings.PROJECT_CACHE_SIZE,
+    ttl=settings.PROJECT_CACHE_TTL
+)
+
+
+def get_project_cache() -> VersionedCache:
+    """프로젝트/섹션 캐시 인스턴스 가져오기"""
+    return _project_cache
+
+
+def invalidate_project_cache(project_id: str, project: bool = True, sections: bool = True) -> int:
+    """
+    프로젝트/섹션 캐시 무효화
+    
+    Args:
+        project_id: 프로젝트 ID
+        project: 프로젝트 문서 무효화
+        sections: 섹션 목록 무효화
+    
+    Returns:
+        삭제된 항목 수
+    """
+    keys = []
+    if project:
+        keys.append(('project', project_id))
+    if sections:
+        keys.append(('sections', project_id))
+    
+    get_change_recorder().project_written(project_id)
+    return _project_cache.invalidate_keys(keys)
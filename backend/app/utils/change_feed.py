@@ -0,0 +1,61 @@
+"""
+프로세스 간 변경 알림 기록
+
+워커 프로세스(python -m app.worker)가 쓴 라이브러리 항목과 프로젝트는 API 프로세스의
+검색 색인/캐시에 바로 반영되지 않습니다. 워커에서는 쓰기 후처리에서 변경된 키를 기록하고,
+주기적으로 worker_events 문서로 내보내 API 프로세스가 다시 읽어 반영하게 합니다.
+(API 프로세스에서는 기록하지 않음)
+"""
+
+from typing import Dict, Optional
+import threading
+
+
+class ChangeRecorder:
+    """이 프로세스에서 쓴 라이브러리 항목/프로젝트 기록 (스레드 안전)"""
+    
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._library_keys: Dict[str, None] = {}  # 삽입 순서 유지
+        self._project_ids: Dict[str, None] = {}
+    
+    def library_written(self, key: str):
+        """라이브러리 항목 쓰기 (생성/변경/삭제)"""
+        if self.enabled:
+            with self._lock:
+                self._library_keys[key] = None
+    
+    def project_written(self, project_id: str):
+        """프로젝트/섹션 쓰기"""
+        if self.enabled:
+            with self._lock:
+                self._project_ids[project_id] = None
+    
+    def drain(self) -> Optional[Dict]:
+        """
+        기록된 변경을 꺼내고 비움
+        
+        Returns:
+            {'library_keys': [...], 'project_ids': [...]} (변경이 없으면 None)
+        """
+        with self._lock:
+            if not self._library_keys and not self._project_ids:
+                return None
+            
+            changes = {
+                'library_keys': list(self._library_keys),
+                'project_ids': list(self._project_ids)
+            }
+            self._library_keys.clear()
+            self._project_ids.clear()
+            return changes
+
+
+# 전역 변경 기록 (워커 시작 시 enabled = True)
+_change_recorder = ChangeRecorder()
+
+
+def get_change_recorder() -> ChangeRecorder:
+    """전역 변경 기록 가져오기"""
+    return _change_recorder
@@ -0,0 +1,117 @@
+"""
+큰 텍스트 필드 압축 저장
+
+rss_posts.content, projects.source_content처럼 큰 텍스트는 임계값 이상이면
+zstd(zstandard 패키지가 없으면 gzip)로 압축해 bytes로 저장합니다.
+bytes 앞의 코덱 마커로 읽을 때 코덱을 판별하며, 마커가 없는 값(기존 문자열)은 그대로 반환합니다.
+
+압축 해제는 조회 함수가 해당 필드를 실제로 읽었을 때만 수행됩니다.
+(목록 조회는 select 프로젝션으로 큰 필드를 읽지 않음)
+"""
+
+from typing import Any, Dict, Optional
+import gzip
+
+from app.config import settings
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성: 없으면 gzip 사용
+    zstandard = None
+
+# 코덱 마커 (압축 bytes 앞에 붙임)
+CODEC_MARKERS: Dict[str, bytes] = {
+    'zstd': b'ZSTD:',
+    'gzip': b'GZIP:'
+}
+
+# 컬렉션별 압축 대상 필드
+COMPRESSED_FIELDS: Dict[str, tuple] = {
+    'rss_posts': ('content',),
+    'projects': ('source_content',)
+}
+
+
+def _codec() -> str:
+    """사용할 코덱 (zstd를 설정했어도 zstandard가 없으면 gzip)"""
+    codec = settings.COMPRESSION_CODEC
+    if codec == 'zstd' and zstandard is None:
+        return 'gzip'
+    return codec if codec in CODEC_MARKERS else 'gzip'
+
+
+def is_compressed(value: Any) -> bool:
+    """압축 저장된 값인지 확인"""
+    return isinstance(value, bytes) and value[:5] in CODEC_MARKERS.values()
+
+
+def compress_text(value: Any, min_bytes: Optional[int] = None) -> Any:
+    """
+    텍스트 압축 (임계값 미만이거나 압축 효과가 없으면 원래 값 반환)
+    
+    Args:
+        value: 저장할 값 (문자열이 아니면 그대로 반환)
+        min_bytes: 압축 임계값 (기본: COMPRESSION_MIN_BYTES, 0이면 압축 안 함)
+    """
+    if not isinstance(value, str):
+        return value
+    
+    threshold = settings.COMPRESSION_MIN_BYTES if min_bytes is None else min_bytes
+    raw = value.encode('utf-8')
+    if threshold <= 0 or len(raw) < threshold:
+        return value
+    
+    codec = _codec()
+    if codec == 'zstd':
+        payload = zstandard.ZstdCompressor(level=3).compress(raw)
+    else:
+        payload = gzip.compress(raw, compresslevel=6)
+    
+    compressed = CODEC_MARKERS[codec] + payload
+    return compressed if len(compressed) < len(raw) else value
+
+
+def decompress_text(value: Any) -> Any:
+    """압축 저장된 값이면 문자열로 복원 (아니면 그대로)"""
+    if not is_compressed(value):
+        return value
+    
+    marker, payload = value[:5], value[5:]
+    if marker == CODEC_MARKERS['zstd']:
+        if zstandard is None:
+            raise RuntimeError("zstd로 압축된 필드를 읽으려면 zstandard 패키지가 필요합니다")
+        raw = zstandard.ZstdDecompressor().decompress(payload)
+    else:
+        raw = gzip.decompress(payload)
+    
+    return raw.decode('utf-8')
+
+
+def compress_fields(data: Dict, collection: str) -> Dict:
+    """
+    저장용 문서 (압축 대상 필드만 압축한 사본)
+    
+    Args:
+        data: 문서 데이터 (변경하지 않음)
+        collection: 컬렉션 이름 (COMPRESSED_FIELDS 키)
+    """
+    fields = [field for field in COMPRESSED_FIELDS.get(collection, ()) if field in data]
+    if not fields:
+        return data
+    
+    stored = dict(data)
+    for field in fields:
+        stored[field] = compress_text(stored[field])
+    return stored
+
+
+def decompress_fields(doc: Optional[Dict], collection: str) -> Optional[Dict]:
+    """조회한 문서의 압축 필드 복원 (문서를 직접 수정하여 반환)"""
+    if not doc:
+        return doc
+    
+    for field in COMPRESSED_FIELDS.get(collection, ()):
+        if field in doc:
+            doc[field] = decompress_text(doc[field])
+    return doc
+
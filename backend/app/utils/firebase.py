@@ -2,8 +2,17 @@
 
 import firebase_admin
 from firebase_admin import credentials, firestore
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from app.config import settings
+from app.utils.cache import invalidate_library_cache, get_project_cache, invalidate_project_cache
+from app.utils.compression import compress_fields, decompress_fields
+from app.utils.search_index import get_search_index
+from app.utils.change_feed import get_change_recorder
+import base64
+import copy
+import hashlib
+import json
 import uuid
 import logging
 import os
@@ -12,7 +21,8 @@ logger = logging.getLogger(__name__)
 
 # Firebase 초기화 상태
 _app_initialized = False
-_db = None
+_firestore_db = None  # Firestore 클라이언트 (initialize_firebase)
+_db = None           # 선택된 저장소 클라이언트 (get_db)
 _app = None
 
 
@@ -20,11 +30,14 @@ def initialize_firebase():
     """
     Firebase Admin SDK 초기화
     환경 변수에서 설정을 읽어옴
+    
+    Firestore 클라이언트만 만들고 저장소 선택은 하지 않습니다.
+    (앱/워커 시작 시에는 STORAGE_BACKEND를 따르는 get_db() 사용)
     """
-    global _app_initialized, _db, _app
+    global _app_initialized, _firestore_db, _app
     
     if _app_initialized:
-        return _db
+        return _firestore_db
     
     try:
         # 기존 앱이 있으면 삭제
@@ -51,10 +64,10 @@ def initialize_firebase():
             _app = firebase_admin.initialize_app()
         
         # Firestore 클라이언트 초기화
-        _db = firestore.client()
+        _firestore_db = firestore.client()
         _app_initialized = True
         logger.info("Firestore client initialized successfully")
-        return _db
+        return _firestore_db
         
     except Exception as e:
         logger.error(f"Firebase initialization failed: {str(e)}")
@@ -63,13 +76,126 @@ def initialize_firebase():
 
 
 def get_db():
-    """Firestore 클라이언트 가져오기"""
+    """
+    저장소 클라이언트 가져오기
+    
+    STORAGE_BACKEND 설정에 따라 Firestore 클라이언트 또는 같은 API의 SQLite
+    클라이언트(app.utils.sqlite_store)를 반환합니다. ('auto'는 Firestore
+    초기화에 실패하면 SQLite 사용)
+    """
     global _db
     if _db is None:
-        _db = initialize_firebase()
+        _db = _open_storage()
     return _db
 
 
+def _open_storage():
+    """설정된 저장소 백엔드 열기 (firestore 전용 설정에서 실패하면 None)"""
+    backend = settings.STORAGE_BACKEND
+    
+    if backend != 'sqlite':
+        db = initialize_firebase()
+        if db is not None or backend == 'firestore':
+            return db
+        logger.warning("Firestore unavailable, falling back to SQLite storage")
+    
+    from app.utils.sqlite_store import get_sqlite_client
+    return get_sqlite_client()
+
+
+def is_local_storage() -> bool:
+    """SQLite 로컬 저장소 사용 여부"""
+    from app.utils.sqlite_store import SQLiteClient
+    return isinstance(get_db(), SQLiteClient)
+
+
+def _run_transaction(db, func):
+    """
+    func(transaction)을 트랜잭션으로 실행
+    
+    읽기는 doc_ref.get(transaction=transaction), 쓰기는 transaction.set/update/delete로 합니다.
+    Firestore는 충돌 시 func를 다시 실행하고, SQLite는 쓰기 잠금 안에서 한 번 실행합니다.
+    
+    Returns:
+        func의 반환값
+    """
+    transaction = db.transaction()
+    if is_local_storage():
+        return transaction.run(func)
+    return firestore.transactional(func)(transaction)
+
+
+def _encode_cursor(values: Dict) -> str:
+    """
+    페이지 커서 인코딩 (불투명 문자열)
+    
+    Args:
+        values: 정렬 필드 값 (datetime은 ISO 문자열로 변환)
+        
+    Returns:
+        URL-safe base64 문자열
+    """
+    payload = {
+        key: {'$dt': value.isoformat()} if isinstance(value, datetime) else value
+        for key, value in values.items()
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+def _decode_cursor(cursor: str) -> Dict:
+    """
+    페이지 커서 디코딩
+    
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return {
+            key: datetime.fromisoformat(value['$dt']) if isinstance(value, dict) and '$dt' in value else value
+            for key, value in payload.items()
+        }
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def _apply_update(
+    doc_ref,
+    data: Dict,
+    current: Optional[Dict] = None,
+    refetch: bool = False,
+    batch=None
+) -> Optional[Dict]:
+    """
+    문서 업데이트 후 반환값 결정 (공통)
+    
+    Args:
+        doc_ref: Firestore 문서 참조
+        data: 업데이트할 데이터
+        current: 호출자가 이미 가진 문서 (있으면 로컬 병합 결과 반환)
+        refetch: True면 저장된 문서를 다시 읽어서 반환 (추가 읽기 1회)
+        batch: 함께 커밋할 쓰기가 담긴 WriteBatch (있으면 원자적으로 커밋)
+        
+    Returns:
+        refetch → 저장된 문서, current → 로컬 병합 결과, 그 외 → None
+    """
+    if batch is not None:
+        batch.update(doc_ref, data)
+        batch.commit()
+    else:
+        doc_ref.update(data)
+    
+    if refetch:
+        doc = doc_ref.get()
+        return doc.to_dict() if doc.exists else None
+    
+    if current is not None:
+        return {**current, **data}
+    
+    return None
+
+
 # 프로젝트 CRUD
 
 def create_project(data: Dict) -> Dict:
@@ -86,11 +212,58 @@ def create_project(data: Dict) -> Dict:
     if db is None:
         raise ValueError("Firestore not initialized")
     
-    project_id = str(uuid.uuid4())
+    project_data = _new_project_data(data)
+    project_id = project_data['id']
+    project_ref = db.collection('projects').document(project_id)
+    stored = compress_fields(project_data, 'projects')
+    
+    # RSS 프로젝트는 라이브러리 항목(+ 집계 카운터)과 함께 트랜잭션으로 저장
+    # (항목 읽기와 카운터 Increment가 같은 트랜잭션이어야 동시 쓰기에서 카운터가 어긋나지 않음)
+    if project_data.get('library_key'):
+        item = _library_item_from_project(project_data)
+        item_ref = db.collection('library_items').document(project_data['library_key'])
+        
+        def write(transaction):
+            existing = item_ref.get(transaction=transaction).to_dict()
+            transaction.set(project_ref, stored)
+            transaction.set(item_ref, _library_item_stamped(item), merge=True)
+            _write_library_stats(
+                transaction,
+                db.collection('library_stats'),
+                _library_stats_state(existing),
+                _library_stats_state({**(existing or {}), **item})
+            )
+        
+        _run_transaction(db, write)
+    else:
+        project_ref.set(stored)
+    logger.info(f"Project created: {project_id}")
+    
+    if project_data.get('library_key'):
+        _library_item_written(project_data['library_key'], item, project_data.get('source_site_id'))
+    
+    return project_data
+
+
+# 전달된 경우에만 저장하는 프로젝트 필드 (RSS 자동 생성 프로젝트 등)
+_PROJECT_OPTIONAL_FIELDS = (
+    'title',
+    'model',
+    'card_start_type',
+    'source_url',
+    'source_site_id',
+    'source_site_name',
+    'is_auto_generated',
+    'original_published_at'
+)
+
+
+def _new_project_data(data: Dict) -> Dict:
+    """새 프로젝트 문서 데이터 생성"""
     now = datetime.utcnow()
     
     project_data = {
-        'id': project_id,
+        'id': str(uuid.uuid4()),
         'source_type': data.get('source_type'),
         'source_content': data.get('source_content'),
         'summary': None,
@@ -101,8 +274,16 @@ def create_project(data: Dict) -> Dict:
         'status': 'draft'
     }
     
-    db.collection('projects').document(project_id).set(project_data)
-    logger.info(f"Project created: {project_id}")
+    for field in _PROJECT_OPTIONAL_FIELDS:
+        if data.get(field) is not None:
+            project_data[field] = data[field]
+    
+    # 라이브러리 피드 정렬 키
+    project_data['published_at'] = data.get('original_published_at') or now
+    
+    # RSS 프로젝트는 원본 URL 기준 라이브러리 항목과 연결
+    if project_data['source_type'] == 'rss' and project_data.get('source_url'):
+        project_data['library_key'] = _library_key(project_data['source_url'])
     
     return project_data
 
@@ -124,23 +305,38 @@ def get_project(project_id: str) -> Optional[Dict]:
     if db is None:
         raise ValueError("Firestore not initialized")
     
+    cache = get_project_cache()
+    project = cache.get(('project', project_id))
+    if project is not None:
+        return copy.deepcopy(project)
+    
+    version = cache.version()
     doc = db.collection('projects').document(project_id).get()
     
     if doc.exists:
-        return doc.to_dict()
+        project = decompress_fields(doc.to_dict(), 'projects')
+        cache.put(('project', project_id), project, version)
+        return copy.deepcopy(project)
     return None
 
 
-def update_project(project_id: str, data: Dict) -> Dict:
+def update_project(
+    project_id: str,
+    data: Dict,
+    current: Optional[Dict] = None,
+    refetch: bool = False
+) -> Optional[Dict]:
     """
     프로젝트 업데이트
     
     Args:
         project_id: 프로젝트 ID
         data: 업데이트할 데이터
+        current: 이미 조회한 프로젝트 (있으면 병합 결과 반환, 추가 읽기 없음)
+        refetch: True면 업데이트 후 다시 조회
         
     Returns:
-        업데이트된 프로젝트
+        업데이트된 프로젝트 (current/refetch 둘 다 없으면 None)
     """
     db = get_db()
     if db is None:
@@ -148,10 +344,24 @@ def update_project(project_id: str, data: Dict) -> Dict:
     
     data['updated_at'] = datetime.utcnow()
     
-    db.collection('projects').document(project_id).update(data)
+    # 피드 표시 필드가 바뀌면 라이브러리 항목도 같은 배치로 갱신
+    batch = None
+    item_changes = _library_project_changes(data)
+    if item_changes:
+        library_key = _project_library_key(db, project_id, current)
+        if library_key:
+            batch = db.batch()
+            batch.set(db.collection('library_items').document(library_key), _library_item_stamped(item_changes), merge=True)
+    
+    stored = compress_fields(data, 'projects')
+    result = decompress_fields(_apply_update(db.collection('projects').document(project_id), stored, current, refetch, batch), 'projects')
+    invalidate_project_cache(project_id, sections=False)
     logger.info(f"Project updated: {project_id}")
     
-    return get_project(project_id)
+    if batch is not None:
+        _library_item_written(library_key, item_changes, (current or {}).get('source_site_id'))
+    
+    return result
 
 
 # 섹션 CRUD
@@ -171,30 +381,157 @@ def create_sections(project_id: str, sections: List[Dict]) -> List[Dict]:
     if db is None:
         raise ValueError("Firestore not initialized")
     
+    sections_ref = db.collection('projects').document(project_id).collection('sections')
+    batch = db.batch()
     created_sections = []
     
     for section in sections:
-        section_id = str(uuid.uuid4())
-        section_data = {
-            'id': section_id,
-            'project_id': project_id,
-            'order': section.get('order'),
-            'type': section.get('type'),
-            'title': section.get('title'),
-            'content': section.get('content'),
-            'design_config': section.get('design_config', {}),
-            'created_at': datetime.utcnow()
-        }
-        
-        db.collection('projects').document(project_id)\
-          .collection('sections').document(section_id).set(section_data)
-        
+        section_data = _new_section_data(project_id, section)
+        batch.set(sections_ref.document(section_data['id']), section_data)
         created_sections.append(section_data)
+    _stamp_sections(batch, db, project_id)
+    
+    # 한 번의 커밋으로 모든 섹션 저장
+    batch.commit()
+    invalidate_project_cache(project_id, project=False)
     
     logger.info(f"Created {len(created_sections)} sections for project {project_id}")
     return created_sections
 
 
+# 섹션 비교 대상 필드 (변경 감지용)
+_SECTION_FIELDS = ('order', 'type', 'title', 'content', 'design_config')
+
+
+def _new_section_data(project_id: str, section: Dict) -> Dict:
+    """새 섹션 문서 데이터 생성"""
+    return {
+        'id': str(uuid.uuid4()),
+        'project_id': project_id,
+        'order': section.get('order'),
+        'type': section.get('type'),
+        'title': section.get('title'),
+        'content': section.get('content'),
+        'design_config': section.get('design_config', {}),
+        'created_at': datetime.utcnow()
+    }
+
+
+def _plan_section_replace(
+    project_id: str,
+    sections: List[Dict],
+    existing_sections: List[Dict]
+) -> Tuple[List[Dict], List[Dict], List[Tuple[str, Dict]], List[str]]:
+    """
+    섹션 교체 계획 계산 (I/O 없음)
+    
+    Returns:
+        (최종 섹션 리스트, 생성할 섹션, (id, 변경 필드) 업데이트 목록, 삭제할 id 목록)
+    """
+    existing_by_id = {s['id']: s for s in existing_sections}
+    now = datetime.utcnow()
+    
+    result = []
+    to_create = []
+    to_update = []
+    kept_ids = set()
+    
+    for idx, section in enumerate(sections):
+        section = {**section, 'order': idx}
+        section_id = section.get('id')
+        previous = existing_by_id.get(section_id) if section_id else None
+        
+        if previous is None or section_id in kept_ids:
+            section_data = _new_section_data(project_id, section)
+            to_create.append(section_data)
+            result.append(section_data)
+            kept_ids.add(section_data['id'])
+            continue
+        
+        kept_ids.add(section_id)
+        changes = {
+            field: section.get(field)
+            for field in _SECTION_FIELDS
+            if field in section and section.get(field) != previous.get(field)
+        }
+        
+        if changes:
+            changes['updated_at'] = now
+            to_update.append((section_id, changes))
+        
+        result.append({**previous, **changes})
+    
+    to_delete = [section_id for section_id in existing_by_id if section_id not in kept_ids]
+    
+    return result, to_create, to_update, to_delete
+
+
+def _stage_section_replace(
+    transaction,
+    db,
+    project_id: str,
+    to_create: List[Dict],
+    to_update: List[Tuple[str, Dict]],
+    to_delete: List[str]
+):
+    """섹션 교체 계획의 쓰기를 트랜잭션에 추가 (변경이 있으면 섹션 변경 스탬프 포함, 동기/비동기 클라이언트 공용)"""
+    sections_ref = db.collection('projects').document(project_id).collection('sections')
+    
+    for section_data in to_create:
+        transaction.set(sections_ref.document(section_data['id']), section_data)
+    for section_id, changes in to_update:
+        transaction.update(sections_ref.document(section_id), changes)
+    for section_id in to_delete:
+        transaction.delete(sections_ref.document(section_id))
+    
+    if to_create or to_update or to_delete:
+        _stamp_sections(transaction, db, project_id)
+
+
+def replace_sections(project_id: str, sections: List[Dict]) -> List[Dict]:
+    """
+    섹션 전체 교체 (diff 기반 upsert, 단일 트랜잭션)
+    
+    - 새 목록에 없는 기존 섹션은 삭제
+    - 내용이 바뀐 섹션만 업데이트
+    - 바뀌지 않은 섹션은 건드리지 않음
+    - id가 없거나 기존에 없는 id는 새로 생성
+    
+    diff 기준은 항상 저장된 섹션입니다. (클라이언트가 보낸 목록은 오래됐을 수 있어
+    기준으로 쓰면 저장된 섹션이 삭제되지 않고 남음)
+    
+    Args:
+        project_id: 프로젝트 ID
+        sections: 최종 섹션 리스트 (order 순)
+        
+    Returns:
+        저장된 최종 섹션 리스트
+    """
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    # 캐시가 아닌 저장된 상태 조회와 diff 쓰기를 한 트랜잭션으로
+    # (동시 교체가 서로 다른 기준으로 diff하여 섹션이 남거나 중복되지 않도록)
+    def write(transaction):
+        existing_sections = _fetch_sections(db, project_id, transaction=transaction)
+        plan = _plan_section_replace(project_id, sections, existing_sections)
+        _stage_section_replace(transaction, db, project_id, *plan[1:])
+        return plan
+    
+    result, to_create, to_update, to_delete = _run_transaction(db, write)
+    created, updated, deleted = len(to_create), len(to_update), len(to_delete)
+    
+    if created or updated or deleted:
+        invalidate_project_cache(project_id, project=False)
+    
+    logger.info(
+        f"Sections replaced for project {project_id}: "
+        f"{created} created, {updated} updated, {deleted} deleted"
+    )
+    return result
+
+
 def get_sections(project_id: str) -> List[Dict]:
     """
     프로젝트의 섹션 목록 조회
@@ -209,18 +546,92 @@ def get_sections(project_id: str) -> List[Dict]:
     if db is None:
         return []
     
-    sections_ref = db.collection('projects').document(project_id)\
-                     .collection('sections')\
-                     .order_by('order')
+    cache = get_project_cache()
+    sections = cache.get(('sections', project_id))
+    if sections is not None:
+        return copy.deepcopy(sections)
+    
+    version = cache.version()
+    sections = _fetch_sections(db, project_id)
+    cache.put(('sections', project_id), sections, version)
+    
+    return copy.deepcopy(sections)
+
+
+def _sections_query(db, project_id: str):
+    """프로젝트 섹션 쿼리 (order 순, 동기/비동기 클라이언트 공용)"""
+    return db.collection('projects').document(project_id)\
+             .collection('sections')\
+             .order_by('order')
+
+
+def _fetch_sections(db, project_id: str, transaction=None) -> List[Dict]:
+    """저장된 섹션 목록 조회 (캐시 사용 안 함, transaction이 있으면 트랜잭션 읽기)"""
+    return [doc.to_dict() for doc in _sections_query(db, project_id).stream(transaction=transaction)]
+
+
+def _stamp_sections(batch, db, project_id: str):
+    """
+    섹션 변경 스탬프를 같은 배치(또는 트랜잭션)에 추가 (PROJECT_CACHE_LISTEN일 때만)
+    
+    다른 워커는 프로젝트 문서의 sections_updated_at 변경을 리스너로 받아 섹션 캐시를 무효화합니다.
+    """
+    if settings.PROJECT_CACHE_LISTEN:
+        batch.update(db.collection('projects').document(project_id), {'sections_updated_at': datetime.utcnow()})
+
+
+# 다른 워커의 프로젝트/섹션 쓰기 리스너 (PROJECT_CACHE_LISTEN)
+_project_watches: List = []
+
+
+def start_project_watch() -> bool:
+    """
+    Firestore 스냅샷 리스너로 다른 워커의 프로젝트/섹션 쓰기를 캐시에 반영
+    
+    시작 이후 updated_at / sections_updated_at이 바뀐 프로젝트만 구독하므로 초기 로드 비용이 없습니다.
+    다른 워커가 삭제한 프로젝트는 PROJECT_CACHE_TTL 동안 남을 수 있습니다.
+    
+    Returns:
+        시작 여부 (설정이 꺼져 있거나 SQLite 저장소면 False)
+    """
+    if not settings.PROJECT_CACHE_LISTEN or _project_watches:
+        return False
+    
+    db = get_db()
+    if db is None or is_local_storage():
+        return False
+    
+    since = datetime.utcnow()
+    projects = db.collection('projects')
+    
+    def on_project_change(snapshots, changes, read_time):
+        for change in changes:
+            invalidate_project_cache(change.document.id, sections=False)
+    
+    def on_sections_change(snapshots, changes, read_time):
+        for change in changes:
+            invalidate_project_cache(change.document.id, project=False)
     
-    sections = []
-    for doc in sections_ref.stream():
-        sections.append(doc.to_dict())
+    _project_watches.append(projects.where('updated_at', '>=', since).on_snapshot(on_project_change))
+    _project_watches.append(projects.where('sections_updated_at', '>=', since).on_snapshot(on_sections_change))
     
-    return sections
+    logger.info("Project cache listeners started")
+    return True
 
 
-def update_section(project_id: str, section_id: str, data: Dict) -> Dict:
+def stop_project_watch():
+    """프로젝트/섹션 변경 리스너 중지"""
+    while _project_watches:
+        _project_watches.pop().unsubscribe()
+
+
+def update_section(
+    project_id: str,
+    section_id: str,
+    data: Dict,
+    current: Optional[Dict] = None,
+    refetch: bool = False
+) -> Optional[Dict]:
     """
     섹션 업데이트
     
@@ -228,9 +639,11 @@ def update_section(project_id: str, section_id: str, data: Dict) -> Dict:
         project_id: 프로젝트 ID
         section_id: 섹션 ID
         data: 업데이트할 데이터
+        current: 이미 조회한 섹션 (있으면 병합 결과 반환, 추가 읽기 없음)
+        refetch: True면 업데이트 후 다시 조회
         
     Returns:
-        업데이트된 섹션
+        업데이트된 섹션 (current/refetch 둘 다 없으면 None)
     """
     db = get_db()
     if db is None:
@@ -238,15 +651,20 @@ def update_section(project_id: str, section_id: str, data: Dict) -> Dict:
     
     data['updated_at'] = datetime.utcnow()
     
-    db.collection('projects').document(project_id)\
-      .collection('sections').document(section_id).update(data)
+    doc_ref = db.collection('projects').document(project_id)\
+                .collection('sections').document(section_id)
     
-    logger.info(f"Section updated: {section_id}")
+    batch = None
+    if settings.PROJECT_CACHE_LISTEN:
+        batch = db.batch()
+        _stamp_sections(batch, db, project_id)
     
-    doc = db.collection('projects').document(project_id)\
-            .collection('sections').document(section_id).get()
+    result = _apply_update(doc_ref, data, current, refetch, batch)
+    invalidate_project_cache(project_id, project=False)
     
-    return doc.to_dict() if doc.exists else None
+    logger.info(f"Section updated: {section_id}")
+    
+    return result
 
 
 def delete_section(project_id: str, section_id: str):
@@ -261,8 +679,17 @@ def delete_section(project_id: str, section_id: str):
     if db is None:
         raise ValueError("Firestore not initialized")
     
-    db.collection('projects').document(project_id)\
-      .collection('sections').document(section_id).delete()
+    doc_ref = db.collection('projects').document(project_id)\
+                .collection('sections').document(section_id)
+    
+    if settings.PROJECT_CACHE_LISTEN:
+        batch = db.batch()
+        batch.delete(doc_ref)
+        _stamp_sections(batch, db, project_id)
+        batch.commit()
+    else:
+        doc_ref.delete()
+    invalidate_project_cache(project_id, project=False)
     
     logger.info(f"Section deleted: {section_id}")
 
@@ -282,20 +709,24 @@ def save_conversation(project_id: str, user_message: str, ai_response: str):
     if db is None:
         return
     
-    conversation_id = str(uuid.uuid4())
-    conversation_data = {
-        'id': conversation_id,
-        'user_message': user_message,
-        'ai_response': ai_response,
-        'timestamp': datetime.utcnow()
-    }
+    conversation_data = _new_conversation_data(user_message, ai_response)
     
     db.collection('projects').document(project_id)\
-      .collection('conversations').document(conversation_id).set(conversation_data)
+      .collection('conversations').document(conversation_data['id']).set(conversation_data)
     
     logger.info(f"Conversation saved for project {project_id}")
 
 
+def _new_conversation_data(user_message: str, ai_response: str) -> Dict:
+    """새 대화 이력 문서 데이터 생성"""
+    return {
+        'id': str(uuid.uuid4()),
+        'user_message': user_message,
+        'ai_response': ai_response,
+        'timestamp': datetime.utcnow()
+    }
+
+
 def get_conversations(project_id: str, limit: int = 10) -> List[Dict]:
     """
     대화 이력 조회
@@ -342,11 +773,21 @@ def create_site(data: Dict) -> Dict:
     if db is None:
         raise ValueError("Firestore not initialized")
     
-    site_id = str(uuid.uuid4())
+    site_data = _new_site_data(data)
+    site_id = site_data['id']
+    
+    db.collection('sites').document(site_id).set(site_data)
+    logger.info(f"Site created: {site_id}")
+    
+    return site_data
+
+
+def _new_site_data(data: Dict) -> Dict:
+    """새 사이트 문서 데이터 생성"""
     now = datetime.utcnow()
     
-    site_data = {
-        'id': site_id,
+    return {
+        'id': str(uuid.uuid4()),
         'name': data.get('name'),
         'url': data.get('url'),
         'rss_url': data.get('rss_url'),
@@ -361,11 +802,6 @@ def create_site(data: Dict) -> Dict:
         'created_at': now,
         'updated_at': now
     }
-    
-    db.collection('sites').document(site_id).set(site_data)
-    logger.info(f"Site created: {site_id}")
-    
-    return site_data
 
 
 def get_site(site_id: str) -> Optional[Dict]:
@@ -392,18 +828,70 @@ def get_all_sites() -> List[Dict]:
     return sites
 
 
-def update_site(site_id: str, data: Dict) -> Dict:
-    """사이트 업데이트"""
+def update_site(
+    site_id: str,
+    data: Dict,
+    current: Optional[Dict] = None,
+    refetch: bool = False
+) -> Optional[Dict]:
+    """
+    사이트 업데이트
+    
+    Returns:
+        current가 있으면 병합 결과, refetch면 저장된 문서, 그 외 None
+    """
     db = get_db()
     if db is None:
         raise ValueError("Firestore not initialized")
     
     data['updated_at'] = datetime.utcnow()
     
-    db.collection('sites').document(site_id).update(data)
+    result = _apply_update(db.collection('sites').document(site_id), data, current, refetch)
     logger.info(f"Site updated: {site_id}")
     
-    return get_site(site_id)
+    return result
+
+
+# 사이트 에러 상태 전환 기준 (누적 실패 횟수)
+SITE_ERROR_THRESHOLD = 5
+
+
+def record_site_crawl(
+    site_id: str,
+    success: bool,
+    new_posts: int = 0,
+    data: Optional[Dict] = None
+):
+    """
+    크롤링 결과를 사이트 통계에 반영
+    
+    total_crawls/success_count/error_count/total_posts_found는 서버 측 Increment로
+    갱신하므로 사이트를 다시 읽지 않고, 동시에 실행된 크롤링의 결과도 유실되지 않습니다.
+    
+    Args:
+        site_id: 사이트 ID
+        success: 크롤링 성공 여부
+        new_posts: 새로 저장한 게시물 수 (성공 시)
+        data: 같은 쓰기에 포함할 필드 (last_crawled_at, next_crawl_at, status 등)
+    """
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    update = {
+        **(data or {}),
+        'total_crawls': firestore.Increment(1),
+        'updated_at': datetime.utcnow()
+    }
+    if success:
+        update['success_count'] = firestore.Increment(1)
+        if new_posts:
+            update['total_posts_found'] = firestore.Increment(new_posts)
+    else:
+        update['error_count'] = firestore.Increment(1)
+    
+    db.collection('sites').document(site_id).update(update)
+    logger.info(f"Site crawl recorded: {site_id} ({'success' if success else 'failed'})")
 
 
 def delete_site(site_id: str):
@@ -432,10 +920,21 @@ def create_crawl_log(data: Dict) -> Dict:
     if db is None:
         raise ValueError("Firestore not initialized")
     
-    log_id = str(uuid.uuid4())
+    log_data = _new_crawl_log_data(data)
+    log_id = log_data['id']
+    
+    db.collection('crawl_logs').document(log_id).set(log_data)
+    logger.info(f"Crawl log created: {log_id}")
+    
+    return log_data
+
+
+def _new_crawl_log_data(data: Dict) -> Dict:
+    """새 크롤링 로그 문서 데이터 생성 (expires_at: Firestore TTL 정책 대상)"""
+    started_at = data.get('started_at', datetime.utcnow())
     
-    log_data = {
-        'id': log_id,
+    return {
+        'id': str(uuid.uuid4()),
         'site_id': data.get('site_id'),
         'site_name': data.get('site_name'),
         'status': data.get('status', 'running'),
@@ -444,178 +943,529 @@ def create_crawl_log(data: Dict) -> Dict:
         'projects_created': data.get('projects_created', 0),
         'error_message': data.get('error_message'),
         'error_details': data.get('error_details'),
-        'started_at': data.get('started_at', datetime.utcnow()),
+        'started_at': started_at,
         'completed_at': data.get('completed_at'),
         'duration_seconds': data.get('duration_seconds'),
-        'post_titles': data.get('post_titles', [])
+        'post_titles': data.get('post_titles', []),
+        'expires_at': started_at + timedelta(days=settings.CRAWL_LOG_RETENTION_DAYS)
     }
-    
-    db.collection('crawl_logs').document(log_id).set(log_data)
-    logger.info(f"Crawl log created: {log_id}")
-    
-    return log_data
 
 
-def update_crawl_log(log_id: str, data: Dict) -> Dict:
-    """크롤링 로그 업데이트"""
+def update_crawl_log(
+    log_id: str,
+    data: Dict,
+    current: Optional[Dict] = None,
+    refetch: bool = False
+) -> Optional[Dict]:
+    """
+    크롤링 로그 업데이트
+    
+    Returns:
+        current가 있으면 병합 결과, refetch면 저장된 문서, 그 외 None
+    """
     db = get_db()
     if db is None:
         raise ValueError("Firestore not initialized")
     
-    db.collection('crawl_logs').document(log_id).update(data)
+    result = _apply_update(db.collection('crawl_logs').document(log_id), data, current, refetch)
     logger.info(f"Crawl log updated: {log_id}")
     
-    doc = db.collection('crawl_logs').document(log_id).get()
-    return doc.to_dict() if doc.exists else None
+    return result
 
 
-def get_crawl_logs(site_id: Optional[str] = None, limit: int = 50) -> List[Dict]:
+def write_crawl_logs(logs: List[Dict]) -> int:
     """
-    크롤링 로그 조회
+    크롤링 로그 일괄 저장 (write-behind 버퍼의 flush용, set merge, 500건 단위 배치)
     
     Args:
-        site_id: 사이트 ID (None이면 전체)
-        limit: 최대 조회 개수
+        logs: 로그 문서 목록 (id 필수)
         
     Returns:
-        로그 리스트
+        저장한 로그 수
     """
     db = get_db()
     if db is None:
-        return []
+        raise ValueError("Firestore not initialized")
     
-    try:
-        query = db.collection('crawl_logs')
-        
-        if site_id:
-            # 복합 인덱스가 필요하므로, 일단 모든 로그를 가져온 후 Python에서 필터링
-            # TODO: Firebase Console에서 복합 인덱스 생성 후 제거
-            all_logs = []
-            for doc in query.stream():
-                log_data = doc.to_dict()
-                if log_data.get('site_id') == site_id:
-                    all_logs.append(log_data)
-            
-            # Python에서 정렬
-            all_logs.sort(key=lambda x: x.get('started_at', datetime.min), reverse=True)
-            return all_logs[:limit]
-        else:
-            # site_id 필터 없이 order_by만 사용 (단일 필드 인덱스는 자동 생성)
-            query = query.order_by('started_at', direction=firestore.Query.DESCENDING).limit(limit)
-            
-            logs = []
-            for doc in query.stream():
-                logs.append(doc.to_dict())
-            
-            return logs
-            
-    except Exception as e:
-        logger.error(f"Failed to get crawl logs: {str(e)}")
-        return []
-
+    collection = db.collection('crawl_logs')
+    writer = _ChunkedBatch(db, headroom=0)
+    
+    for log in logs:
+        writer.set(collection.document(log['id']), log, merge=True)
+        if writer.full():
+            writer.take().commit()
+    
+    batch = writer.take()
+    if batch is not None:
+        batch.commit()
+    
+    return len(logs)
 
-# Phase 2: Projects 확장 (목록 조회)
 
-def get_all_projects(limit: int = 100, status: Optional[str] = None) -> List[Dict]:
+def _crawl_logs_query(collection, site_id: Optional[str], cursor: Optional[str], limit: int):
     """
-    모든 프로젝트 조회
+    크롤링 로그 쿼리 생성 (동기/비동기 클라이언트 공용)
     
-    Args:
-        limit: 최대 조회 개수
-        status: 상태 필터 (None이면 전체)
-        
-    Returns:
-        프로젝트 리스트
+    started_at이 같은 로그가 페이지 경계에서 빠지지 않도록 id를 보조 정렬 키로 씁니다.
+    (started_at DESC, id DESC) / (site_id ASC, started_at DESC, id DESC) 복합 인덱스를 사용합니다.
+    (firestore.indexes.json 참고)
     """
-    db = get_db()
-    if db is None:
-        return []
-    
-    query = db.collection('projects')
+    query = collection
     
-    if status:
-        query = query.where('status', '==', status)
+    if site_id:
+        query = query.where('site_id', '==', site_id)
     
-    query = query.order_by('created_at', direction=firestore.Query.DESCENDING).limit(limit)
+    query = query.order_by('started_at', direction=firestore.Query.DESCENDING)
+    query = query.order_by('id', direction=firestore.Query.DESCENDING)
     
-    projects = []
-    for doc in query.stream():
-        projects.append(doc.to_dict())
+    if cursor:
+        after = _decode_cursor(cursor)
+        after.setdefault('id', '')  # id가 없는 이전 커서: 기존처럼 같은 started_at 다음부터
+        query = query.start_after(after)
     
-    return projects
+    return query.limit(limit)
+
+
+def _crawl_logs_page(logs: List[Dict], limit: int) -> Dict:
+    """limit + 1개 조회 결과로 페이지와 다음 커서 구성"""
+    next_cursor = None
+    if len(logs) > limit:
+        logs = logs[:limit]
+        next_cursor = _encode_cursor({'started_at': logs[-1]['started_at'], 'id': logs[-1]['id']})
+    
+    return {
+        'logs': logs,
+        'next_cursor': next_cursor
+    }
 
 
-def delete_project(project_id: str):
+def get_crawl_logs_page(
+    site_id: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None
+) -> Dict:
     """
-    프로젝트 삭제
+    크롤링 로그 페이지 조회 (최신순, 커서 기반)
     
     Args:
-        project_id: 프로젝트 ID
+        site_id: 사이트 ID (None이면 전체)
+        limit: 페이지 크기
+        cursor: 이전 페이지의 next_cursor
+        
+    Returns:
+        {
+            'logs': List[Dict],
+            'next_cursor': str | None  # 마지막 페이지면 None
+        }
+        
+    Raises:
+        ValueError: 잘못된 커서
     """
     db = get_db()
     if db is None:
-        raise ValueError("Firestore not initialized")
-    
-    # 프로젝트 문서 삭제
-    db.collection('projects').document(project_id).delete()
+        return {'logs': [], 'next_cursor': None}
     
-    # 서브컬렉션 삭제 (sections, conversations)
-    # Note: Firestore는 문서 삭제 시 서브컬렉션을 자동 삭제하지 않음
-    # 필요 시 별도 삭제 로직 추가
+    query = _crawl_logs_query(db.collection('crawl_logs'), site_id, cursor, limit + 1)
+    logs = [doc.to_dict() for doc in query.stream()]
     
-    logger.info(f"Project deleted: {project_id}")
+    return _crawl_logs_page(logs, limit)
 
 
-# ==================================================
-# RSS Posts (Phase 2.5)
-# ==================================================
-
-def create_rss_post(post_data: Dict) -> str:
+def get_crawl_logs(site_id: Optional[str] = None, limit: int = 50) -> List[Dict]:
     """
-    RSS 게시물 생성 (DB 영구 저장)
+    크롤링 로그 조회
     
     Args:
-        post_data: RSS 게시물 데이터
+        site_id: 사이트 ID (None이면 전체)
+        limit: 최대 조회 개수
         
     Returns:
-        생성된 RSS 게시물 ID
+        로그 리스트
     """
-    db = get_db()
+    try:
+        return get_crawl_logs_page(site_id=site_id, limit=limit)['logs']
+    except Exception as e:
+        logger.error(f"Failed to get crawl logs: {str(e)}")
+        return []
+
+
+def purge_crawl_logs(
+    older_than_days: Optional[int] = None,
+    site_id: Optional[str] = None,
+    batch_size: int = 200
+) -> int:
+    """
+    보존 기간이 지난 크롤링 로그 삭제
+    
+    expires_at(TTL) 필드가 없는 기존 로그 정리용입니다.
+    새 로그는 Firestore TTL 정책으로 자동 삭제됩니다.
+    
+    Args:
+        older_than_days: 보존 기간 (기본: CRAWL_LOG_RETENTION_DAYS)
+        site_id: 특정 사이트만 정리 (None이면 전체)
+        batch_size: 배치당 삭제 개수 (최대 500)
+        
+    Returns:
+        삭제된 로그 수
+    """
+    db = get_db()
     if db is None:
         raise ValueError("Firestore not initialized")
     
-    import hashlib
-    from datetime import datetime, timezone
+    days = older_than_days or settings.CRAWL_LOG_RETENTION_DAYS
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
     
-    # URL을 해시하여 ID 생성 (중복 방지)
-    post_id = hashlib.md5(post_data['url'].encode()).hexdigest()
+    query = db.collection('crawl_logs')
+    if site_id:
+        query = query.where('site_id', '==', site_id)
+    query = query.where('started_at', '<', cutoff).limit(batch_size)
+    
+    deleted = 0
+    while True:
+        docs = list(query.stream())
+        if not docs:
+            break
+        
+        batch = db.batch()
+        for doc in docs:
+            batch.delete(doc.reference)
+        batch.commit()
+        deleted += len(docs)
+    
+    logger.info(f"Purged {deleted} crawl logs older than {days} days")
+    return deleted
+
+
+# Phase 2: Projects 확장 (목록 조회)
+
+# 목록 조회 시 읽는 프로젝트 필드 (source_content 등 큰 필드 제외, ProjectListItem과 대응)
+PROJECT_LIST_FIELDS = (
+    'id',
+    'title',
+    'source_type',
+    'summary',
+    'keywords',
+    'recommended_card_count',
+    'status',
+    'model',
+    'card_start_type',
+    'source_url',
+    'source_site_id',
+    'source_site_name',
+    'is_auto_generated',
+    'version',
+    'last_error',
+    'created_at',
+    'updated_at'
+)
+
+
+def get_all_projects(
+    limit: int = 100,
+    status: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = PROJECT_LIST_FIELDS
+) -> List[Dict]:
+    """
+    모든 프로젝트 조회
+    
+    Args:
+        limit: 최대 조회 개수
+        status: 상태 필터 (None이면 전체)
+        fields: 읽을 필드 (select 프로젝션, None이면 문서 전체)
+        
+    Returns:
+        프로젝트 리스트
+    """
+    db = get_db()
+    if db is None:
+        return []
+    
+    query = _projects_list_query(db.collection('projects'), limit, status, fields)
+    
+    projects = []
+    for doc in query.stream():
+        projects.append(decompress_fields(doc.to_dict(), 'projects'))
+    
+    return projects
+
+
+def _projects_list_query(collection, limit: int, status: Optional[str], fields: Optional[Tuple[str, ...]]):
+    """프로젝트 목록 쿼리 (최근 생성순, 동기/비동기 클라이언트 공용)"""
+    query = collection
+    
+    if status:
+        query = query.where('status', '==', status)
+    if fields is not None:
+        query = query.select(list(fields))
+    
+    return query.order_by('created_at', direction=firestore.Query.DESCENDING).limit(limit)
+
+
+def get_project_ids(
+    status: Optional[str] = None,
+    auto_generated: Optional[bool] = None,
+    limit: int = 1000
+) -> List[str]:
+    """
+    조건에 맞는 프로젝트 ID 목록 (일괄 삭제 대상 선택용, 문서 본문은 읽지 않음)
+    
+    Args:
+        status: 상태 필터
+        auto_generated: 자동 생성 여부 필터
+        limit: 최대 개수
+    """
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    return [doc.id for doc in _project_ids_query(db.collection('projects'), status, auto_generated, limit).stream()]
+
+
+def _project_ids_query(collection, status: Optional[str], auto_generated: Optional[bool], limit: int):
+    """프로젝트 ID 조회 쿼리 (동기/비동기 클라이언트 공용)"""
+    query = collection
+    if status:
+        query = query.where('status', '==', status)
+    if auto_generated is not None:
+        query = query.where('is_auto_generated', '==', auto_generated)
+    return query.select([]).limit(limit)
+
+
+def delete_project(project_id: str) -> Dict[str, int]:
+    """
+    프로젝트 삭제 (sections/conversations 서브컬렉션, RSS 게시물 연결 포함)
+    
+    Args:
+        project_id: 프로젝트 ID
+    """
+    return delete_projects([project_id])
+
+
+# WriteBatch 한 번에 담는 최대 쓰기 수 (Firestore 한도 500)
+_BATCH_WRITE_LIMIT = 500
+
+# 프로젝트 문서 아래 서브컬렉션 (Firestore는 문서 삭제 시 서브컬렉션을 자동 삭제하지 않음)
+_PROJECT_SUBCOLLECTIONS = ('sections', 'conversations')
+
+# 프로젝트 삭제 시 연결된 RSS 게시물에 쓰는 변경
+_UNLINKED_POST = {'has_cardnews': False, 'project_id': firestore.DELETE_FIELD}
+
+
+class _ChunkedBatch:
+    """
+    쓰기 수 한도를 넘지 않도록 여러 WriteBatch로 나누는 래퍼 (동기/비동기 클라이언트 공용)
+    
+    쓰기(서브컬렉션 문서 삭제 등)를 추가한 뒤 full()이면 take()로 꺼낸 배치를 커밋합니다.
+    """
+    
+    def __init__(self, db, limit: int = _BATCH_WRITE_LIMIT, headroom: int = 20):
+        self._db = db
+        self.limit = limit
+        self.headroom = headroom  # 쪼갤 수 없는 쓰기 묶음을 위한 여유분
+        self._batch = db.batch()
+        self.writes = 0
+    
+    def set(self, reference, data: Dict, merge: bool = False):
+        self._batch.set(reference, data, merge=merge)
+        self.writes += 1
+    
+    def update(self, reference, data: Dict):
+        self._batch.update(reference, data)
+        self.writes += 1
+    
+    def delete(self, reference):
+        self._batch.delete(reference)
+        self.writes += 1
+    
+    def full(self) -> bool:
+        return self.writes >= self.limit - self.headroom
+    
+    def take(self):
+        """현재 배치를 꺼내고 새 배치 시작 (쓰기가 없으면 None)"""
+        if not self.writes:
+            return None
+        
+        batch = self._batch
+        self._batch = self._db.batch()
+        self.writes = 0
+        return batch
+
+
+def _stage_project_unlink(transaction, db, project_id: str, item_docs, post_docs) -> Tuple[List[Tuple[str, Optional[Dict]]], int]:
+    """
+    프로젝트 문서 삭제와 연결 해제 쓰기를 트랜잭션에 추가 (동기/비동기 클라이언트 공용)
+    
+    item_docs / post_docs는 같은 트랜잭션에서 읽은 스냅샷이며, 그 사이 다른 삭제나 연결로
+    이 프로젝트를 가리키지 않게 된 문서는 건너뜁니다 (집계 카운터 중복 차감 방지).
+    
+    Returns:
+        ([(라이브러리 항목 키, 변경)] - 커밋 후 _library_item_written() 대상, 연결 해제한 게시물 수)
+    """
+    transaction.delete(db.collection('projects').document(project_id))
+    
+    unlinked = []
+    for doc in item_docs:
+        if doc.exists and ((doc.to_dict().get('project') or {}).get('id')) == project_id:
+            unlinked.append((doc.id, _unlink_library_item(transaction, doc, db.collection('library_stats'))))
+    
+    posts = [doc for doc in post_docs if doc.exists and doc.to_dict().get('project_id') == project_id]
+    for doc in posts:
+        transaction.update(doc.reference, _UNLINKED_POST)
+    
+    return unlinked, len(posts)
+
+
+def _new_delete_result() -> Dict[str, int]:
+    """프로젝트 삭제 결과 카운터"""
+    return {'projects': 0, **{name: 0 for name in _PROJECT_SUBCOLLECTIONS}, 'posts_unlinked': 0}
+
+
+def delete_projects(project_ids: List[str]) -> Dict[str, int]:
+    """
+    프로젝트 일괄 삭제 (서브컬렉션 포함, 최대 500 쓰기 단위 배치)
+    
+    서브컬렉션 문서를 먼저 배치로 지우고, 프로젝트 문서 삭제와 라이브러리 항목/카운터/
+    RSS 게시물 연결 해제는 프로젝트마다 한 트랜잭션으로 커밋합니다. 중간에 실패해도
+    프로젝트 문서가 남아 있으므로 다시 호출하면 이어서 정리됩니다.
+    
+    Args:
+        project_ids: 삭제할 프로젝트 ID 목록
+        
+    Returns:
+        {'projects', 'sections', 'conversations', 'posts_unlinked'} 삭제/정리 개수
+    """
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    project_ids = list(dict.fromkeys(project_ids))
+    result = _new_delete_result()
+    if not project_ids:
+        return result
+    
+    projects = db.collection('projects')
+    existing = {doc.id for doc in db.get_all([projects.document(pid) for pid in project_ids]) if doc.exists}
+    
+    writer = _ChunkedBatch(db)
+    unlinked = []
     
-    # 기존 게시물 확인
-    existing_doc = db.collection('rss_posts').document(post_id).get()
-    if existing_doc.exists:
+    def commit(force: bool = False):
+        if force or writer.full():
+            batch = writer.take()
+            if batch is not None:
+                batch.commit()
+    
+    for project_id in project_ids:
+        project_ref = projects.document(project_id)
+        
+        for name in _PROJECT_SUBCOLLECTIONS:
+            refs = [doc.reference for doc in project_ref.collection(name).select([]).stream()]
+            for ref in refs:
+                writer.delete(ref)
+                commit()
+            result[name] += len(refs)
+        commit(force=True)
+        
+        item_refs = [doc.reference for doc in _library_items_by_project(db.collection('library_items'), project_id).select([]).stream()]
+        post_refs = [doc.reference for doc in db.collection('rss_posts').where('project_id', '==', project_id).select([]).stream()]
+        
+        # 항목/게시물을 다시 읽고 연결 해제 + 카운터 차감 + 프로젝트 삭제를 한 트랜잭션으로
+        # (동시 삭제나 삭제와 겹친 연결이 카운터를 두 번 바꾸지 않도록)
+        def write(transaction):
+            item_docs = [ref.get(transaction=transaction) for ref in item_refs]
+            post_docs = [ref.get(transaction=transaction) for ref in post_refs]
+            return _stage_project_unlink(transaction, db, project_id, item_docs, post_docs)
+        
+        project_unlinked, posts_unlinked = _run_transaction(db, write)
+        unlinked += project_unlinked
+        result['posts_unlinked'] += posts_unlinked
+        if project_id in existing:
+            result['projects'] += 1
+    
+    for project_id in project_ids:
+        invalidate_project_cache(project_id)
+    for key, changes in unlinked:
+        _library_item_written(key, changes)
+    
+    logger.info(f"Projects deleted: {result}")
+    return result
+
+
+# ==================================================
+# RSS Posts (Phase 2.5)
+# ==================================================
+
+def create_rss_post(post_data: Dict) -> str:
+    """
+    RSS 게시물 생성 (DB 영구 저장)
+    
+    Args:
+        post_data: RSS 게시물 데이터
+        
+    Returns:
+        생성된 RSS 게시물 ID
+    """
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    # URL을 해시하여 ID 생성 (중복 방지)
+    post_id = _rss_post_id(post_data['url'])
+    
+    post_ref = db.collection('rss_posts').document(post_id)
+    item_ref = db.collection('library_items').document(post_id)
+    post_doc = _new_rss_post_data(post_id, post_data)
+    item = _library_item_from_post(post_doc)
+    
+    # 기존 게시물 / 라이브러리 항목 확인 후 새 게시물 저장 (라이브러리 항목 + 집계 카운터와 함께, 한 트랜잭션)
+    def write(transaction) -> bool:
+        if post_ref.get(transaction=transaction).exists:
+            return False
+        existing_item = item_ref.get(transaction=transaction).to_dict()
+        
+        transaction.set(post_ref, compress_fields(post_doc, 'rss_posts'))
+        transaction.set(item_ref, _library_item_stamped(item), merge=True)
+        _write_library_stats(
+            transaction,
+            db.collection('library_stats'),
+            _library_stats_state(existing_item),
+            _library_stats_state({**(existing_item or {}), **item})
+        )
+        return True
+    
+    if not _run_transaction(db, write):
         logger.info(f"RSS post already exists: {post_id}")
         return post_id
     
-    # 새 게시물 저장
-    post_doc = {
+    _library_item_written(post_id, item, post_doc['site_id'])
+    logger.info(f"RSS post created: {post_id}")
+    
+    return post_id
+
+
+def _rss_post_id(url: str) -> str:
+    """URL 해시 기반 RSS 게시물 ID"""
+    return hashlib.md5(url.encode()).hexdigest()
+
+
+def _new_rss_post_data(post_id: str, post_data: Dict) -> Dict:
+    """새 RSS 게시물 문서 데이터 생성"""
+    return {
         'id': post_id,
         'site_id': post_data['site_id'],
         'site_name': post_data['site_name'],
         'title': post_data['title'],
+        'title_original': post_data.get('title_original'),
         'url': post_data['url'],
         'content': post_data.get('content', ''),
         'summary': post_data.get('summary', ''),
+        'keywords': post_data.get('keywords', []),
         'author': post_data.get('author'),
         'published_at': post_data['published_at'],
         'crawled_at': datetime.now(timezone.utc),
         'has_cardnews': False,
         'project_id': None
     }
-    
-    db.collection('rss_posts').document(post_id).set(post_doc)
-    logger.info(f"RSS post created: {post_id}")
-    
-    return post_id
 
 
 def get_rss_post(post_id: str) -> Optional[Dict]:
@@ -637,7 +1487,7 @@ def get_rss_post(post_id: str) -> Optional[Dict]:
     if not doc.exists:
         return None
     
-    return doc.to_dict()
+    return decompress_fields(doc.to_dict(), 'rss_posts')
 
 
 def get_all_rss_posts(
@@ -668,48 +1518,10 @@ def get_all_rss_posts(
     try:
         logger.info(f"Querying RSS posts: site_id={site_id}, year_month={year_month}, limit={limit}")
         
-        query = db.collection('rss_posts')
+        since, until = _published_range(start_date, end_date, year_month)
+        query = _rss_posts_query(db.collection('rss_posts'), site_id, since, until, limit)
         
-        # ⚠️ Firestore 복합 쿼리 제한 우회:
-        # 여러 where + order_by를 사용하면 인덱스 필요
-        # → 단순 쿼리로 변경하고, 메모리에서 필터링
-        
-        # 사이트 필터만 적용 (where + order_by 조합 가능)
-        if site_id:
-            query = query.where('site_id', '==', site_id)
-        
-        # 최신순 정렬
-        query = query.order_by('published_at', direction='DESCENDING')
-        
-        # 제한 (성능 향상)
-        query = query.limit(limit)
-        
-        posts = []
-        for doc in query.stream():
-            post_data = doc.to_dict()
-            
-            # 메모리에서 날짜 필터링
-            if year_month:
-                published_at = post_data.get('published_at')
-                if published_at:
-                    if isinstance(published_at, datetime):
-                        post_month = published_at.strftime('%Y-%m')
-                        if post_month != year_month:
-                            continue
-            
-            if start_date:
-                published_at = post_data.get('published_at')
-                if published_at and isinstance(published_at, datetime):
-                    if published_at < start_date:
-                        continue
-            
-            if end_date:
-                published_at = post_data.get('published_at')
-                if published_at and isinstance(published_at, datetime):
-                    if published_at > end_date:
-                        continue
-            
-            posts.append(post_data)
+        posts = [decompress_fields(doc.to_dict(), 'rss_posts') for doc in query.stream()]
         
         logger.info(f"Successfully fetched {len(posts)} RSS posts")
         return posts
@@ -719,26 +1531,116 @@ def get_all_rss_posts(
         return []
 
 
-def update_rss_post(post_id: str, data: Dict) -> Dict:
+def _utc(value: datetime) -> datetime:
+    """naive datetime은 UTC로 간주"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def _published_range(
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    year_month: Optional[str]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    날짜 필터를 published_at 범위 [since, until)로 변환 (UTC 기준)
+    
+    end_date는 포함 조건이므로 1마이크로초 뒤를 until로 사용합니다.
+    
+    Examples:
+        >>> _published_range(None, None, '2025-12')
+        (datetime(2025, 12, 1, tzinfo=utc), datetime(2026, 1, 1, tzinfo=utc))
+    
+    Raises:
+        ValueError: 잘못된 year_month 형식
+    """
+    lower = []
+    upper = []
+    
+    if start_date:
+        lower.append(_utc(start_date))
+    if end_date:
+        upper.append(_utc(end_date) + timedelta(microseconds=1))
+    
+    if year_month:
+        try:
+            month_start = datetime.strptime(year_month, '%Y-%m').replace(tzinfo=timezone.utc)
+        except ValueError:
+            raise ValueError(f"Invalid year_month (expected YYYY-MM): {year_month}")
+        lower.append(month_start)
+        upper.append((month_start + timedelta(days=32)).replace(day=1))
+    
+    return (max(lower) if lower else None, min(upper) if upper else None)
+
+
+def _published_between(query, since: Optional[datetime], until: Optional[datetime]):
+    """published_at 범위 조건 추가 (동기/비동기 클라이언트 공용)"""
+    if since:
+        query = query.where('published_at', '>=', since)
+    if until:
+        query = query.where('published_at', '<', until)
+    return query
+
+
+def _rss_posts_query(
+    collection,
+    site_id: Optional[str],
+    since: Optional[datetime],
+    until: Optional[datetime],
+    limit: int
+):
+    """
+    RSS 게시물 최신순 쿼리 (동기/비동기 클라이언트 공용)
+    
+    site_id 조건과 published_at 범위를 함께 쓰므로
+    (site_id, published_at DESC) 복합 인덱스를 사용합니다.
+    """
+    query = collection
+    if site_id:
+        query = query.where('site_id', '==', site_id)
+    
+    query = _published_between(query, since, until)
+    query = query.order_by('published_at', direction=firestore.Query.DESCENDING)
+    
+    return query.limit(limit)
+
+
+def update_rss_post(
+    post_id: str,
+    data: Dict,
+    current: Optional[Dict] = None,
+    refetch: bool = False
+) -> Optional[Dict]:
     """
     RSS 게시물 업데이트
     
     Args:
         post_id: RSS 게시물 ID
         data: 업데이트할 데이터
+        current: 이미 조회한 게시물 (있으면 병합 결과 반환, 추가 읽기 없음)
+        refetch: True면 업데이트 후 다시 조회
         
     Returns:
-        업데이트된 RSS 게시물
+        업데이트된 RSS 게시물 (current/refetch 둘 다 없으면 None)
     """
     db = get_db()
     if db is None:
         raise ValueError("Firestore not initialized")
     
-    db.collection('rss_posts').document(post_id).update(data)
+    # 피드 표시 필드가 바뀌면 라이브러리 항목도 같은 배치로 갱신
+    batch = None
+    item_changes = _library_post_changes(data)
+    if item_changes:
+        batch = db.batch()
+        batch.set(db.collection('library_items').document(post_id), _library_item_stamped(item_changes), merge=True)
+    
+    stored = compress_fields(data, 'rss_posts')
+    result = decompress_fields(_apply_update(db.collection('rss_posts').document(post_id), stored, current, refetch, batch), 'rss_posts')
     logger.info(f"RSS post updated: {post_id}")
     
-    doc = db.collection('rss_posts').document(post_id).get()
-    return doc.to_dict() if doc.exists else None
+    if batch is not None:
+        _library_item_written(post_id, item_changes, (current or {}).get('site_id'))
+    
+    return result
 
 
 def update_rss_post_project_link(post_id: str, project_id: str):
@@ -753,10 +1655,570 @@ def update_rss_post_project_link(post_id: str, project_id: str):
     if db is None:
         raise ValueError("Firestore not initialized")
     
-    db.collection('rss_posts').document(post_id).update({
-        'has_cardnews': True,
-        'project_id': project_id
-    })
+    item_ref = db.collection('library_items').document(post_id)
+    item_changes = {'project': {'id': project_id}}
+    
+    # 항목 읽기와 집계 카운터 Increment를 한 트랜잭션으로 (동시 연결 시 중복 집계 방지)
+    def write(transaction):
+        existing = item_ref.get(transaction=transaction).to_dict()
+        transaction.update(db.collection('rss_posts').document(post_id), {
+            'has_cardnews': True,
+            'project_id': project_id
+        })
+        transaction.set(item_ref, _library_item_stamped(item_changes), merge=True)
+        _write_library_stats(
+            transaction,
+            db.collection('library_stats'),
+            _library_stats_state(existing),
+            _library_stats_state({**(existing or {}), **item_changes})
+        )
+    
+    _run_transaction(db, write)
+    _library_item_written(post_id, item_changes)
     
     logger.info(f"RSS post linked to project: {post_id} -> {project_id}")
 
+
+# ==================================================
+# Library Items (라이브러리 피드 materialized 컬렉션)
+# ==================================================
+#
+# library_items/{md5(url)}: 원본 URL 하나당 문서 하나
+#   key, url, site_id, published_at   정렬/필터 키 (site_id, published_at DESC, key DESC)
+#   post: {...}                       RSS 게시물 표시 필드 (create_rss_post / update_rss_post)
+#   project: {...}                    카드뉴스 프로젝트 표시 필드 (create_project / update_project)
+#   updated_at                        마지막 쓰기 시각 (검색 색인 스냅샷 보정)
+#
+# 게시물과 프로젝트가 서로 다른 맵을 쓰므로 쓰기 순서와 관계없이 병합되며,
+# project가 있으면 피드에 프로젝트로 표시됩니다.
+
+# 라이브러리 항목에 복사하는 필드 (원본 필드 → 항목 맵 필드)
+_LIBRARY_POST_FIELDS = {
+    'title': 'title',
+    'title_original': 'title_original',
+    'site_name': 'site_name',
+    'summary': 'summary',
+    'keywords': 'keywords'
+}
+_LIBRARY_PROJECT_FIELDS = {
+    'title': 'title',
+    'source_site_name': 'site_name',
+    'source_url': 'site_url',
+    'summary': 'summary',
+    'keywords': 'keywords',
+    'status': 'status'
+}
+
+
+def _library_key(url: str) -> str:
+    """라이브러리 항목 키 (RSS 게시물 ID와 동일한 URL 해시)"""
+    return _rss_post_id(url)
+
+
+def _library_item_from_post(post: Dict) -> Dict:
+    """RSS 게시물 → 라이브러리 항목 (set merge용)"""
+    item_post = {target: post.get(field) for field, target in _LIBRARY_POST_FIELDS.items()}
+    item_post['id'] = post['id']
+    item_post['crawled_at'] = post.get('crawled_at')
+    
+    return {
+        'key': post['id'],
+        'url': post['url'],
+        'site_id': post['site_id'],
+        'published_at': post['published_at'],
+        'post': item_post
+    }
+
+
+def _library_item_from_project(project: Dict) -> Dict:
+    """RSS 프로젝트 → 라이브러리 항목 (set merge용)"""
+    item_project = {target: project.get(field) for field, target in _LIBRARY_PROJECT_FIELDS.items()}
+    item_project['id'] = project['id']
+    item_project['created_at'] = project.get('created_at')
+    
+    return {
+        'key': project['library_key'],
+        'url': project['source_url'],
+        'site_id': project.get('source_site_id'),
+        'published_at': project['published_at'],
+        'project': item_project
+    }
+
+
+def _library_post_changes(data: Dict) -> Optional[Dict]:
+    """RSS 게시물 업데이트 중 라이브러리 항목에 반영할 변경 (없으면 None)"""
+    changes = {target: data[field] for field, target in _LIBRARY_POST_FIELDS.items() if field in data}
+    return {'post': changes} if changes else None
+
+
+def _library_project_changes(data: Dict) -> Optional[Dict]:
+    """프로젝트 업데이트 중 라이브러리 항목에 반영할 변경 (없으면 None)"""
+    changes = {target: data[field] for field, target in _LIBRARY_PROJECT_FIELDS.items() if field in data}
+    return {'project': changes} if changes else None
+
+
+def _library_item_stamped(changes: Dict) -> Dict:
+    """library_items에 쓸 변경 + updated_at (검색 색인 스냅샷 로드 후 이후 변경분 조회용)"""
+    return {**changes, 'updated_at': datetime.utcnow()}
+
+
+def _library_items_by_project(collection, project_id: str):
+    """프로젝트에 연결된 라이브러리 항목 쿼리 (동기/비동기 클라이언트 공용)"""
+    return collection.where('project.id', '==', project_id).limit(1)
+
+
+def _unlink_library_item(batch, item_doc, stats_collection) -> Optional[Dict]:
+    """
+    프로젝트 삭제 시 라이브러리 항목 정리 (게시물이 있으면 게시물로 되돌리고, 없으면 삭제)
+    
+    Returns:
+        항목 변경 ({'project': None}) 또는 None (항목 삭제)
+    """
+    item = item_doc.to_dict()
+    
+    if item.get('post'):
+        batch.update(item_doc.reference, _library_item_stamped({'project': firestore.DELETE_FIELD}))
+        changes = {'project': None}
+        after = _library_stats_state({**item, **changes})
+    else:
+        batch.delete(item_doc.reference)
+        changes = None
+        after = None
+    
+    _write_library_stats(batch, stats_collection, _library_stats_state(item), after)
+    return changes
+
+
+def _library_item_written(key: str, changes: Optional[Dict], site_id: Optional[str] = None):
+    """
+    라이브러리 항목 쓰기 커밋 후처리 (검색 색인 반영, 피드 캐시 무효화)
+    
+    Args:
+        key: 라이브러리 항목 키
+        changes: library_items에 쓴 변경 (None이면 항목 삭제)
+        site_id: 항목의 사이트 (모르면 None → 캐시 전체 무효화)
+    """
+    if changes is None:
+        get_search_index().remove(key)
+    else:
+        get_search_index().apply(key, changes)
+    
+    invalidate_library_cache(site_id)
+    get_change_recorder().library_written(key)
+
+
+# library_stats/{_all | site_id}: 라이브러리 항목 사전 집계 카운터
+#   items, cardnews                    전체 항목 수 / 카드뉴스가 있는 항목 수
+#   months: {YYYY-MM: {items, cardnews}}
+#   sites: {site_id: {items, cardnews}}   (_all 문서만)
+#
+# 항목의 집계 상태 (site_id, 월, has_cardnews)가 바뀌는 쓰기에서 같은 배치로 Increment합니다.
+
+LIBRARY_STATS_ALL = '_all'
+_NO_SITE = '_none'
+
+
+def _library_stats_state(item: Optional[Dict]) -> Optional[Tuple[Optional[str], Optional[str], bool]]:
+    """라이브러리 항목의 집계 상태 (피드에 나오지 않는 항목은 None)"""
+    if not item or not (item.get('post') or item.get('project')):
+        return None
+    
+    published_at = item.get('published_at')
+    if not isinstance(published_at, datetime):
+        return None
+    
+    return (item.get('site_id'), _utc(published_at).strftime('%Y-%m'), bool(item.get('project')))
+
+
+def _library_stats_deltas(before, after) -> Dict[str, Dict[Tuple[str, ...], int]]:
+    """
+    집계 상태 변화 → 카운터 문서별 증감
+    
+    Returns:
+        {문서 ID: {필드 경로: 증감}} (변화가 없으면 빈 딕셔너리)
+    """
+    deltas: Dict[str, Dict[Tuple[str, ...], int]] = {}
+    
+    for state, sign in ((before, -1), (after, 1)):
+        if state is None:
+            continue
+        
+        site_id, month, has_cardnews = state
+        buckets = {LIBRARY_STATS_ALL: [(), ('months', month), ('sites', site_id or _NO_SITE)]}
+        if site_id:
+            buckets[site_id] = [(), ('months', month)]
+        
+        counters = ('items', 'cardnews') if has_cardnews else ('items',)
+        for doc_id, prefixes in buckets.items():
+            doc = deltas.setdefault(doc_id, {})
+            for prefix in prefixes:
+                for counter in counters:
+                    path = prefix + (counter,)
+                    doc[path] = doc.get(path, 0) + sign
+    
+    return {
+        doc_id: {path: delta for path, delta in doc.items() if delta}
+        for doc_id, doc in deltas.items()
+        if any(doc.values())
+    }
+
+
+def _nest(paths: Dict[Tuple[str, ...], object]) -> Dict:
+    """{('months', '2025-12', 'items'): v} → {'months': {'2025-12': {'items': v}}}"""
+    nested: Dict = {}
+    for path, value in paths.items():
+        node = nested
+        for part in path[:-1]:
+            node = node.setdefault(part, {})
+        node[path[-1]] = value
+    return nested
+
+
+def _write_library_stats(batch, collection, before, after) -> bool:
+    """
+    집계 상태 변화를 카운터 문서 Increment로 배치에 추가 (동기/비동기 클라이언트 공용)
+    
+    Args:
+        batch: WriteBatch 또는 Transaction
+        collection: library_stats 컬렉션
+        before: 쓰기 전 _library_stats_state
+        after: 쓰기 후 _library_stats_state
+        
+    Returns:
+        카운터 변경 여부
+    """
+    deltas = _library_stats_deltas(before, after)
+    
+    for doc_id, paths in deltas.items():
+        data = _nest({path: firestore.Increment(delta) for path, delta in paths.items()})
+        if doc_id != LIBRARY_STATS_ALL:
+            data['site_id'] = doc_id
+        batch.set(collection.document(doc_id), data, merge=True)
+    
+    return bool(deltas)
+
+
+def _library_stats_view(doc: Optional[Dict], year_month: Optional[str] = None) -> Optional[Dict]:
+    """카운터 문서 → {'items', 'cardnews'} (연월 지정 시 해당 월, 문서가 없으면 None)"""
+    if doc is None:
+        return None
+    
+    counts = doc
+    if year_month:
+        counts = (doc.get('months') or {}).get(year_month) or {}
+    
+    return {'items': counts.get('items', 0), 'cardnews': counts.get('cardnews', 0)}
+
+
+def _project_library_key(db, project_id: str, current: Optional[Dict]) -> Optional[str]:
+    """프로젝트의 라이브러리 항목 키 (current가 있으면 읽기 없음)"""
+    if current is not None:
+        return current.get('library_key')
+    
+    for doc in _library_items_by_project(db.collection('library_items'), project_id).stream():
+        return doc.id
+    return None
+
+
+def _library_items_query(
+    collection,
+    site_id: Optional[str],
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+):
+    """
+    라이브러리 항목 기본 쿼리 (동기/비동기 클라이언트 공용)
+    
+    (site_id, published_at DESC, key DESC) 복합 인덱스를 사용합니다.
+    (firestore.indexes.json 참고)
+    """
+    query = collection
+    if site_id:
+        query = query.where('site_id', '==', site_id)
+    return _published_between(query, since, until)
+
+
+def _library_page_query(
+    collection,
+    site_id: Optional[str],
+    after: Optional[Dict],
+    limit: int,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+):
+    """키셋 페이지 쿼리: after = {'published_at', 'key'} 이후 limit개"""
+    query = _library_items_query(collection, site_id, since, until)
+    query = query.order_by('published_at', direction=firestore.Query.DESCENDING)
+    query = query.order_by('key', direction=firestore.Query.DESCENDING)
+    
+    if after:
+        query = query.start_after(after)
+    
+    return query.limit(limit)
+
+
+def get_library_items_batch(
+    site_id: Optional[str] = None,
+    after: Optional[Dict] = None,
+    limit: int = 20,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> List[Dict]:
+    """
+    라이브러리 항목 키셋 조회 (published_at DESC, key DESC)
+    
+    Args:
+        site_id: 사이트 ID 필터
+        after: 마지막으로 읽은 항목의 {'published_at', 'key'} (None이면 처음부터)
+        limit: 최대 개수
+        since: published_at 하한 (포함)
+        until: published_at 상한 (제외)
+        
+    Returns:
+        라이브러리 항목 리스트
+    """
+    db = get_db()
+    if db is None:
+        return []
+    
+    query = _library_page_query(db.collection('library_items'), site_id, after, limit, since, until)
+    return [doc.to_dict() for doc in query.stream()]
+
+
+def get_library_items(keys: List[str]) -> List[Dict]:
+    """
+    라이브러리 항목 일괄 조회 (단일 요청)
+    
+    Args:
+        keys: 라이브러리 항목 키 목록
+        
+    Returns:
+        keys 순서대로의 항목 (없는 항목은 제외)
+    """
+    db = get_db()
+    if db is None or not keys:
+        return []
+    
+    refs = [db.collection('library_items').document(key) for key in keys]
+    found = {doc.id: doc.to_dict() for doc in db.get_all(refs) if doc.exists}
+    
+    return [found[key] for key in keys if key in found]
+
+
+def get_all_library_items() -> List[Dict]:
+    """라이브러리 항목 전체 조회 (검색 색인 재구축용)"""
+    db = get_db()
+    if db is None:
+        return []
+    
+    return [doc.to_dict() for doc in db.collection('library_items').stream()]
+
+
+def get_library_items_updated_since(since: datetime) -> List[Dict]:
+    """updated_at이 since 이후인 라이브러리 항목 (검색 색인 스냅샷 보정용)"""
+    db = get_db()
+    if db is None:
+        return []
+    
+    query = db.collection('library_items').where('updated_at', '>=', since)
+    return [doc.to_dict() for doc in query.stream()]
+
+
+def count_library_items(
+    site_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> int:
+    """라이브러리 항목 수 (count 집계 쿼리, published_at 범위 [since, until))"""
+    db = get_db()
+    if db is None:
+        return 0
+    
+    query = _library_items_query(db.collection('library_items'), site_id, since, until)
+    result = query.count().get()
+    
+    return int(result[0][0].value)
+
+
+def get_library_stats(site_id: Optional[str] = None) -> Optional[Dict]:
+    """
+    라이브러리 사전 집계 카운터 조회 (문서 1개 읽기)
+    
+    Args:
+        site_id: 사이트 ID (None이면 전체 + 사이트별 집계)
+        
+    Returns:
+        카운터 문서 (아직 집계되지 않았으면 None)
+    """
+    db = get_db()
+    if db is None:
+        return None
+    
+    doc = db.collection('library_stats').document(site_id or LIBRARY_STATS_ALL).get()
+    return doc.to_dict() if doc.exists else None
+
+
+# ==================================================
+# Worker Tasks (API 프로세스 → 워커 프로세스 작업 큐)
+# ==================================================
+#
+# worker_tasks/{id}: API가 넣고 워커(python -m app.worker)가 꺼내 실행하는 작업
+#   type: sync_site | crawl_site | create_cardnews
+#   status: queued → running → completed | failed
+# worker_events/{id}: 워커가 쓴 라이브러리 항목/프로젝트 키 (API가 검색 색인/캐시에 반영)
+# worker_state/worker: 워커 heartbeat
+#
+# 작업과 이벤트는 expires_at(TTL)으로 자동 삭제됩니다. (firestore.indexes.json 참고)
+
+WORKER_TASK_RETENTION = timedelta(days=1)
+WORKER_EVENT_RETENTION = timedelta(hours=1)
+
+
+def _new_worker_task_data(task_type: str, payload: Dict) -> Dict:
+    """새 워커 작업 문서 데이터 생성"""
+    now = datetime.now(timezone.utc)
+    
+    return {
+        'id': str(uuid.uuid4()),
+        'type': task_type,
+        'payload': payload,
+        'status': 'queued',
+        'result': None,
+        'error': None,
+        'created_at': now,
+        'started_at': None,
+        'completed_at': None,
+        'expires_at': now + WORKER_TASK_RETENTION
+    }
+
+
+def _worker_tasks_query(collection, status: str, limit: int):
+    """
+    상태별 워커 작업 쿼리 (오래된 순, 동기/비동기 클라이언트 공용)
+    
+    (status ASC, created_at ASC) 복합 인덱스를 사용합니다.
+    """
+    return collection.where('status', '==', status).order_by('created_at').limit(limit)
+
+
+def create_worker_task(task_type: str, payload: Dict) -> Dict:
+    """
+    워커 작업 추가
+    
+    Args:
+        task_type: 작업 종류
+        payload: 작업 인자
+        
+    Returns:
+        생성된 작업
+    """
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    task = _new_worker_task_data(task_type, payload)
+    db.collection('worker_tasks').document(task['id']).set(task)
+    logger.info(f"Worker task queued: {task_type} ({task['id']})")
+    
+    return task
+
+
+def get_worker_task(task_id: str) -> Optional[Dict]:
+    """워커 작업 조회"""
+    db = get_db()
+    if db is None:
+        return None
+    
+    doc = db.collection('worker_tasks').document(task_id).get()
+    return doc.to_dict() if doc.exists else None
+
+
+def get_worker_tasks(status: str = 'queued', limit: int = 10) -> List[Dict]:
+    """상태별 워커 작업 목록 (오래된 순)"""
+    db = get_db()
+    if db is None:
+        return []
+    
+    query = _worker_tasks_query(db.collection('worker_tasks'), status, limit)
+    return [doc.to_dict() for doc in query.stream()]
+
+
+def update_worker_task(task_id: str, data: Dict):
+    """워커 작업 상태/결과 갱신"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    db.collection('worker_tasks').document(task_id).update(data)
+
+
+def transition_worker_task(task_id: str, expected_status: str, data: Dict) -> bool:
+    """
+    워커 작업 상태 전이 (현재 상태가 expected_status일 때만, 트랜잭션)
+    
+    워커의 queued → running과 API의 queued → cancelled가 겹쳐도 한쪽만 성공합니다.
+    
+    Args:
+        task_id: 작업 ID
+        expected_status: 전이 전 상태
+        data: 갱신할 필드 (status 포함)
+        
+    Returns:
+        전이 여부 (작업이 없거나 이미 다른 상태면 False)
+    """
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    task_ref = db.collection('worker_tasks').document(task_id)
+    
+    def write(transaction) -> bool:
+        task = task_ref.get(transaction=transaction).to_dict()
+        if task is None or task['status'] != expected_status:
+            return False
+        transaction.update(task_ref, data)
+        return True
+    
+    return _run_transaction(db, write)
+
+
+def create_worker_event(changes: Dict) -> Dict:
+    """
+    워커 변경 알림 저장
+    
+    Args:
+        changes: {'library_keys': [...], 'project_ids': [...]}
+    """
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    now = datetime.now(timezone.utc)
+    event = {
+        'id': str(uuid.uuid4()),
+        **changes,
+        'created_at': now,
+        'expires_at': now + WORKER_EVENT_RETENTION
+    }
+    db.collection('worker_events').document(event['id']).set(event)
+    
+    return event
+
+
+def _worker_events_query(collection, since: datetime, limit: int):
+    """
+    since 이후 워커 변경 알림 쿼리 (오래된 순, 동기/비동기 클라이언트 공용)
+    
+    같은 시각에 저장된 알림을 놓치지 않도록 since 시각의 알림도 포함합니다.
+    (이미 반영한 알림은 호출하는 쪽에서 id로 거릅니다)
+    """
+    return collection.where('created_at', '>=', since).order_by('created_at').limit(limit)
+
+
+def set_worker_heartbeat(data: Dict):
+    """워커 상태 저장 (updated_at 자동 기록)"""
+    db = get_db()
+    if db is None:
+        return
+    
+    db.collection('worker_state').document('worker').set({**data, 'updated_at': datetime.now(timezone.utc)})
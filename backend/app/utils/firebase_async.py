@@ -0,0 +1,886 @@
+"""
+Firebase Firestore 비동기 연동 유틸리티 (FastAPI 라우터용)
+
+`app.utils.firebase`와 동일한 함수 이름과 동작을 제공하지만 Firestore
+AsyncClient를 사용하므로 이벤트 루프를 막지 않습니다.
+스케줄러/크롤러 등 동기 코드는 기존 `app.utils.firebase`를 사용합니다.
+"""
+
+from firebase_admin import firestore, firestore_async
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+import copy
+import logging
+
+from app.config import settings
+from app.utils import firebase as _sync
+from app.utils.cache import get_project_cache, invalidate_project_cache
+from app.utils.compression import compress_fields, decompress_fields
+from app.utils.sqlite_store import AsyncSQLiteClient
+from app.utils.firebase import (
+    _new_project_data,
+    _new_section_data,
+    _plan_section_replace,
+    _stage_section_replace,
+    _sections_query,
+    _stamp_sections,
+    _new_conversation_data,
+    _new_site_data,
+    _new_crawl_log_data,
+    _crawl_logs_query,
+    _crawl_logs_page,
+    _rss_post_id,
+    _new_rss_post_data,
+    _published_range,
+    _rss_posts_query,
+    _library_item_from_post,
+    _library_item_from_project,
+    _library_post_changes,
+    _library_project_changes,
+    _library_items_by_project,
+    _library_item_stamped,
+    _projects_list_query,
+    _project_ids_query,
+    _PROJECT_SUBCOLLECTIONS,
+    _ChunkedBatch,
+    _stage_project_unlink,
+    _new_delete_result,
+    _library_item_written,
+    _library_items_query,
+    _library_page_query,
+    _library_stats_state,
+    _write_library_stats,
+    _new_worker_task_data,
+    _worker_events_query,
+    LIBRARY_STATS_ALL,
+    PROJECT_LIST_FIELDS
+)
+
+logger = logging.getLogger(__name__)
+
+# AsyncClient (Firebase 앱 초기화 후 최초 사용 시 생성)
+_db = None
+
+
+def get_db():
+    """Firestore AsyncClient (SQLite 저장소면 같은 API의 비동기 래퍼) 가져오기"""
+    global _db
+    if _db is None:
+        # 백엔드 선택과 Firebase 앱 초기화는 동기 모듈과 공유
+        sync_db = _sync.get_db()
+        if sync_db is None:
+            return None
+        if _sync.is_local_storage():
+            _db = AsyncSQLiteClient(sync_db)
+        else:
+            _db = firestore_async.client()
+    return _db
+
+
+async def _run_transaction(db, func):
+    """코루틴 함수 func(transaction)을 트랜잭션으로 실행 (동기 모듈 _run_transaction과 같은 규칙)"""
+    transaction = db.transaction()
+    if _sync.is_local_storage():
+        return await transaction.run(func)
+    return await firestore_async.async_transactional(func)(transaction)
+
+
+async def _apply_update(
+    doc_ref,
+    data: Dict,
+    current: Optional[Dict] = None,
+    refetch: bool = False,
+    batch=None
+) -> Optional[Dict]:
+    """문서 업데이트 후 반환값 결정 (`firebase._apply_update`와 동일)"""
+    if batch is not None:
+        batch.update(doc_ref, data)
+        await batch.commit()
+    else:
+        await doc_ref.update(data)
+    
+    if refetch:
+        doc = await doc_ref.get()
+        return doc.to_dict() if doc.exists else None
+    
+    if current is not None:
+        return {**current, **data}
+    
+    return None
+
+
+# 프로젝트 CRUD
+
+async def create_project(data: Dict) -> Dict:
+    """프로젝트 생성"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    project_data = _new_project_data(data)
+    project_id = project_data['id']
+    project_ref = db.collection('projects').document(project_id)
+    stored = compress_fields(project_data, 'projects')
+    
+    # RSS 프로젝트는 라이브러리 항목(+ 집계 카운터)과 함께 트랜잭션으로 저장
+    if project_data.get('library_key'):
+        item = _library_item_from_project(project_data)
+        item_ref = db.collection('library_items').document(project_data['library_key'])
+        
+        async def write(transaction):
+            existing = (await item_ref.get(transaction=transaction)).to_dict()
+            transaction.set(project_ref, stored)
+            transaction.set(item_ref, _library_item_stamped(item), merge=True)
+            _write_library_stats(
+                transaction,
+                db.collection('library_stats'),
+                _library_stats_state(existing),
+                _library_stats_state({**(existing or {}), **item})
+            )
+        
+        await _run_transaction(db, write)
+    else:
+        await project_ref.set(stored)
+    logger.info(f"Project created: {project_id}")
+    
+    if project_data.get('library_key'):
+        _library_item_written(project_data['library_key'], item, project_data.get('source_site_id'))
+    
+    return project_data
+
+
+async def get_project(project_id: str) -> Optional[Dict]:
+    """
+    프로젝트 조회
+    
+    Raises:
+        ValueError: Firestore가 초기화되지 않은 경우
+    """
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    cache = get_project_cache()
+    project = cache.get(('project', project_id))
+    if project is not None:
+        return copy.deepcopy(project)
+    
+    version = cache.version()
+    doc = await db.collection('projects').document(project_id).get()
+    
+    if doc.exists:
+        project = decompress_fields(doc.to_dict(), 'projects')
+        cache.put(('project', project_id), project, version)
+        return copy.deepcopy(project)
+    return None
+
+
+async def update_project(
+    project_id: str,
+    data: Dict,
+    current: Optional[Dict] = None,
+    refetch: bool = False
+) -> Optional[Dict]:
+    """프로젝트 업데이트"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    data['updated_at'] = datetime.utcnow()
+    
+    # 피드 표시 필드가 바뀌면 라이브러리 항목도 같은 배치로 갱신
+    batch = None
+    item_changes = _library_project_changes(data)
+    if item_changes:
+        library_key = await _project_library_key(db, project_id, current)
+        if library_key:
+            batch = db.batch()
+            batch.set(db.collection('library_items').document(library_key), _library_item_stamped(item_changes), merge=True)
+    
+    stored = compress_fields(data, 'projects')
+    result = decompress_fields(await _apply_update(db.collection('projects').document(project_id), stored, current, refetch, batch), 'projects')
+    invalidate_project_cache(project_id, sections=False)
+    logger.info(f"Project updated: {project_id}")
+    
+    if batch is not None:
+        _library_item_written(library_key, item_changes, (current or {}).get('source_site_id'))
+    
+    return result
+
+
+# 섹션 CRUD
+
+async def create_sections(project_id: str, sections: List[Dict]) -> List[Dict]:
+    """카드 섹션 생성 (단일 배치 커밋)"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    sections_ref = db.collection('projects').document(project_id).collection('sections')
+    batch = db.batch()
+    created_sections = []
+    
+    for section in sections:
+        section_data = _new_section_data(project_id, section)
+        batch.set(sections_ref.document(section_data['id']), section_data)
+        created_sections.append(section_data)
+    _stamp_sections(batch, db, project_id)
+    
+    await batch.commit()
+    invalidate_project_cache(project_id, project=False)
+    
+    logger.info(f"Created {len(created_sections)} sections for project {project_id}")
+    return created_sections
+
+
+async def replace_sections(project_id: str, sections: List[Dict]) -> List[Dict]:
+    """섹션 전체 교체 (저장된 섹션 조회 + diff 쓰기를 한 트랜잭션으로)"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    async def write(transaction):
+        existing_sections = await _fetch_sections(db, project_id, transaction=transaction)
+        plan = _plan_section_replace(project_id, sections, existing_sections)
+        _stage_section_replace(transaction, db, project_id, *plan[1:])
+        return plan
+    
+    result, to_create, to_update, to_delete = await _run_transaction(db, write)
+    
+    if to_create or to_update or to_delete:
+        invalidate_project_cache(project_id, project=False)
+    
+    logger.info(
+        f"Sections replaced for project {project_id}: "
+        f"{len(to_create)} created, {len(to_update)} updated, {len(to_delete)} deleted"
+    )
+    return result
+
+
+async def get_sections(project_id: str) -> List[Dict]:
+    """프로젝트의 섹션 목록 조회 (order 순)"""
+    db = get_db()
+    if db is None:
+        return []
+    
+    cache = get_project_cache()
+    sections = cache.get(('sections', project_id))
+    if sections is not None:
+        return copy.deepcopy(sections)
+    
+    version = cache.version()
+    sections = await _fetch_sections(db, project_id)
+    cache.put(('sections', project_id), sections, version)
+    
+    return copy.deepcopy(sections)
+
+
+async def _fetch_sections(db, project_id: str, transaction=None) -> List[Dict]:
+    """저장된 섹션 목록 조회 (캐시 사용 안 함, transaction이 있으면 트랜잭션 읽기)"""
+    return [doc.to_dict() async for doc in _sections_query(db, project_id).stream(transaction=transaction)]
+
+
+async def update_section(
+    project_id: str,
+    section_id: str,
+    data: Dict,
+    current: Optional[Dict] = None,
+    refetch: bool = False
+) -> Optional[Dict]:
+    """섹션 업데이트"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    data['updated_at'] = datetime.utcnow()
+    
+    doc_ref = db.collection('projects').document(project_id)\
+                .collection('sections').document(section_id)
+    
+    batch = None
+    if settings.PROJECT_CACHE_LISTEN:
+        batch = db.batch()
+        _stamp_sections(batch, db, project_id)
+    
+    result = await _apply_update(doc_ref, data, current, refetch, batch)
+    invalidate_project_cache(project_id, project=False)
+    
+    logger.info(f"Section updated: {section_id}")
+    
+    return result
+
+
+async def delete_section(project_id: str, section_id: str):
+    """섹션 삭제"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    doc_ref = db.collection('projects').document(project_id)\
+                .collection('sections').document(section_id)
+    
+    if settings.PROJECT_CACHE_LISTEN:
+        batch = db.batch()
+        batch.delete(doc_ref)
+        _stamp_sections(batch, db, project_id)
+        await batch.commit()
+    else:
+        await doc_ref.delete()
+    invalidate_project_cache(project_id, project=False)
+    
+    logger.info(f"Section deleted: {section_id}")
+
+
+# 대화 이력 저장
+
+async def save_conversation(project_id: str, user_message: str, ai_response: str):
+    """대화 이력 저장"""
+    db = get_db()
+    if db is None:
+        return
+    
+    conversation_data = _new_conversation_data(user_message, ai_response)
+    
+    await db.collection('projects').document(project_id)\
+            .collection('conversations').document(conversation_data['id']).set(conversation_data)
+    
+    logger.info(f"Conversation saved for project {project_id}")
+
+
+async def get_conversations(project_id: str, limit: int = 10) -> List[Dict]:
+    """대화 이력 조회 (오래된 것부터)"""
+    db = get_db()
+    if db is None:
+        return []
+    
+    conversations_ref = db.collection('projects').document(project_id)\
+                          .collection('conversations')\
+                          .order_by('timestamp', direction=firestore.Query.DESCENDING)\
+                          .limit(limit)
+    
+    conversations = [doc.to_dict() async for doc in conversations_ref.stream()]
+    conversations.reverse()
+    
+    return conversations
+
+
+# Sites CRUD
+
+async def create_site(data: Dict) -> Dict:
+    """사이트 생성"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    site_data = _new_site_data(data)
+    site_id = site_data['id']
+    
+    await db.collection('sites').document(site_id).set(site_data)
+    logger.info(f"Site created: {site_id}")
+    
+    return site_data
+
+
+async def get_site(site_id: str) -> Optional[Dict]:
+    """사이트 조회"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    doc = await db.collection('sites').document(site_id).get()
+    return doc.to_dict() if doc.exists else None
+
+
+async def get_all_sites() -> List[Dict]:
+    """모든 사이트 조회"""
+    db = get_db()
+    if db is None:
+        return []
+    
+    sites_ref = db.collection('sites').order_by('created_at', direction=firestore.Query.DESCENDING)
+    return [doc.to_dict() async for doc in sites_ref.stream()]
+
+
+async def update_site(
+    site_id: str,
+    data: Dict,
+    current: Optional[Dict] = None,
+    refetch: bool = False
+) -> Optional[Dict]:
+    """사이트 업데이트"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    data['updated_at'] = datetime.utcnow()
+    
+    result = await _apply_update(db.collection('sites').document(site_id), data, current, refetch)
+    logger.info(f"Site updated: {site_id}")
+    
+    return result
+
+
+async def delete_site(site_id: str):
+    """사이트 삭제"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    await db.collection('sites').document(site_id).delete()
+    logger.info(f"Site deleted: {site_id}")
+
+
+# CrawlLogs CRUD
+
+async def create_crawl_log(data: Dict) -> Dict:
+    """크롤링 로그 생성"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    log_data = _new_crawl_log_data(data)
+    log_id = log_data['id']
+    
+    await db.collection('crawl_logs').document(log_id).set(log_data)
+    logger.info(f"Crawl log created: {log_id}")
+    
+    return log_data
+
+
+async def update_crawl_log(
+    log_id: str,
+    data: Dict,
+    current: Optional[Dict] = None,
+    refetch: bool = False
+) -> Optional[Dict]:
+    """크롤링 로그 업데이트"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    result = await _apply_update(db.collection('crawl_logs').document(log_id), data, current, refetch)
+    logger.info(f"Crawl log updated: {log_id}")
+    
+    return result
+
+
+async def get_crawl_logs_page(
+    site_id: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None
+) -> Dict:
+    """
+    크롤링 로그 페이지 조회 (최신순, 커서 기반)
+    
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    db = get_db()
+    if db is None:
+        return {'logs': [], 'next_cursor': None}
+    
+    query = _crawl_logs_query(db.collection('crawl_logs'), site_id, cursor, limit + 1)
+    logs = [doc.to_dict() async for doc in query.stream()]
+    
+    return _crawl_logs_page(logs, limit)
+
+
+async def get_crawl_logs(site_id: Optional[str] = None, limit: int = 50) -> List[Dict]:
+    """크롤링 로그 조회"""
+    try:
+        return (await get_crawl_logs_page(site_id=site_id, limit=limit))['logs']
+    except Exception as e:
+        logger.error(f"Failed to get crawl logs: {str(e)}")
+        return []
+
+
+# Projects 목록 조회
+
+async def get_all_projects(
+    limit: int = 100,
+    status: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = PROJECT_LIST_FIELDS
+) -> List[Dict]:
+    """모든 프로젝트 조회 (최근 생성순, 기본은 목록 필드만 select)"""
+    db = get_db()
+    if db is None:
+        return []
+    
+    query = _projects_list_query(db.collection('projects'), limit, status, fields)
+    
+    return [decompress_fields(doc.to_dict(), 'projects') async for doc in query.stream()]
+
+
+async def get_project_ids(
+    status: Optional[str] = None,
+    auto_generated: Optional[bool] = None,
+    limit: int = 1000
+) -> List[str]:
+    """조건에 맞는 프로젝트 ID 목록 (일괄 삭제 대상 선택용)"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    query = _project_ids_query(db.collection('projects'), status, auto_generated, limit)
+    return [doc.id async for doc in query.stream()]
+
+
+async def delete_project(project_id: str) -> Dict[str, int]:
+    """프로젝트 삭제 (서브컬렉션, RSS 게시물 연결 포함)"""
+    return await delete_projects([project_id])
+
+
+async def delete_projects(project_ids: List[str]) -> Dict[str, int]:
+    """프로젝트 일괄 삭제 (서브컬렉션은 배치, 프로젝트 문서/연결 해제는 프로젝트별 트랜잭션)"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    project_ids = list(dict.fromkeys(project_ids))
+    result = _new_delete_result()
+    if not project_ids:
+        return result
+    
+    projects = db.collection('projects')
+    existing = {doc.id async for doc in db.get_all([projects.document(pid) for pid in project_ids]) if doc.exists}
+    
+    writer = _ChunkedBatch(db)
+    unlinked = []
+    
+    async def commit(force: bool = False):
+        if force or writer.full():
+            batch = writer.take()
+            if batch is not None:
+                await batch.commit()
+    
+    for project_id in project_ids:
+        project_ref = projects.document(project_id)
+        
+        for name in _PROJECT_SUBCOLLECTIONS:
+            refs = [doc.reference async for doc in project_ref.collection(name).select([]).stream()]
+            for ref in refs:
+                writer.delete(ref)
+                await commit()
+            result[name] += len(refs)
+        await commit(force=True)
+        
+        item_refs = [doc.reference async for doc in _library_items_by_project(db.collection('library_items'), project_id).select([]).stream()]
+        post_refs = [doc.reference async for doc in db.collection('rss_posts').where('project_id', '==', project_id).select([]).stream()]
+        
+        # 항목/게시물 재확인 + 연결 해제 + 카운터 차감 + 프로젝트 삭제를 한 트랜잭션으로
+        async def write(transaction):
+            item_docs = [await ref.get(transaction=transaction) for ref in item_refs]
+            post_docs = [await ref.get(transaction=transaction) for ref in post_refs]
+            return _stage_project_unlink(transaction, db, project_id, item_docs, post_docs)
+        
+        project_unlinked, posts_unlinked = await _run_transaction(db, write)
+        unlinked += project_unlinked
+        result['posts_unlinked'] += posts_unlinked
+        if project_id in existing:
+            result['projects'] += 1
+    
+    for project_id in project_ids:
+        invalidate_project_cache(project_id)
+    for key, changes in unlinked:
+        _library_item_written(key, changes)
+    
+    logger.info(f"Projects deleted: {result}")
+    return result
+
+
+# RSS Posts
+
+async def create_rss_post(post_data: Dict) -> str:
+    """RSS 게시물 생성 (URL 해시 ID, 이미 있으면 건너뜀)"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    post_id = _rss_post_id(post_data['url'])
+    
+    post_ref = db.collection('rss_posts').document(post_id)
+    item_ref = db.collection('library_items').document(post_id)
+    post_doc = _new_rss_post_data(post_id, post_data)
+    item = _library_item_from_post(post_doc)
+    
+    async def write(transaction) -> bool:
+        if (await post_ref.get(transaction=transaction)).exists:
+            return False
+        existing_item = (await item_ref.get(transaction=transaction)).to_dict()
+        
+        transaction.set(post_ref, compress_fields(post_doc, 'rss_posts'))
+        transaction.set(item_ref, _library_item_stamped(item), merge=True)
+        _write_library_stats(
+            transaction,
+            db.collection('library_stats'),
+            _library_stats_state(existing_item),
+            _library_stats_state({**(existing_item or {}), **item})
+        )
+        return True
+    
+    if not await _run_transaction(db, write):
+        logger.info(f"RSS post already exists: {post_id}")
+        return post_id
+    
+    _library_item_written(post_id, item, post_doc['site_id'])
+    logger.info(f"RSS post created: {post_id}")
+    
+    return post_id
+
+
+async def get_rss_post(post_id: str) -> Optional[Dict]:
+    """RSS 게시물 조회"""
+    db = get_db()
+    if db is None:
+        return None
+    
+    doc = await db.collection('rss_posts').document(post_id).get()
+    
+    if not doc.exists:
+        return None
+    
+    return decompress_fields(doc.to_dict(), 'rss_posts')
+
+
+async def get_all_rss_posts(
+    site_id: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    year_month: Optional[str] = None,
+    limit: int = 100
+) -> List[Dict]:
+    """RSS 게시물 목록 조회 (최신순)"""
+    db = get_db()
+    if db is None:
+        logger.warning("Firestore not initialized, returning empty list")
+        return []
+    
+    try:
+        logger.info(f"Querying RSS posts: site_id={site_id}, year_month={year_month}, limit={limit}")
+        
+        since, until = _published_range(start_date, end_date, year_month)
+        query = _rss_posts_query(db.collection('rss_posts'), site_id, since, until, limit)
+        
+        posts = [decompress_fields(doc.to_dict(), 'rss_posts') async for doc in query.stream()]
+        
+        logger.info(f"Successfully fetched {len(posts)} RSS posts")
+        return posts
+    
+    except Exception as e:
+        logger.error(f"Failed to get RSS posts: {str(e)}", exc_info=True)
+        return []
+
+
+async def update_rss_post(
+    post_id: str,
+    data: Dict,
+    current: Optional[Dict] = None,
+    refetch: bool = False
+) -> Optional[Dict]:
+    """RSS 게시물 업데이트"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    batch = None
+    item_changes = _library_post_changes(data)
+    if item_changes:
+        batch = db.batch()
+        batch.set(db.collection('library_items').document(post_id), _library_item_stamped(item_changes), merge=True)
+    
+    stored = compress_fields(data, 'rss_posts')
+    result = decompress_fields(await _apply_update(db.collection('rss_posts').document(post_id), stored, current, refetch, batch), 'rss_posts')
+    logger.info(f"RSS post updated: {post_id}")
+    
+    if batch is not None:
+        _library_item_written(post_id, item_changes, (current or {}).get('site_id'))
+    
+    return result
+
+
+async def update_rss_post_project_link(post_id: str, project_id: str):
+    """RSS 게시물과 프로젝트 연결"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    item_ref = db.collection('library_items').document(post_id)
+    item_changes = {'project': {'id': project_id}}
+    
+    async def write(transaction):
+        existing = (await item_ref.get(transaction=transaction)).to_dict()
+        transaction.update(db.collection('rss_posts').document(post_id), {
+            'has_cardnews': True,
+            'project_id': project_id
+        })
+        transaction.set(item_ref, _library_item_stamped(item_changes), merge=True)
+        _write_library_stats(
+            transaction,
+            db.collection('library_stats'),
+            _library_stats_state(existing),
+            _library_stats_state({**(existing or {}), **item_changes})
+        )
+    
+    await _run_transaction(db, write)
+    _library_item_written(post_id, item_changes)
+    
+    logger.info(f"RSS post linked to project: {post_id} -> {project_id}")
+
+
+# Library Items
+
+async def _project_library_key(db, project_id: str, current: Optional[Dict]) -> Optional[str]:
+    """프로젝트의 라이브러리 항목 키 (current가 있으면 읽기 없음)"""
+    if current is not None:
+        return current.get('library_key')
+    
+    async for doc in _library_items_by_project(db.collection('library_items'), project_id).stream():
+        return doc.id
+    return None
+
+
+async def get_library_items_batch(
+    site_id: Optional[str] = None,
+    after: Optional[Dict] = None,
+    limit: int = 20,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> List[Dict]:
+    """라이브러리 항목 키셋 조회 (published_at DESC, key DESC, 범위 [since, until))"""
+    db = get_db()
+    if db is None:
+        return []
+    
+    query = _library_page_query(db.collection('library_items'), site_id, after, limit, since, until)
+    return [doc.to_dict() async for doc in query.stream()]
+
+
+async def get_library_items(keys: List[str]) -> List[Dict]:
+    """라이브러리 항목 일괄 조회 (keys 순서, 없는 항목 제외)"""
+    db = get_db()
+    if db is None or not keys:
+        return []
+    
+    refs = [db.collection('library_items').document(key) for key in keys]
+    found = {doc.id: doc.to_dict() async for doc in db.get_all(refs) if doc.exists}
+    
+    return [found[key] for key in keys if key in found]
+
+
+async def get_all_library_items() -> List[Dict]:
+    """라이브러리 항목 전체 조회 (검색 색인 재구축용)"""
+    db = get_db()
+    if db is None:
+        return []
+    
+    return [doc.to_dict() async for doc in db.collection('library_items').stream()]
+
+
+async def get_library_items_updated_since(since: datetime) -> List[Dict]:
+    """updated_at이 since 이후인 라이브러리 항목 (검색 색인 스냅샷 보정용)"""
+    db = get_db()
+    if db is None:
+        return []
+    
+    query = db.collection('library_items').where('updated_at', '>=', since)
+    return [doc.to_dict() async for doc in query.stream()]
+
+
+async def count_library_items(
+    site_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> int:
+    """라이브러리 항목 수 (count 집계 쿼리, published_at 범위 [since, until))"""
+    db = get_db()
+    if db is None:
+        return 0
+    
+    query = _library_items_query(db.collection('library_items'), site_id, since, until)
+    result = await query.count().get()
+    
+    return int(result[0][0].value)
+
+
+async def get_library_stats(site_id: Optional[str] = None) -> Optional[Dict]:
+    """라이브러리 사전 집계 카운터 조회 (없으면 None)"""
+    db = get_db()
+    if db is None:
+        return None
+    
+    doc = await db.collection('library_stats').document(site_id or LIBRARY_STATS_ALL).get()
+    return doc.to_dict() if doc.exists else None
+
+
+# ==================================================
+# Worker Tasks (API 프로세스 → 워커 프로세스 작업 큐)
+# ==================================================
+
+async def create_worker_task(task_type: str, payload: Dict) -> Dict:
+    """워커 작업 추가"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    task = _new_worker_task_data(task_type, payload)
+    await db.collection('worker_tasks').document(task['id']).set(task)
+    logger.info(f"Worker task queued: {task_type} ({task['id']})")
+    
+    return task
+
+
+async def get_worker_task(task_id: str) -> Optional[Dict]:
+    """워커 작업 조회"""
+    db = get_db()
+    if db is None:
+        return None
+    
+    doc = await db.collection('worker_tasks').document(task_id).get()
+    return doc.to_dict() if doc.exists else None
+
+
+async def update_worker_task(task_id: str, data: Dict):
+    """워커 작업 상태 갱신"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    await db.collection('worker_tasks').document(task_id).update(data)
+
+
+async def transition_worker_task(task_id: str, expected_status: str, data: Dict) -> bool:
+    """워커 작업 상태 전이 (현재 상태가 expected_status일 때만, 트랜잭션)"""
+    db = get_db()
+    if db is None:
+        raise ValueError("Firestore not initialized")
+    
+    task_ref = db.collection('worker_tasks').document(task_id)
+    
+    async def write(transaction) -> bool:
+        task = (await task_ref.get(transaction=transaction)).to_dict()
+        if task is None or task['status'] != expected_status:
+            return False
+        transaction.update(task_ref, data)
+        return True
+    
+    return await _run_transaction(db, write)
+
+
+async def get_worker_events(since: datetime, limit: int = 100) -> List[Dict]:
+    """since 이후(since 포함) 워커 변경 알림 (오래된 순)"""
+    db = get_db()
+    if db is None:
+        return []
+    
+    query = _worker_events_query(db.collection('worker_events'), since, limit)
+    return [doc.to_dict() async for doc in query.stream()]
+
+
+async def get_worker_heartbeat() -> Optional[Dict]:
+    """워커 상태 조회 (워커가 한 번도 실행되지 않았으면 None)"""
+    db = get_db()
+    if db is None:
+        return None
+    
+    doc = await db.collection('worker_state').document('worker').get()
+    return doc.to_dict() if doc.exists else None
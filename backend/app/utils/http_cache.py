@@ -0,0 +1,55 @@
+"""
+HTTP 조건부 응답 (ETag / If-None-Match → 304)
+
+목록 API는 응답 본문을 만들기 전에 싼 버전 스탬프(필터 + 결과 버전)로 ETag를 계산하고,
+클라이언트가 보낸 If-None-Match와 같으면 본문 없이 304를 반환합니다.
+압축 미들웨어가 본문을 인코딩하므로 약한 ETag(W/)를 사용합니다.
+"""
+
+from typing import Any, Dict, Optional
+import hashlib
+
+from fastapi import Response
+
+# 브라우저가 캐시된 응답을 쓰기 전에 항상 재검증 (If-None-Match)
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    버전 스탬프로 약한 ETag 생성
+    
+    Args:
+        parts: 필터 값, 결과 버전 등 (repr 기준으로 해시)
+    """
+    digest = hashlib.md5(repr(parts).encode('utf-8')).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교, 여러 값과 * 지원)"""
+    if not if_none_match:
+        return False
+    
+    if if_none_match.strip() == '*':
+        return True
+    
+    target = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == target:
+            return True
+    
+    return False
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    """ETag / Cache-Control 응답 헤더"""
+    return {'ETag': etag, 'Cache-Control': CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    """304 Not Modified 응답"""
+    return Response(status_code=304, headers=etag_headers(etag))
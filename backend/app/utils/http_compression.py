@@ -0,0 +1,102 @@
+"""
+HTTP 응답 압축 미들웨어 (brotli / gzip)
+
+Accept-Encoding에 따라 brotli(brotli 패키지가 없으면 gzip)로 응답 본문을 압축합니다.
+- HTTP_COMPRESSION_MIN_BYTES 미만 응답, 304/204, 이미 인코딩된 응답은 그대로 전송
+- 스트리밍 응답(SSE 등 본문이 여러 조각)은 버퍼링하지 않고 그대로 전송
+"""
+
+from typing import Optional
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip만 사용
+    brotli = None
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding에서 사용할 인코딩 선택 (br 우선, q=0은 제외)"""
+    accepted = set()
+    for part in accept_encoding.lower().split(','):
+        name, _, params = part.strip().partition(';')
+        if params.replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            continue
+        accepted.add(name.strip())
+    
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+class CompressionMiddleware:
+    """응답 본문 압축 (크기 임계값 이상, 한 번에 전송되는 응답만)"""
+    
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 5):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http' or self.minimum_size <= 0:
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = choose_encoding(Headers(scope=scope).get('accept-encoding', ''))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        start: Optional[Message] = None
+        passthrough = False
+        
+        async def send_wrapper(message: Message):
+            nonlocal start, passthrough
+            
+            if message['type'] == 'http.response.start':
+                start = message  # 본문을 보고 압축 여부 결정
+                return
+            
+            if message['type'] != 'http.response.body' or passthrough:
+                await send(message)
+                return
+            
+            # 스트리밍 응답: 첫 조각부터 그대로 전송
+            if message.get('more_body', False):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+            
+            body = message.get('body', b'')
+            headers = MutableHeaders(raw=start['headers'])
+            if (
+                len(body) < self.minimum_size
+                or start['status'] in (204, 304)
+                or 'content-encoding' in headers
+                or headers.get('content-type', '').startswith('text/event-stream')
+            ):
+                await send(start)
+                await send(message)
+                return
+            
+            compressed = self._compress(body, encoding)
+            headers['Content-Encoding'] = encoding
+            headers['Content-Length'] = str(len(compressed))
+            headers.add_vary_header('Accept-Encoding')
+            
+            await send(start)
+            await send({'type': 'http.response.body', 'body': compressed})
+        
+        await self.app(scope, receive, send_wrapper)
+    
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == 'br':
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
@@ -0,0 +1,50 @@
+"""
+미리 직렬화한 JSON 응답
+
+큰 목록 응답은 요청마다 Pydantic 객체를 만들고 response_model로 다시 검증/직렬화하는 비용이 큽니다.
+스키마 검증은 결과를 만들 때 한 번만 하고 orjson으로 bytes를 만들어 두면,
+캐시된 결과를 다시 보낼 때는 bytes를 그대로 응답 본문으로 사용합니다.
+"""
+
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 Pydantic JSON 직렬화 사용
+    orjson = None
+
+
+class PreSerializedJSONResponse(Response):
+    """이미 직렬화된 JSON bytes 응답 (다시 직렬화하지 않음)"""
+    media_type = "application/json"
+
+
+def serialize(adapter: TypeAdapter, data: Any) -> bytes:
+    """
+    스키마 검증 후 JSON bytes로 직렬화
+    
+    Args:
+        adapter: 응답 스키마 (예: TypeAdapter(LibraryFeedResponse))
+        data: 응답 데이터 (dict / 리스트, 스키마에 없는 필드는 제외됨)
+    
+    Returns:
+        JSON bytes (datetime은 ISO 8601, UTC는 Z)
+    
+    Raises:
+        pydantic.ValidationError: 스키마와 맞지 않는 데이터
+    """
+    validated = adapter.validate_python(data)
+    
+    if orjson is None:
+        return adapter.dump_json(validated)
+    
+    return orjson.dumps(adapter.dump_python(validated), option=orjson.OPT_UTC_Z)
+
+
+def json_response(body: bytes, headers: Optional[dict] = None) -> PreSerializedJSONResponse:
+    """직렬화된 bytes로 응답 생성"""
+    return PreSerializedJSONResponse(content=body, headers=headers)
+
@@ -0,0 +1,19 @@
+"""OpenAI 클라이언트 생성 유틸리티"""
+
+from openai import OpenAI
+from app.config import settings
+
+
+def create_openai_client() -> OpenAI:
+    """
+    설정 기반 OpenAI 클라이언트 생성
+    
+    OPENAI_BASE_URL이 설정되어 있으면 해당 엔드포인트(로컬 스텁 서버 등)를 사용합니다.
+    
+    Returns:
+        OpenAI 클라이언트
+    """
+    return OpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        base_url=settings.OPENAI_BASE_URL or None
+    )
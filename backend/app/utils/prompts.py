@@ -40,6 +40,27 @@ Text / 텍스트:
 Keywords / 키워드:
 """
 
+# 출처별 요약 병합 프롬프트 (여러 URL 프로젝트)
+MERGE_SUMMARIES_PROMPT = """
+**CRITICAL INSTRUCTION: You MUST respond in the SAME LANGUAGE as the summaries below.**
+
+The following are summaries of {source_count} different sources on related topics.
+Combine them into one summary within {max_length} characters.
+Every source must be reflected in the combined summary. Do not drop any source.
+Merge overlapping points and keep differences between sources.
+
+**중요 지시: 반드시 아래 요약들과 동일한 언어로 응답하세요.**
+
+다음은 {source_count}개 출처의 요약입니다.
+모든 출처의 핵심 내용이 빠짐없이 포함되도록 {max_length}자 이내의 하나의 요약으로 합쳐주세요.
+겹치는 내용은 합치고, 출처마다 다른 내용은 유지하세요.
+
+Summaries / 출처별 요약:
+{summaries}
+
+Combined summary / 통합 요약:
+"""
+
 # 카드뉴스 생성 프롬프트 (한글 우선)
 CARD_GENERATION_PROMPT = """
 **🚨 최우선 지시사항: 모든 카드 내용을 반드시 한글로 작성하세요! 🚨**
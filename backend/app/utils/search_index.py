@@ -0,0 +1,431 @@
+"""
+라이브러리 키워드 검색용 인메모리 역색인
+
+- 토큰화: 한글은 문자 bigram (한 글자 단어는 unigram), 영문/숫자는 단어 단위
+- 부분 일치: 질의 토큰을 포함하는 색인 토큰까지 확장 ('ai' → 'openai', '뉴' → '뉴스')
+  (색인 토큰의 글자/bigram → 토큰 보조 색인으로 후보만 확인, 전체 토큰 스캔 없음)
+- 순위: 필드 가중치(제목 > 키워드 > 요약)를 반영한 BM25 (부분 일치는 낮은 가중치)
+- 증분 갱신: library_items 쓰기와 같은 변경(post/project 맵)을 apply()로 반영
+- 디스크 저장: JSON 파일로 저장/로드하여 시작 시 전체 재구축 생략
+  (로드 후 저장 시각 이후 변경된 항목을 다시 읽어 보정, 항목 수가 다르면 재구축)
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+import json
+import logging
+import math
+import os
+import re
+import threading
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# 필드 가중치 (post/project 맵의 필드 이름 기준)
+FIELD_WEIGHTS: Dict[str, float] = {
+    'title': 3.0,
+    'title_original': 3.0,
+    'keywords': 2.0,
+    'summary': 1.0
+}
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 부분 일치 토큰의 빈도 가중치 (정확히 일치하는 토큰보다 낮은 순위)
+PARTIAL_MATCH_WEIGHT = 0.5
+
+_TOKEN_RE = re.compile(r'[가-힣]+|[a-z0-9]+')
+
+
+def _grams(token: str) -> set:
+    """부분 일치 보조 색인 키 (토큰의 글자와 bigram)"""
+    return set(token) | {token[i:i + 2] for i in range(len(token) - 1)}
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    텍스트 토큰화
+    
+    Examples:
+        >>> tokenize('OpenAI 인공지능')
+        ['openai', '인공', '공지', '지능']
+    """
+    tokens = []
+    for run in _TOKEN_RE.findall(text.lower()):
+        if '가' <= run[0] <= '힣':
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def _document_terms(fields: Dict[str, List[str]]) -> Dict[str, float]:
+    """필드 가중치를 반영한 토큰별 빈도"""
+    terms: Dict[str, float] = {}
+    for field, weight in FIELD_WEIGHTS.items():
+        values = fields.get(field)
+        if not values:
+            continue
+        for token in tokenize(' '.join(str(value) for value in values)):
+            terms[token] = terms.get(token, 0.0) + weight
+    return terms
+
+
+def _merge(target: Dict, changes: Dict) -> Dict:
+    """set(merge=True)와 같은 방식으로 중첩 맵 병합 (None 맵은 삭제)"""
+    for key, value in changes.items():
+        if isinstance(value, dict):
+            target[key] = _merge(dict(target.get(key) or {}), value)
+        elif value is None and key in ('post', 'project'):
+            target.pop(key, None)
+        else:
+            target[key] = value
+    return target
+
+
+def _as_utc(value) -> Optional[datetime]:
+    """datetime/ISO 문자열을 UTC datetime으로 변환 (naive는 UTC로 간주)"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class SearchIndex:
+    """라이브러리 항목 역색인 (스레드 안전)"""
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.RLock()
+        self._docs: Dict[str, Dict] = {}                 # key -> {site_id, published_at, post, project, terms, length}
+        self._postings: Dict[str, Dict[str, float]] = {}  # token -> {key: weighted tf}
+        self._total_length = 0.0
+        self._grams: Dict[str, set] = {}                  # 글자/bigram -> 그것을 포함하는 색인 토큰 (부분 일치 후보)
+        self.ready = False  # 로드 또는 재구축 완료 여부
+        self.dirty = False
+        self.saved_at: Optional[datetime] = None  # 로드한 스냅샷의 저장 시각
+    
+    # ---- 갱신 ----
+    
+    def apply(self, key: str, changes: Dict):
+        """
+        라이브러리 항목 변경 반영 (library_items에 쓰는 것과 같은 변경)
+        
+        Args:
+            key: 라이브러리 항목 키 (md5(url))
+            changes: {'site_id', 'published_at', 'post': {...}, 'project': {...} | None}
+        """
+        with self._lock:
+            doc = self._docs.get(key)
+            source = {k: doc[k] for k in ('site_id', 'published_at', 'post', 'project') if k in doc} if doc else {}
+            self._put(key, _merge(source, changes))
+            self.dirty = True
+    
+    def put(self, item: Dict):
+        """
+        library_items 문서 전체로 항목 교체 (다른 프로세스가 쓴 항목 반영)
+        
+        Args:
+            item: library_items 문서 (key, site_id, published_at, post, project)
+        """
+        with self._lock:
+            self._put(item['key'], {k: item.get(k) for k in ('site_id', 'published_at', 'post', 'project') if item.get(k)})
+            self.dirty = True
+    
+    def remove(self, key: str):
+        """라이브러리 항목 삭제 반영"""
+        with self._lock:
+            if self._drop(key):
+                self.dirty = True
+    
+    def rebuild(self, items: Iterable[Dict]):
+        """
+        library_items 문서 전체로 색인 재구축
+        
+        Args:
+            items: library_items 문서 (key, site_id, published_at, post, project)
+        """
+        docs: Dict[str, Dict] = {}
+        for item in items:
+            docs[item['key']] = {k: item.get(k) for k in ('site_id', 'published_at', 'post', 'project') if item.get(k)}
+        
+        with self._lock:
+            self._docs.clear()
+            self._postings.clear()
+            self._grams.clear()
+            self._total_length = 0.0
+            for key, source in docs.items():
+                self._put(key, source)
+            self.ready = True
+            self.dirty = True
+        
+        logger.info(f"Search index rebuilt: {len(docs)} documents")
+    
+    def _put(self, key: str, source: Dict):
+        """문서 색인 (기존 문서 교체)"""
+        self._drop(key)
+        
+        # post와 project의 같은 필드는 함께 색인 (원본 제목 등으로도 검색 가능)
+        fields: Dict[str, List[str]] = {}
+        for name in ('post', 'project'):
+            for field, value in (source.get(name) or {}).items():
+                if field in FIELD_WEIGHTS and value:
+                    fields.setdefault(field, []).extend(value if isinstance(value, list) else [value])
+        
+        terms = _document_terms(fields)
+        self._add(key, {**source, 'terms': terms})
+    
+    def _add(self, key: str, doc: Dict):
+        """색인된 문서를 posting에 추가"""
+        doc['published_at'] = _as_utc(doc.get('published_at'))
+        doc['length'] = sum(doc['terms'].values())
+        self._docs[key] = doc
+        self._total_length += doc['length']
+        for token, tf in doc['terms'].items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = {}
+                for gram in _grams(token):
+                    self._grams.setdefault(gram, set()).add(token)
+            posting[key] = tf
+    
+    def _drop(self, key: str) -> bool:
+        """문서를 posting에서 제거"""
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return False
+        
+        self._total_length -= doc['length']
+        for token in doc['terms']:
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.pop(key, None)
+                if not posting:
+                    del self._postings[token]
+                    for gram in _grams(token):
+                        tokens = self._grams.get(gram)
+                        if tokens is not None:
+                            tokens.discard(token)
+                            if not tokens:
+                                del self._grams[gram]
+        return True
+    
+    # ---- 검색 ----
+    
+    def search(
+        self,
+        query: str,
+        site_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        year_month: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        키워드 검색 (모든 질의 토큰을 포함하는 문서만, BM25 점수순)
+        
+        질의 토큰은 그 토큰을 포함하는 색인 토큰으로도 일치합니다. (부분 문자열 검색)
+        
+        Args:
+            query: 검색어
+            site_id: 사이트 필터
+            start_date: 시작 날짜 (이상)
+            end_date: 종료 날짜 (이하)
+            year_month: 연월 필터 (YYYY-MM)
+        
+        Returns:
+            [(key, score)] 점수 내림차순 (동점이면 최신순)
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        
+        start_date = _as_utc(start_date)
+        end_date = _as_utc(end_date)
+        
+        with self._lock:
+            postings = [self._matching_posting(token) for token in tokens]
+            if not all(postings):
+                return []
+            
+            # 가장 짧은 posting부터 교집합
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    return []
+            
+            n_docs = len(self._docs)
+            avg_length = self._total_length / n_docs if n_docs else 0.0
+            idf = {
+                id(posting): math.log(1 + (n_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+                for posting in postings
+            }
+            
+            results = []
+            for key in candidates:
+                doc = self._docs[key]
+                if not _matches(doc, site_id, start_date, end_date, year_month):
+                    continue
+                
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * doc['length'] / avg_length) if avg_length else BM25_K1
+                score = 0.0
+                for posting in postings:
+                    tf = posting[key]
+                    score += idf[id(posting)] * tf * (BM25_K1 + 1) / (tf + norm)
+                
+                results.append((key, score, doc['published_at']))
+        
+        epoch = datetime.min.replace(tzinfo=timezone.utc)
+        results.sort(key=lambda r: (r[1], r[2] or epoch), reverse=True)
+        return [(key, round(score, 4)) for key, score, _ in results]
+    
+    def _matching_posting(self, token: str) -> Dict[str, float]:
+        """
+        질의 토큰의 posting (토큰을 포함하는 색인 토큰 포함, 문서별 최대 빈도)
+        
+        영문/숫자는 단어 단위로 색인되므로 'ai'는 'openai'의 posting으로,
+        한 글자 한글 질의는 그 글자를 포함하는 bigram의 posting으로 일치합니다.
+        후보 토큰은 보조 색인에서 질의 토큰의 가장 드문 글자/bigram으로 고릅니다.
+        """
+        candidates = min((self._grams.get(gram, ()) for gram in _grams(token)), key=len)
+        terms = [term for term in candidates if token in term and term != token]
+        
+        exact = self._postings.get(token)
+        if not terms:
+            return exact or {}
+        
+        merged: Dict[str, float] = {}
+        for term in terms:
+            for key, tf in self._postings[term].items():
+                merged[key] = max(merged.get(key, 0.0), tf * PARTIAL_MATCH_WEIGHT)
+        for key, tf in (exact or {}).items():
+            merged[key] = max(merged.get(key, 0.0), tf)
+        return merged
+    
+    # ---- 저장/로드 ----
+    
+    def save(self) -> bool:
+        """디스크에 저장 (임시 파일 후 교체)"""
+        if not self.path:
+            return False
+        
+        with self._lock:
+            saved_at = datetime.now(timezone.utc)
+            payload = {
+                'version': INDEX_VERSION,
+                'saved_at': saved_at.isoformat(),
+                'docs': {
+                    key: {
+                        **{k: v for k, v in doc.items() if k not in ('length', 'published_at')},
+                        'published_at': doc['published_at'].isoformat() if doc.get('published_at') else None
+                    }
+                    for key, doc in self._docs.items()
+                }
+            }
+            self.dirty = False
+            self.saved_at = saved_at
+        
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            self.dirty = True
+            raise
+        
+        logger.info(f"Search index saved: {len(payload['docs'])} documents → {self.path}")
+        return True
+    
+    def save_if_dirty(self) -> bool:
+        """변경이 있을 때만 저장"""
+        if self.dirty and self.ready:
+            return self.save()
+        return False
+    
+    def load(self) -> bool:
+        """
+        디스크에서 로드
+        
+        Returns:
+            성공 여부 (파일이 없거나 버전이 다르면 False)
+        """
+        if not self.path or not os.path.exists(self.path):
+            return False
+        
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                payload = json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load search index: {str(e)}")
+            return False
+        
+        if payload.get('version') != INDEX_VERSION:
+            logger.info("Search index version changed, rebuild required")
+            return False
+        
+        with self._lock:
+            self._docs.clear()
+            self._postings.clear()
+            self._grams.clear()
+            self._total_length = 0.0
+            for key, doc in payload['docs'].items():
+                self._add(key, doc)
+            self.ready = True
+            self.dirty = False
+            self.saved_at = _as_utc(payload.get('saved_at'))
+        
+        logger.info(f"Search index loaded: {len(self._docs)} documents (saved_at={payload.get('saved_at')})")
+        return True
+    
+    def stats(self) -> Dict:
+        """색인 지표"""
+        with self._lock:
+            return {
+                'ready': self.ready,
+                'documents': len(self._docs),
+                'tokens': len(self._postings),
+                'dirty': self.dirty,
+                'saved_at': self.saved_at.isoformat() if self.saved_at else None,
+                'path': self.path
+            }
+
+
+def _matches(doc: Dict, site_id, start_date, end_date, year_month) -> bool:
+    """사이트/날짜 필터"""
+    if site_id and doc.get('site_id') != site_id:
+        return False
+    
+    published_at = doc.get('published_at')  # _add()에서 UTC로 변환 (연월도 UTC 기준, _published_range와 동일)
+    if published_at:
+        if start_date and published_at < start_date:
+            return False
+        if end_date and published_at > end_date:
+            return False
+        if year_month and published_at.strftime('%Y-%m') != year_month:
+            return False
+    
+    return True
+
+
+# 전역 검색 색인 인스턴스
+_search_index = SearchIndex(path=settings.SEARCH_INDEX_PATH or None)
+
+
+def get_search_index() -> SearchIndex:
+    """전역 검색 색인 인스턴스 가져오기"""
+    return _search_index
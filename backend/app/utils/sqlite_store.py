@@ -0,0 +1,767 @@
+"""
+SQLite 로컬 저장소 (Firestore 대체 백엔드)
+
+Firestore 자격 증명이 없는 단일 노드 배포와 벤치마크 환경용입니다.
+app.utils.firebase / firebase_async가 사용하는 Firestore 클라이언트 API
+(collection/document, where/order_by/start_after/limit/select/count,
+WriteBatch, Transaction, get_all, Increment/DELETE_FIELD)를 같은 의미로 구현하므로
+두 모듈의 함수가 백엔드와 관계없이 그대로 동작합니다.
+
+- 문서: documents 테이블에 경로별 JSON으로 저장 (datetime은 {"$dt": ISO} 태그, UTC /
+  bytes는 {"$bytes": base64} 태그)
+- WAL 모드, 스레드별 연결, 배치는 단일 트랜잭션
+- 트랜잭션은 전용 연결에서 BEGIN IMMEDIATE (읽기부터 쓰기 잠금, 다른 쓰기는 대기)
+- site_id / published_at / status 등 조회 필드는 json_extract 식 인덱스
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Protocol, Tuple
+import asyncio
+import base64
+import json
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+
+from firebase_admin import firestore
+from google.api_core.exceptions import NotFound
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+ASCENDING = 'ASCENDING'
+DESCENDING = 'DESCENDING'
+
+
+class DocumentStore(Protocol):
+    """저장소 백엔드 인터페이스 (firestore.client()의 부분집합, SQLiteClient가 구현)"""
+    
+    def collection(self, path: str): ...
+    
+    def batch(self): ...
+    
+    def transaction(self): ...
+    
+    def get_all(self, references: Iterable): ...
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    path TEXT PRIMARY KEY,
+    collection TEXT NOT NULL,
+    id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_documents_collection ON documents (collection, id);
+"""
+
+# 조회 필드 식 인덱스 (쿼리가 같은 _field_expr 식을 사용하므로 인덱스를 탐, 끝에 id 정렬 포함)
+_INDEXED_FIELDS: Tuple[Tuple[str, ...], ...] = (
+    ('site_id', 'published_at', 'key'),   # 사이트별 라이브러리 피드
+    ('published_at', 'key'),              # 전체 라이브러리 피드
+    ('site_id', 'published_at'),          # 사이트별 RSS 게시물
+    ('status', 'created_at'),             # 프로젝트 상태별 목록
+    ('created_at',),                      # 프로젝트 / 사이트 목록
+    ('site_id', 'started_at', 'id'),      # 사이트별 크롤링 로그
+    ('started_at', 'id'),                 # 크롤링 로그
+    ('project.id',),                      # 프로젝트에 연결된 라이브러리 항목
+    ('project_id',),                      # 프로젝트에 연결된 RSS 게시물
+    ('updated_at',),                      # 검색 색인 스냅샷 이후 변경된 라이브러리 항목
+)
+
+
+def _field_expr(field_path: str) -> str:
+    """필드 경로 → json_extract 식 (예: 'project.id' → json_extract(data, '$."project"."id"'))"""
+    return f"json_extract(data, '{_json_path(field_path)}')"
+
+
+def _json_path(field_path: str) -> str:
+    return '$' + ''.join(f'."{part}"' for part in field_path.split('.'))
+
+
+# ---- 값 인코딩 ----
+
+def _iso(value: datetime) -> str:
+    """UTC 고정 형식 ISO 문자열 (문자열 비교 = 시간 비교)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec='microseconds')
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {'$dt': _iso(value)}
+    if isinstance(value, bytes):
+        return {'$bytes': base64.b64encode(value).decode('ascii')}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if len(value) == 1 and '$dt' in value:
+            return datetime.fromisoformat(value['$dt'])
+        if len(value) == 1 and '$bytes' in value:
+            return base64.b64decode(value['$bytes'])
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def _dumps(doc: Dict) -> str:
+    return json.dumps(_encode(doc), ensure_ascii=False, separators=(',', ':'))
+
+
+def _sql_value(value: Any) -> Any:
+    """쿼리 조건 값 → json_extract 결과와 비교 가능한 SQL 값"""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (datetime, dict, list, tuple)):
+        return json.dumps(_encode(value), ensure_ascii=False, separators=(',', ':'))
+    return value
+
+
+# ---- 쓰기 의미 (set / set merge / update) ----
+
+def _resolve(value: Any) -> Any:
+    """변환 값(Increment 등)을 새 문서 값으로 변환"""
+    if isinstance(value, firestore.Increment):
+        return value.value
+    if isinstance(value, dict):
+        return {key: _resolve(item) for key, item in value.items() if item is not firestore.DELETE_FIELD}
+    return value
+
+
+def _assign(node: Dict, key: str, value: Any):
+    if value is firestore.DELETE_FIELD:
+        node.pop(key, None)
+    elif isinstance(value, firestore.Increment):
+        current = node.get(key)
+        if isinstance(current, bool) or not isinstance(current, (int, float)):
+            current = 0
+        node[key] = current + value.value
+    else:
+        node[key] = _resolve(value)
+
+
+def _merge(target: Dict, changes: Dict) -> Dict:
+    """set(merge=True): 중첩 맵은 필드 단위로 병합"""
+    for key, value in changes.items():
+        if isinstance(value, dict):
+            child = target.get(key)
+            target[key] = _merge(child if isinstance(child, dict) else {}, value)
+        else:
+            _assign(target, key, value)
+    return target
+
+
+def _update(target: Dict, changes: Dict) -> Dict:
+    """update(): 키는 필드 경로 ('a.b'), 맵 값은 통째로 교체"""
+    for field_path, value in changes.items():
+        parts = field_path.split('.')
+        node = target
+        for part in parts[:-1]:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = node[part] = {}
+            node = child
+        _assign(node, parts[-1], value)
+    return target
+
+
+def _get_path(doc: Dict, field_path: str) -> Any:
+    value = doc
+    for part in field_path.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _project(doc: Dict, field_paths: List[str]) -> Dict:
+    """select(): 지정 필드만 남긴 문서"""
+    projected: Dict = {}
+    for field_path in field_paths:
+        value = _get_path(doc, field_path)
+        if value is not None:
+            _update(projected, {field_path: value})
+    return projected
+
+
+# ---- 문서 / 쿼리 ----
+
+class DocumentSnapshot:
+    """문서 스냅샷 (firestore DocumentSnapshot과 같은 속성)"""
+    
+    def __init__(self, reference, data: Optional[Dict]):
+        self.reference = reference
+        self._data = data
+    
+    @property
+    def id(self) -> str:
+        return self.reference.id
+    
+    @property
+    def exists(self) -> bool:
+        return self._data is not None
+    
+    def to_dict(self) -> Optional[Dict]:
+        return _decode(self._data) if self._data is not None else None
+
+
+class DocumentReference:
+    """문서 참조 (경로: 'collection/id[/sub/id...]')"""
+    
+    def __init__(self, client: 'SQLiteClient', path: str):
+        self._client = client
+        self.path = path
+    
+    @property
+    def id(self) -> str:
+        return self.path.rsplit('/', 1)[-1]
+    
+    @property
+    def parent(self) -> 'CollectionReference':
+        return CollectionReference(self._client, self.path.rsplit('/', 1)[0])
+    
+    def collection(self, name: str) -> 'CollectionReference':
+        return CollectionReference(self._client, f"{self.path}/{name}")
+    
+    def get(self, transaction: Optional['Transaction'] = None) -> DocumentSnapshot:
+        if transaction is not None:
+            return transaction._get(self)
+        return self._client._get(self)
+    
+    def set(self, data: Dict, merge: bool = False):
+        self._client._commit([('set', self, data, merge)])
+    
+    def update(self, data: Dict):
+        self._client._commit([('update', self, data, False)])
+    
+    def delete(self):
+        self._client._commit([('delete', self, None, False)])
+
+
+class Query:
+    """컬렉션 쿼리 (불변 빌더)"""
+    
+    def __init__(
+        self,
+        client: 'SQLiteClient',
+        collection: str,
+        filters: Tuple = (),
+        orders: Tuple = (),
+        limit: Optional[int] = None,
+        after: Optional[Dict] = None,
+        fields: Optional[List[str]] = None
+    ):
+        self._client = client
+        self._collection = collection
+        self._filters = filters
+        self._orders = orders
+        self._limit = limit
+        self._after = after
+        self._fields = fields
+    
+    def _copy(self, **changes) -> 'Query':
+        state = {
+            'filters': self._filters,
+            'orders': self._orders,
+            'limit': self._limit,
+            'after': self._after,
+            'fields': self._fields,
+            **changes
+        }
+        return Query(self._client, self._collection, **state)
+    
+    def where(self, field_path: str, op_string: str, value: Any) -> 'Query':
+        return self._copy(filters=self._filters + ((field_path, op_string, value),))
+    
+    def order_by(self, field_path: str, direction: str = ASCENDING) -> 'Query':
+        return self._copy(orders=self._orders + ((field_path, direction),))
+    
+    def limit(self, count: int) -> 'Query':
+        return self._copy(limit=count)
+    
+    def start_after(self, values) -> 'Query':
+        """values: 정렬 필드 값 딕셔너리 또는 DocumentSnapshot"""
+        if isinstance(values, DocumentSnapshot):
+            doc = values.to_dict() or {}
+            values = {field: _get_path(doc, field) for field, _ in self._orders}
+        return self._copy(after=values)
+    
+    def select(self, field_paths: Iterable[str]) -> 'Query':
+        return self._copy(fields=list(field_paths))
+    
+    def stream(self, transaction: Optional['Transaction'] = None) -> Iterator[DocumentSnapshot]:
+        sql, params = self._sql('path, data')
+        reader = transaction if transaction is not None else self._client
+        for path, data in reader._read(sql, params):
+            doc = json.loads(data)
+            if self._fields is not None:
+                doc = _project(doc, self._fields)
+            yield DocumentSnapshot(DocumentReference(self._client, path), doc)
+    
+    def get(self, transaction: Optional['Transaction'] = None) -> List[DocumentSnapshot]:
+        return list(self.stream(transaction))
+    
+    def count(self) -> 'CountQuery':
+        return CountQuery(self)
+    
+    def _sql(self, columns: str) -> Tuple[str, List]:
+        clauses = ['collection = ?']
+        params: List = [self._collection]
+        
+        for field_path, op, value in self._filters:
+            clause, values = _filter_clause(field_path, op, value)
+            clauses.append(clause)
+            params.extend(values)
+        
+        # Firestore와 같이 정렬 필드가 없는 문서는 제외
+        for field_path, _ in self._orders:
+            clauses.append(f"json_type(data, '{_json_path(field_path)}') IS NOT NULL")
+        
+        if self._after:
+            clause, values = _after_clause(self._orders, self._after)
+            clauses.append(clause)
+            params.extend(values)
+        
+        order_terms = [f"{_field_expr(field)} {_direction(direction)}" for field, direction in self._orders]
+        last = _direction(self._orders[-1][1]) if self._orders else 'ASC'
+        order_terms.append(f"id {last}")
+        
+        sql = f"SELECT {columns} FROM documents WHERE {' AND '.join(clauses)} ORDER BY {', '.join(order_terms)}"
+        if self._limit is not None:
+            sql += ' LIMIT ?'
+            params.append(self._limit)
+        
+        return sql, params
+
+
+def _direction(direction: str) -> str:
+    return 'DESC' if direction == DESCENDING else 'ASC'
+
+
+def _filter_clause(field_path: str, op: str, value: Any) -> Tuple[str, List]:
+    expr = _field_expr(field_path)
+    
+    if op == '==':
+        if value is None:
+            return f"json_type(data, '{_json_path(field_path)}') = 'null'", []
+        return f"{expr} = ?", [_sql_value(value)]
+    if op == '!=':
+        return f"{expr} IS NOT NULL AND {expr} != ?", [_sql_value(value)]
+    if op in ('<', '<=', '>', '>='):
+        return f"{expr} {op} ?", [_sql_value(value)]
+    if op == 'in':
+        values = [_sql_value(item) for item in value]
+        return f"{expr} IN ({', '.join('?' * len(values))})", values
+    if op == 'array_contains':
+        return f"EXISTS (SELECT 1 FROM json_each(data, '{_json_path(field_path)}') WHERE value = ?)", [_sql_value(value)]
+    
+    raise ValueError(f"Unsupported query operator: {op}")
+
+
+def _after_clause(orders: Tuple, after: Dict) -> Tuple[str, List]:
+    """키셋 조건: (f1, f2, ...) 가 after 값 다음인 문서"""
+    keys = [(field, direction) for field, direction in orders if field in after]
+    alternatives = []
+    params: List = []
+    
+    for i, (field, direction) in enumerate(keys):
+        terms = [f"{_field_expr(prev)} = ?" for prev, _ in keys[:i]]
+        params.extend(_sql_value(after[prev]) for prev, _ in keys[:i])
+        terms.append(f"{_field_expr(field)} {'<' if direction == DESCENDING else '>'} ?")
+        params.append(_sql_value(after[field]))
+        alternatives.append('(' + ' AND '.join(terms) + ')')
+    
+    return '(' + ' OR '.join(alternatives or ['1']) + ')', params
+
+
+class _AggregationResult:
+    def __init__(self, value: int):
+        self.alias = 'field_1'
+        self.value = value
+
+
+class CountQuery:
+    """count() 집계 (get() → [[AggregationResult]])"""
+    
+    def __init__(self, query: Query):
+        self._query = query
+    
+    def get(self) -> List[List[_AggregationResult]]:
+        sql, params = self._query._sql('1')
+        rows = self._query._client._read(f"SELECT COUNT(*) FROM ({sql})", params)
+        return [[_AggregationResult(rows[0][0])]]
+
+
+class CollectionReference(Query):
+    """컬렉션 참조 (쿼리 시작점)"""
+    
+    def __init__(self, client: 'SQLiteClient', path: str):
+        super().__init__(client, path)
+    
+    @property
+    def id(self) -> str:
+        return self._collection.rsplit('/', 1)[-1]
+    
+    def document(self, document_id: Optional[str] = None) -> DocumentReference:
+        return DocumentReference(self._client, f"{self._collection}/{document_id or uuid.uuid4().hex}")
+
+
+class WriteBatch:
+    """쓰기 배치 (commit 시 단일 트랜잭션)"""
+    
+    def __init__(self, client: 'SQLiteClient'):
+        self._client = client
+        self._ops: List[Tuple] = []
+    
+    def set(self, reference, data: Dict, merge: bool = False):
+        self._ops.append(('set', _unwrap(reference), data, merge))
+    
+    def update(self, reference, data: Dict):
+        self._ops.append(('update', _unwrap(reference), data, False))
+    
+    def delete(self, reference):
+        self._ops.append(('delete', _unwrap(reference), None, False))
+    
+    def commit(self) -> List:
+        self._client._commit(self._ops)
+        self._ops = []
+        return []
+
+
+class Transaction(WriteBatch):
+    """
+    트랜잭션 (run(func)으로 실행)
+    
+    전용 연결에서 BEGIN IMMEDIATE로 시작하므로 func 안의 읽기(doc_ref.get(transaction=...))와
+    버퍼된 쓰기가 하나의 SQLite 트랜잭션이 되고, 그동안 다른 연결(프로세스)의 쓰기는 대기합니다.
+    Firestore와 달리 충돌이 없으므로 func는 한 번만 실행됩니다.
+    """
+    
+    def __init__(self, client: 'SQLiteClient'):
+        super().__init__(client)
+        self._connection: Optional[sqlite3.Connection] = None
+    
+    def run(self, func):
+        conn = self._client._connect()
+        try:
+            with self._client._transaction(conn):
+                self._connection = conn
+                result = func(self)
+                self._client._apply(conn, self._ops)
+        finally:
+            self._connection = None
+            self._ops = []
+            conn.close()
+        return result
+    
+    def commit(self) -> List:
+        raise RuntimeError("Transaction writes are applied by run()")
+    
+    def _get(self, ref: DocumentReference) -> DocumentSnapshot:
+        rows = self._read('SELECT data FROM documents WHERE path = ?', [ref.path])
+        return DocumentSnapshot(ref, json.loads(rows[0][0]) if rows else None)
+    
+    def _read(self, sql: str, params: List) -> List[Tuple]:
+        """트랜잭션 연결에서 읽기 (query.stream(transaction=...))"""
+        if self._connection is None:
+            raise RuntimeError("Transaction is not running")
+        return self._connection.execute(sql, params).fetchall()
+
+
+class SQLiteClient:
+    """Firestore Client와 같은 형태의 SQLite 클라이언트 (스레드 안전)"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+    
+    def collection(self, path: str) -> CollectionReference:
+        return CollectionReference(self, path)
+    
+    def batch(self) -> WriteBatch:
+        return WriteBatch(self)
+    
+    def transaction(self) -> Transaction:
+        return Transaction(self)
+    
+    def get_all(self, references: Iterable) -> Iterator[DocumentSnapshot]:
+        references = [_unwrap(ref) for ref in references]
+        if not references:
+            return
+        
+        placeholders = ', '.join('?' * len(references))
+        rows = self._read(
+            f"SELECT path, data FROM documents WHERE path IN ({placeholders})",
+            [ref.path for ref in references]
+        )
+        found = {path: json.loads(data) for path, data in rows}
+        
+        for ref in references:
+            yield DocumentSnapshot(ref, found.get(ref.path))
+    
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
+    # ---- 내부 ----
+    
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        """새 연결 (스레드별 연결 / 트랜잭션 전용 연결)"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        self._ensure_schema(conn)
+        return conn
+    
+    def _ensure_schema(self, conn: sqlite3.Connection):
+        with self._init_lock:
+            if self._initialized:
+                return
+            conn.executescript(_SCHEMA)
+            for fields in _INDEXED_FIELDS:
+                name = 'idx_' + '_'.join(field.replace('.', '_') for field in fields)
+                exprs = ', '.join(_field_expr(field) for field in fields)
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON documents (collection, {exprs}, id)")
+            self._initialized = True
+            logger.info(f"SQLite storage ready: {self.path}")
+    
+    def _read(self, sql: str, params: List) -> List[Tuple]:
+        return self._conn().execute(sql, params).fetchall()
+    
+    @contextmanager
+    def _transaction(self, conn: Optional[sqlite3.Connection] = None):
+        conn = conn or self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+    
+    def _get(self, ref: DocumentReference) -> DocumentSnapshot:
+        rows = self._read('SELECT data FROM documents WHERE path = ?', [ref.path])
+        return DocumentSnapshot(ref, json.loads(rows[0][0]) if rows else None)
+    
+    def _commit(self, ops: List[Tuple]):
+        with self._transaction() as conn:
+            self._apply(conn, ops)
+    
+    def _apply(self, conn: sqlite3.Connection, ops: List[Tuple]):
+        """열린 트랜잭션에 쓰기 적용"""
+        for op, ref, data, merge in ops:
+            if op == 'delete':
+                conn.execute('DELETE FROM documents WHERE path = ?', (ref.path,))
+                continue
+            
+            row = conn.execute('SELECT data FROM documents WHERE path = ?', (ref.path,)).fetchone()
+            current = _decode(json.loads(row[0])) if row else None
+            
+            if op == 'update':
+                if current is None:
+                    raise NotFound(f"No document to update: {ref.path}")
+                doc = _update(current, data)
+            elif merge:
+                doc = _merge(current or {}, data)
+            else:
+                doc = _resolve(data)
+            
+            conn.execute(
+                'INSERT INTO documents (path, collection, id, data) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(path) DO UPDATE SET data = excluded.data',
+                (ref.path, ref.path.rsplit('/', 1)[0], ref.id, _dumps(doc))
+            )
+
+
+def _unwrap(reference):
+    """비동기 래퍼 참조 → 동기 참조"""
+    return getattr(reference, '_ref', reference)
+
+
+# ---- 비동기 래퍼 (firestore_async.client()와 같은 형태) ----
+
+class AsyncDocumentReference:
+    def __init__(self, ref: DocumentReference):
+        self._ref = ref
+    
+    @property
+    def id(self) -> str:
+        return self._ref.id
+    
+    @property
+    def parent(self) -> 'AsyncQuery':
+        return AsyncQuery(self._ref.parent)
+    
+    def collection(self, name: str) -> 'AsyncQuery':
+        return AsyncQuery(self._ref.collection(name))
+    
+    async def get(self, transaction: Optional['AsyncTransaction'] = None) -> DocumentSnapshot:
+        return _async_snapshot(await asyncio.to_thread(self._ref.get, transaction))
+    
+    async def set(self, data: Dict, merge: bool = False):
+        await asyncio.to_thread(self._ref.set, data, merge)
+    
+    async def update(self, data: Dict):
+        await asyncio.to_thread(self._ref.update, data)
+    
+    async def delete(self):
+        await asyncio.to_thread(self._ref.delete)
+
+
+def _async_snapshot(snapshot: DocumentSnapshot) -> DocumentSnapshot:
+    return DocumentSnapshot(AsyncDocumentReference(snapshot.reference), snapshot._data)
+
+
+class AsyncQuery:
+    """쿼리/컬렉션 비동기 래퍼 (SQLite 호출은 스레드에서 실행)"""
+    
+    def __init__(self, query: Query):
+        self._query = query
+    
+    @property
+    def id(self) -> str:
+        return self._query.id
+    
+    def document(self, document_id: Optional[str] = None) -> AsyncDocumentReference:
+        return AsyncDocumentReference(self._query.document(document_id))
+    
+    def where(self, *args) -> 'AsyncQuery':
+        return AsyncQuery(self._query.where(*args))
+    
+    def order_by(self, *args, **kwargs) -> 'AsyncQuery':
+        return AsyncQuery(self._query.order_by(*args, **kwargs))
+    
+    def limit(self, count: int) -> 'AsyncQuery':
+        return AsyncQuery(self._query.limit(count))
+    
+    def start_after(self, values) -> 'AsyncQuery':
+        return AsyncQuery(self._query.start_after(values))
+    
+    def select(self, field_paths: Iterable[str]) -> 'AsyncQuery':
+        return AsyncQuery(self._query.select(field_paths))
+    
+    async def stream(self, transaction: Optional['AsyncTransaction'] = None):
+        for snapshot in await asyncio.to_thread(self._query.get, transaction):
+            yield _async_snapshot(snapshot)
+    
+    async def get(self, transaction: Optional['AsyncTransaction'] = None) -> List[DocumentSnapshot]:
+        return [_async_snapshot(snapshot) for snapshot in await asyncio.to_thread(self._query.get, transaction)]
+    
+    def count(self) -> '_AsyncCountQuery':
+        return _AsyncCountQuery(self._query.count())
+
+
+class _AsyncCountQuery:
+    def __init__(self, query: CountQuery):
+        self._query = query
+    
+    async def get(self) -> List[List[_AggregationResult]]:
+        return await asyncio.to_thread(self._query.get)
+
+
+class AsyncWriteBatch(WriteBatch):
+    async def commit(self) -> List:
+        await asyncio.to_thread(self._client._commit, self._ops)
+        self._ops = []
+        return []
+
+
+class AsyncTransaction(Transaction):
+    """
+    비동기 트랜잭션 (func는 코루틴 함수, 전용 연결의 SQLite 호출은 스레드에서 실행)
+    
+    같은 프로세스의 비동기 트랜잭션은 순서대로 실행합니다. (잠금 대기 중인 BEGIN이
+    스레드 풀을 모두 차지하면 잠금을 가진 트랜잭션의 읽기가 실행되지 못함)
+    """
+    
+    def __init__(self, client: 'SQLiteClient', lock: asyncio.Lock):
+        super().__init__(client)
+        self._lock = lock
+    
+    async def run(self, func):
+        async with self._lock:
+            return await self._run(func)
+    
+    async def _run(self, func):
+        conn = await asyncio.to_thread(self._client._connect)
+        try:
+            await asyncio.to_thread(conn.execute, 'BEGIN IMMEDIATE')
+            self._connection = conn
+            try:
+                result = await func(self)
+                await asyncio.to_thread(self._client._apply, conn, self._ops)
+            except BaseException:
+                await asyncio.shield(asyncio.to_thread(conn.execute, 'ROLLBACK'))
+                raise
+            await asyncio.shield(asyncio.to_thread(conn.execute, 'COMMIT'))
+        finally:
+            self._connection = None
+            self._ops = []
+            conn.close()
+        return result
+
+
+class AsyncSQLiteClient:
+    """firestore_async AsyncClient와 같은 형태의 SQLite 클라이언트"""
+    
+    def __init__(self, client: SQLiteClient):
+        self._client = client
+        self._transaction_lock: Optional[asyncio.Lock] = None
+        self._transaction_loop = None
+    
+    def collection(self, path: str) -> AsyncQuery:
+        return AsyncQuery(self._client.collection(path))
+    
+    def batch(self) -> AsyncWriteBatch:
+        return AsyncWriteBatch(self._client)
+    
+    def transaction(self) -> AsyncTransaction:
+        loop = asyncio.get_running_loop()
+        if self._transaction_loop is not loop:
+            self._transaction_lock = asyncio.Lock()
+            self._transaction_loop = loop
+        return AsyncTransaction(self._client, self._transaction_lock)
+    
+    async def get_all(self, references: Iterable):
+        snapshots = await asyncio.to_thread(lambda: list(self._client.get_all(references)))
+        for snapshot in snapshots:
+            yield _async_snapshot(snapshot)
+
+
+# 전역 SQLite 클라이언트 (최초 사용 시 생성)
+_client: Optional[SQLiteClient] = None
+_client_lock = threading.Lock()
+
+
+def get_sqlite_client() -> SQLiteClient:
+    """전역 SQLite 클라이언트 가져오기 (settings.SQLITE_PATH)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = SQLiteClient(settings.SQLITE_PATH)
+    return _client
@@ -0,0 +1,325 @@
+"""
+워커 프로세스 진입점 - 스케줄러, 크롤링, 자동 생성 파이프라인 실행
+
+API 프로세스(uvicorn)와 분리하여 크롤링의 CPU/GIL 경합이 API 응답을 막지 않게 합니다.
+API는 worker_tasks에 작업을 넣고 결과를 읽기만 합니다. (app.services.task_queue)
+
+실행:
+    python -m app.worker
+
+스케줄러가 사이트별 작업을 중복 실행하지 않도록 워커는 하나만 실행합니다.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+import logging
+import os
+import signal
+import threading
+import time
+
+from app.config import settings
+from app.utils import firebase
+from app.utils.change_feed import get_change_recorder
+from app.services.crawler import crawl_site_job
+from app.services.crawl_log_writer import get_crawl_log_writer
+from app.services.scheduler_service import init_scheduler, shutdown_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    """작업 큐 소비 + 크롤링 스케줄러 소유"""
+    
+    def __init__(self, poll_interval: float = 2.0, max_tasks: int = 3, publish_changes: bool = True):
+        self.poll_interval = poll_interval
+        self.max_tasks = max_tasks  # 동시에 실행하는 작업 수 (큐에서 꺼내는 수도 이만큼으로 제한)
+        self.publish_changes = publish_changes  # API가 다른 프로세스일 때만 변경 알림 저장
+        self.executor = ThreadPoolExecutor(max_workers=max_tasks, thread_name_prefix='worker-task')
+        self.scheduler = None
+        self.started_at: Optional[datetime] = None
+        self._running: Dict[str, Future] = {}  # task_id -> 실행 중인 작업
+        self._stopping = threading.Event()
+        self._last_heartbeat = 0.0
+        self.completed = 0
+        self.failed = 0
+        self.handlers: Dict[str, Callable[[Dict, Callable[[str, str], None]], Optional[Dict]]] = {
+            'sync_site': self._sync_site,
+            'crawl_site': self._crawl_site,
+            'create_cardnews': self._create_cardnews
+        }
+    
+    # ---- 수명 주기 ----
+    
+    def start(self):
+        """스케줄러 시작, 활성 사이트 작업 등록"""
+        self.started_at = datetime.now(timezone.utc)
+        get_change_recorder().enabled = self.publish_changes
+        
+        self._recover_tasks()
+        
+        self.scheduler = init_scheduler()
+        active_sites = [s for s in firebase.get_all_sites() if s.get('status') == 'active']
+        for site in active_sites:
+            self._add_site_job(site)
+        
+        logger.info(f"Worker started: {len(active_sites)} active sites, {self.max_tasks} task slots")
+    
+    def run(self):
+        """작업 큐 처리 루프 (stop() 호출까지 블로킹)"""
+        self.start()
+        try:
+            while not self._stopping.is_set():
+                try:
+                    self.poll()
+                    self.publish()
+                    self.heartbeat()
+                except Exception as e:
+                    logger.error(f"Worker loop error: {str(e)}", exc_info=True)
+                
+                self._stopping.wait(self.poll_interval)
+        finally:
+            self.shutdown()
+    
+    def stop(self):
+        """루프 중지 요청 (시그널 핸들러에서 호출)"""
+        self._stopping.set()
+    
+    def shutdown(self):
+        """실행 중인 크롤링/작업 완료 대기 후 종료"""
+        shutdown_scheduler()
+        self.executor.shutdown(wait=True)
+        
+        # 크롤링 로그 버퍼 최종 저장 후 남은 변경 알림 저장
+        get_crawl_log_writer().close()
+        self.publish()
+        self.heartbeat(force=True, status='stopped')
+        logger.info("Worker stopped")
+    
+    # ---- 작업 큐 ----
+    
+    def poll(self) -> int:
+        """
+        대기 중인 작업을 빈 슬롯만큼 꺼내 실행
+        
+        Returns:
+            시작한 작업 수
+        """
+        self._running = {task_id: f for task_id, f in self._running.items() if not f.done()}
+        free = self.max_tasks - len(self._running)
+        if free <= 0:
+            return 0
+        
+        started = 0
+        for task in firebase.get_worker_tasks(status='queued', limit=free):
+            # 그 사이 취소되었거나 다른 워커가 꺼낸 작업은 건너뜀
+            if not firebase.transition_worker_task(task['id'], 'queued', {
+                'status': 'running',
+                'started_at': datetime.now(timezone.utc)
+            }):
+                logger.info(f"Worker task already taken: {task['type']} ({task['id']})")
+                continue
+            
+            self._running[task['id']] = self.executor.submit(self._execute, task)
+            started += 1
+        
+        return started
+    
+    def _execute(self, task: Dict):
+        """작업 실행 후 결과 저장"""
+        handler = self.handlers.get(task['type'])
+        update = {}
+        
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown task type: {task['type']}")
+            
+            update['result'] = handler(task.get('payload') or {}, self._progress_reporter(task['id']))
+            update['status'] = 'completed'
+            self.completed += 1
+            logger.info(f"Worker task completed: {task['type']} ({task['id']})")
+        except Exception as e:
+            update['status'] = 'failed'
+            update['error'] = str(e)
+            self.failed += 1
+            logger.error(f"Worker task failed: {task['type']} ({task['id']}): {str(e)}", exc_info=True)
+        
+        # 변경 알림을 결과보다 먼저 저장 (결과를 받은 API가 피드를 다시 읽을 때 색인/캐시 반영 대기 최소화)
+        try:
+            self.publish()
+        except Exception as e:
+            logger.error(f"Failed to publish worker changes: {str(e)}")
+        
+        update['completed_at'] = datetime.now(timezone.utc)
+        try:
+            firebase.update_worker_task(task['id'], update)
+        except Exception as e:
+            logger.error(f"Failed to save worker task result {task['id']}: {str(e)}")
+    
+    def _progress_reporter(self, task_id: str) -> Callable[[str, str], None]:
+        """작업 진행 단계를 작업 문서에 기록하는 콜백 (API 작업 진행 이벤트로 전달됨)"""
+        def report(step: str, message: str):
+            try:
+                firebase.update_worker_task(task_id, {'progress': {'step': step, 'message': message}})
+            except Exception as e:
+                logger.warning(f"Failed to save worker task progress {task_id}: {str(e)}")
+        
+        return report
+    
+    def _recover_tasks(self):
+        """이전 워커가 실행 중에 종료되어 running으로 남은 작업을 실패 처리"""
+        for task in firebase.get_worker_tasks(status='running', limit=100):
+            firebase.update_worker_task(task['id'], {
+                'status': 'failed',
+                'error': 'Worker restarted before the task finished',
+                'completed_at': datetime.now(timezone.utc)
+            })
+            logger.warning(f"Worker task abandoned by previous worker: {task['type']} ({task['id']})")
+    
+    # ---- 작업 종류 ----
+    
+    def _sync_site(self, payload: Dict, progress: Callable[[str, str], None]) -> Dict:
+        """사이트 생성/수정/삭제 후 스케줄러 작업 동기화"""
+        site_id = payload['site_id']
+        site = firebase.get_site(site_id)
+        
+        if site and site.get('status') == 'active':
+            self._add_site_job(site)
+            return {'scheduled': True}
+        
+        self.scheduler.remove_site_job(site_id)
+        return {'scheduled': False}
+    
+    def _crawl_site(self, payload: Dict, progress: Callable[[str, str], None]) -> Dict:
+        """수동 크롤링 (스케줄러 작업이 있으면 즉시 실행으로 당기고, 없으면 직접 실행)"""
+        site_id = payload['site_id']
+        
+        if self.scheduler.get_job_info(site_id):
+            self.scheduler.trigger_site_job_now(site_id)
+            return {'status': 'triggered'}
+        
+        progress('crawl', 'RSS 피드 크롤링 중')
+        return crawl_site_job(site_id)
+    
+    def _create_cardnews(self, payload: Dict, progress: Callable[[str, str], None]) -> Dict:
+        """RSS 게시물로 카드뉴스 생성 (자동 생성 파이프라인)"""
+        from app.services.pipeline_service import AutoGenerationPipeline
+        
+        pipeline = AutoGenerationPipeline(model='gpt-4.1-nano')
+        project_id = pipeline.generate_cardnews_from_post(
+            post=payload['post'],
+            site_id=payload['site_id'],
+            site_name=payload['site_name'],
+            on_progress=progress
+        )
+        
+        if not project_id:
+            raise ValueError("Failed to generate cardnews")
+        
+        return {'project_id': project_id}
+    
+    def _add_site_job(self, site: Dict):
+        self.scheduler.add_site_job(
+            site_id=site['id'],
+            site_name=site['name'],
+            rss_url=site['rss_url'],
+            crawl_interval=site['crawl_interval'],
+            crawl_func=crawl_site_job
+        )
+    
+    # ---- API 프로세스로 알림 ----
+    
+    def publish(self):
+        """이 프로세스에서 쓴 라이브러리 항목/프로젝트를 worker_events로 저장"""
+        if not self.publish_changes:
+            return
+        
+        changes = get_change_recorder().drain()
+        if changes:
+            firebase.create_worker_event(changes)
+    
+    def heartbeat(self, force: bool = False, status: str = 'running'):
+        """워커 상태 저장 (WORKER_HEARTBEAT_INTERVAL마다)"""
+        now = time.monotonic()
+        if not force and now - self._last_heartbeat < settings.WORKER_HEARTBEAT_INTERVAL:
+            return
+        
+        self._last_heartbeat = now
+        firebase.set_worker_heartbeat({
+            'status': status,
+            'pid': os.getpid(),
+            'started_at': self.started_at,
+            'running_tasks': len([f for f in self._running.values() if not f.done()]),
+            'completed_tasks': self.completed,
+            'failed_tasks': self.failed,
+            'scheduled_jobs': len(self.scheduler.get_all_jobs()) if self.scheduler else 0
+        })
+
+
+# API 프로세스 안에서 실행하는 워커 (WORKER_EMBEDDED)
+_embedded_worker: Optional[Worker] = None
+_embedded_thread: Optional[threading.Thread] = None
+
+
+def start_embedded_worker():
+    """
+    API 프로세스 안에서 워커 실행 (로컬 개발용, WORKER_EMBEDDED=true)
+    
+    같은 프로세스라 쓰기가 검색 색인/캐시에 바로 반영되므로 변경 알림은 저장하지 않습니다.
+    """
+    global _embedded_worker, _embedded_thread
+    
+    if _embedded_thread is not None:
+        return
+    
+    _embedded_worker = Worker(
+        poll_interval=settings.WORKER_POLL_INTERVAL,
+        max_tasks=settings.MAX_CONCURRENT_CRAWLS,
+        publish_changes=False
+    )
+    _embedded_thread = threading.Thread(target=_embedded_worker.run, name='embedded-worker', daemon=True)
+    _embedded_thread.start()
+    logger.warning("Worker running inside the API process (WORKER_EMBEDDED)")
+
+
+def stop_embedded_worker(timeout: float = 30.0):
+    """API 프로세스 안의 워커 종료"""
+    global _embedded_worker, _embedded_thread
+    
+    if _embedded_thread is None:
+        return
+    
+    _embedded_worker.stop()
+    _embedded_thread.join(timeout)
+    _embedded_worker = None
+    _embedded_thread = None
+
+
+def main():
+    """python -m app.worker"""
+    logging.basicConfig(
+        level=getattr(logging, settings.LOG_LEVEL),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    # 저장소 초기화 (API와 같은 STORAGE_BACKEND 선택)
+    firebase.get_db()
+    
+    worker = Worker(
+        poll_interval=settings.WORKER_POLL_INTERVAL,
+        max_tasks=settings.MAX_CONCURRENT_CRAWLS
+    )
+    
+    def _handle_signal(signum, frame):
+        logger.info(f"Signal {signum} received, stopping worker")
+        worker.stop()
+    
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+    
+    worker.run()
+
+
+if __name__ == "__main__":
+    main()
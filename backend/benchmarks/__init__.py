@@ -0,0 +1 @@
+"""로컬 스텁 서버 기반 성능 벤치마크"""
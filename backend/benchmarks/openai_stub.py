@@ -0,0 +1,330 @@
+"""
+결정적(deterministic) OpenAI 호환 로컬 스텁 서버
+
+실제 API 비용 없이 파이프라인을 벤치마크하기 위한 서버입니다.
+- POST /v1/chat/completions: 프롬프트 종류별 고정 응답 (요약/키워드/카드 JSON/채팅 function call/번역)
+- GET /v1/models: 모델 목록 (상태 확인용)
+- GET /feed.xml, GET /articles/{n}: 크롤링 단계용 RSS 피드와 기사 페이지
+
+사용법:
+    python -m benchmarks.openai_stub --port 8100 --latency-ms 300 --latency-dist lognormal --error-rate 0.02
+
+백엔드에서 사용:
+    OPENAI_BASE_URL=http://127.0.0.1:8100/v1
+"""
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, HTMLResponse
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import time
+
+
+class StubConfig:
+    """스텁 서버 동작 설정"""
+
+    def __init__(
+        self,
+        latency_ms: float = 200.0,
+        latency_jitter_ms: float = 50.0,
+        latency_dist: str = 'fixed',
+        tokens_per_second: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 429,
+        article_count: int = 10,
+        seed: int = 42
+    ):
+        """
+        Args:
+            latency_ms: 기본 응답 지연 (첫 토큰까지, 밀리초)
+            latency_jitter_ms: 분포 폭 (uniform: ±폭, lognormal: 표준편차 근사)
+            latency_dist: 'fixed' | 'uniform' | 'lognormal'
+            tokens_per_second: 응답 토큰 생성 속도 (0이면 생성 지연 없음)
+            error_rate: 오류 주입 비율 (0.0 ~ 1.0)
+            error_status: 주입할 HTTP 상태 코드 (429, 500, 503 등)
+            article_count: RSS 피드에 노출할 기사 수
+            seed: 난수 시드 (같은 시드 + 같은 요청 → 같은 결과)
+        """
+        if latency_dist not in ('fixed', 'uniform', 'lognormal'):
+            raise ValueError(f"Unknown latency distribution: {latency_dist}")
+
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.latency_dist = latency_dist
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.article_count = article_count
+        self.seed = seed
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """지연시간 샘플링 (초)"""
+        if self.latency_dist == 'uniform':
+            ms = rng.uniform(self.latency_ms - self.latency_jitter_ms, self.latency_ms + self.latency_jitter_ms)
+        elif self.latency_dist == 'lognormal':
+            # 평균 latency_ms, 표준편차 latency_jitter_ms가 되도록 파라미터 변환
+            mean = max(self.latency_ms, 1.0)
+            variance = self.latency_jitter_ms ** 2
+            sigma = math.sqrt(math.log(1 + variance / mean ** 2))
+            mu = math.log(mean) - sigma ** 2 / 2
+            ms = rng.lognormvariate(mu, sigma)
+        else:
+            ms = self.latency_ms
+
+        return max(ms, 0.0) / 1000
+
+
+# 기사 본문 템플릿 (스크래핑/요약 단계용)
+ARTICLE_PARAGRAPHS = [
+    "Cloud providers announced a new generation of AI infrastructure designed to lower inference cost for enterprise workloads.",
+    "The update includes improved scheduling for GPU clusters, faster model loading and better observability for token usage.",
+    "Analysts expect the changes to accelerate adoption among mid-sized companies that previously found hosted models too expensive.",
+    "Security teams will also gain new controls for data residency, audit logging and key management across regions.",
+    "Developers can opt in through a preview program, with general availability planned for the next quarter.",
+    "Early customers reported latency improvements of up to forty percent on retrieval-augmented generation pipelines.",
+]
+
+
+def _request_rng(config: StubConfig, body: Dict) -> random.Random:
+    """요청 본문 기반 결정적 난수 생성기"""
+    digest = hashlib.sha256(
+        (str(config.seed) + json.dumps(body, sort_keys=True, ensure_ascii=False)).encode()
+    ).hexdigest()
+    return random.Random(int(digest[:16], 16))
+
+
+def _estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (4글자 ≈ 1토큰)"""
+    return max(1, len(text) // 4)
+
+
+def _card_json(card_count: int) -> str:
+    """카드뉴스 생성용 고정 JSON 응답"""
+    cards = [{"type": "title", "title": "AI 인프라의 새로운 변화", "content": "클라우드 AI 비용이 낮아집니다"}]
+    for i in range(1, max(card_count - 1, 1)):
+        cards.append({
+            "type": "content",
+            "title": f"핵심 포인트 {i}",
+            "content": f"{i}번째 핵심 내용입니다. 추론 비용 절감과 관측성 향상이 주요 변화입니다."
+        })
+    cards.append({"type": "closing", "title": "정리", "content": "앞으로의 변화를 지켜봐 주세요."})
+    return json.dumps({"cards": cards}, ensure_ascii=False)
+
+
+def _sections_json(count: int) -> str:
+    """전체 수정(modify_all_content)용 고정 JSON 응답"""
+    sections = []
+    for i in range(count):
+        card_type = 'title' if i == 0 else ('closing' if i == count - 1 else 'content')
+        sections.append({"type": card_type, "title": f"수정된 제목 {i + 1}", "content": f"수정된 내용 {i + 1}입니다."})
+    return json.dumps({"sections": sections}, ensure_ascii=False)
+
+
+def build_completion(body: Dict) -> Dict:
+    """
+    요청 종류를 판별하여 응답 메시지 생성
+
+    Returns:
+        {'content': str | None, 'function_call': dict | None}
+    """
+    messages: List[Dict] = body.get('messages', [])
+    user_text = '\n'.join(m.get('content') or '' for m in messages if m.get('role') == 'user')
+    system_text = '\n'.join(m.get('content') or '' for m in messages if m.get('role') == 'system')
+
+    # 채팅 (function calling)
+    if body.get('functions'):
+        last_user = next((m.get('content') or '' for m in reversed(messages) if m.get('role') == 'user'), '')
+        if any(word in last_user for word in ('전체', '모두', '모든')):
+            return {'content': None, 'function_call': {
+                'name': 'modify_all_content',
+                'arguments': json.dumps({'instruction': last_user}, ensure_ascii=False)
+            }}
+        return {'content': None, 'function_call': {
+            'name': 'modify_section',
+            'arguments': json.dumps({'section_index': 1, 'new_content': '더 간결하게 수정된 내용입니다.'}, ensure_ascii=False)
+        }}
+
+    # 카드뉴스 생성
+    if '"cards"' in user_text:
+        match = re.search(r'(\d+)개의 카드뉴스', user_text)
+        return {'content': _card_json(int(match.group(1)) if match else 5), 'function_call': None}
+
+    # 전체 수정
+    if '"sections"' in user_text:
+        match = re.search(r'카드의 개수는 (\d+)개', user_text)
+        return {'content': _sections_json(int(match.group(1)) if match else 5), 'function_call': None}
+
+    # 키워드 추출
+    if 'Keywords / 키워드' in user_text:
+        return {'content': 'AI 인프라, 추론 비용, GPU, 관측성, 보안', 'function_call': None}
+
+    # 번역
+    if '번역' in system_text:
+        return {'content': 'AI 인프라 신규 발표', 'function_call': None}
+
+    # 요약 (기본)
+    return {
+        'content': "클라우드 제공업체들이 추론 비용을 낮추는 새로운 AI 인프라를 발표했습니다. "
+                   "GPU 스케줄링 개선과 토큰 사용량 관측 기능이 포함되었습니다.",
+        'function_call': None
+    }
+
+
+def create_stub_app(config: Optional[StubConfig] = None) -> FastAPI:
+    """
+    스텁 서버 FastAPI 앱 생성
+
+    Args:
+        config: 스텁 설정 (None이면 기본값)
+
+    Returns:
+        FastAPI 앱
+    """
+    config = config or StubConfig()
+    app = FastAPI(title="OpenAI Stub", version="1.0.0")
+    app.state.config = config
+
+    @app.get("/v1/models")
+    async def list_models():
+        now = int(time.time())
+        return {
+            "object": "list",
+            "data": [
+                {"id": model, "object": "model", "created": now, "owned_by": "stub"}
+                for model in ('gpt-4.1-nano', 'gpt-4.1-mini', 'gpt-4o-mini', 'gpt-5-nano', 'gpt-5-mini')
+            ]
+        }
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        rng = _request_rng(config, body)
+
+        latency = config.sample_latency(rng)
+
+        # 오류 주입
+        if config.error_rate > 0 and rng.random() < config.error_rate:
+            await asyncio.sleep(latency)
+            error_type = 'rate_limit_exceeded' if config.error_status == 429 else 'server_error'
+            return JSONResponse(
+                status_code=config.error_status,
+                content={"error": {"message": "Injected stub error", "type": error_type, "code": error_type}}
+            )
+
+        result = build_completion(body)
+
+        prompt_tokens = sum(_estimate_tokens(m.get('content') or '') for m in body.get('messages', []))
+        output_text = result['content'] or result['function_call']['arguments']
+        completion_tokens = _estimate_tokens(output_text)
+        if body.get('max_tokens'):
+            completion_tokens = min(completion_tokens, body['max_tokens'])
+
+        # 토큰 생성 속도 반영
+        if config.tokens_per_second > 0:
+            latency += completion_tokens / config.tokens_per_second
+
+        await asyncio.sleep(latency)
+
+        message = {"role": "assistant", "content": result['content']}
+        finish_reason = 'stop'
+        if result['function_call']:
+            message['function_call'] = result['function_call']
+            finish_reason = 'function_call'
+
+        return {
+            "id": f"chatcmpl-stub-{rng.getrandbits(48):012x}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get('model', 'gpt-4.1-nano'),
+            "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+
+    @app.get("/feed.xml")
+    async def rss_feed(request: Request):
+        base_url = str(request.base_url).rstrip('/')
+        published = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        items = []
+        for i in range(config.article_count):
+            items.append(
+                "<item>"
+                f"<title>AI Infrastructure Update {i}</title>"
+                f"<link>{base_url}/articles/{i}</link>"
+                f"<guid>{base_url}/articles/{i}</guid>"
+                f"<description>{ARTICLE_PARAGRAPHS[i % len(ARTICLE_PARAGRAPHS)]}</description>"
+                f"<pubDate>{format_datetime(published + timedelta(hours=i))}</pubDate>"
+                "</item>"
+            )
+
+        xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0"><channel>'
+            f'<title>Stub Feed</title><link>{base_url}</link><description>Benchmark feed</description>'
+            + ''.join(items) +
+            '</channel></rss>'
+        )
+        return Response(content=xml, media_type="application/rss+xml")
+
+    @app.get("/articles/{article_id}", response_class=HTMLResponse)
+    async def article(article_id: int):
+        paragraphs = ''.join(
+            f"<p>{ARTICLE_PARAGRAPHS[(article_id + j) % len(ARTICLE_PARAGRAPHS)]}</p>"
+            for j in range(12)
+        )
+        return (
+            f"<html><head><title>AI Infrastructure Update {article_id}</title></head>"
+            f"<body><article><h1>AI Infrastructure Update {article_id}</h1>{paragraphs}</article></body></html>"
+        )
+
+    return app
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser):
+    """스텁 설정 CLI 인자 등록 (벤치마크 스크립트와 공유)"""
+    parser.add_argument('--latency-ms', type=float, default=200.0, help='기본 응답 지연 (ms)')
+    parser.add_argument('--latency-jitter-ms', type=float, default=50.0, help='지연 분포 폭 (ms)')
+    parser.add_argument('--latency-dist', choices=['fixed', 'uniform', 'lognormal'], default='fixed')
+    parser.add_argument('--tokens-per-second', type=float, default=0.0, help='토큰 생성 속도 (0이면 무시)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 주입 비율 (0.0 ~ 1.0)')
+    parser.add_argument('--error-status', type=int, default=429, help='주입할 HTTP 상태 코드')
+    parser.add_argument('--article-count', type=int, default=10, help='RSS 피드 기사 수')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+
+
+def config_from_args(args: argparse.Namespace) -> StubConfig:
+    """CLI 인자로 StubConfig 생성"""
+    return StubConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        latency_dist=args.latency_dist,
+        tokens_per_second=args.tokens_per_second,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        article_count=args.article_count,
+        seed=args.seed
+    )
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="OpenAI 호환 로컬 스텁 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8100)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    uvicorn.run(create_stub_app(config_from_args(args)), host=args.host, port=args.port, log_level='warning')
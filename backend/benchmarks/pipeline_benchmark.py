@@ -0,0 +1,287 @@
+"""
+파이프라인 부하 벤치마크 (crawl → enrich → generate → chat)
+
+로컬 OpenAI 스텁 서버를 대상으로 실제 서비스 코드(RSSService, WebScraper,
+AISummarizer, CardNewsGenerator, ChatService)를 실행하고 단계별
+처리량과 지연시간 백분위를 보고합니다. Firestore는 사용하지 않습니다.
+
+사용법:
+    # 스텁 서버를 내장 실행 (기본)
+    python -m benchmarks.pipeline_benchmark --posts 20 --concurrency 4 --latency-ms 300
+
+    # 이미 실행 중인 스텁 서버 사용
+    python -m benchmarks.pipeline_benchmark --stub-url http://127.0.0.1:8100
+
+    # 기준 결과와 비교 (p95가 허용치를 넘으면 exit 1)
+    python -m benchmarks.pipeline_benchmark --output result.json
+    python -m benchmarks.pipeline_benchmark --baseline result.json --tolerance 0.2
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.openai_stub import create_stub_app, add_stub_arguments, config_from_args
+
+STAGES = ('crawl', 'enrich', 'generate', 'chat')
+
+
+class StageRecorder:
+    """단계별 지연시간 기록 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        self.errors: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self.first_start: Dict[str, float] = {}
+        self.last_end: Dict[str, float] = {}
+
+    def run(self, stage: str, func, *args, **kwargs):
+        """함수 실행 시간을 측정하여 기록 (예외 시 None 반환)"""
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            with self._lock:
+                self.errors[stage] += 1
+            print(f"  ! {stage} failed: {e}", file=sys.stderr)
+            return None
+        finally:
+            ended = time.perf_counter()
+            with self._lock:
+                self.samples[stage].append(ended - started)
+                self.first_start[stage] = min(self.first_start.get(stage, started), started)
+                self.last_end[stage] = max(self.last_end.get(stage, ended), ended)
+
+    def report(self) -> Dict:
+        """단계별 통계"""
+        result = {}
+        for stage in STAGES:
+            samples = sorted(self.samples[stage])
+            if not samples:
+                continue
+            span = self.last_end[stage] - self.first_start[stage]
+            result[stage] = {
+                'count': len(samples),
+                'errors': self.errors[stage],
+                'throughput_per_sec': round(len(samples) / span, 3) if span > 0 else None,
+                'mean': round(sum(samples) / len(samples), 4),
+                'p50': round(_percentile(samples, 50), 4),
+                'p95': round(_percentile(samples, 95), 4),
+                'p99': round(_percentile(samples, 99), 4),
+                'max': round(samples[-1], 4)
+            }
+        return result
+
+
+def _percentile(ordered: List[float], p: float) -> float:
+    """정렬된 리스트의 백분위 값"""
+    idx = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _free_port() -> int:
+    """사용 가능한 로컬 포트"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_embedded_stub(args: argparse.Namespace) -> str:
+    """스텁 서버를 백그라운드 스레드에서 실행하고 base URL 반환"""
+    import uvicorn
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(
+        create_stub_app(config_from_args(args)),
+        host='127.0.0.1',
+        port=port,
+        log_level='warning'
+    ))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    deadline = time.time() + 10
+    while not server.started:
+        if time.time() > deadline:
+            raise RuntimeError("Stub server failed to start")
+        time.sleep(0.05)
+
+    return f"http://127.0.0.1:{port}"
+
+
+def run_benchmark(stub_url: str, posts: int, concurrency: int, crawl_rounds: int) -> Dict:
+    """
+    벤치마크 실행
+
+    Args:
+        stub_url: 스텁 서버 URL (예: http://127.0.0.1:8100)
+        posts: 처리할 게시물 수
+        concurrency: 동시 처리 게시물 수
+        crawl_rounds: RSS 파싱 반복 횟수
+
+    Returns:
+        단계별 결과와 LLM 텔레메트리 요약
+    """
+    # 앱 설정이 로드되기 전에 스텁 엔드포인트 지정
+    os.environ['OPENAI_BASE_URL'] = f"{stub_url}/v1"
+    os.environ.setdefault('OPENAI_API_KEY', 'sk-stub')
+
+    from app.services.rss_service import RSSService
+    from app.services.scraper import WebScraper
+    from app.services.summarizer import AISummarizer
+    from app.services.card_generator import CardNewsGenerator
+    from app.services.chat_service import ChatService
+    from app.services.llm_telemetry import get_telemetry, tracked_completion
+    from app.utils.openai_client import create_openai_client
+
+    get_telemetry().reset()
+    recorder = StageRecorder()
+    model = 'gpt-4.1-nano'
+
+    # 1. crawl: RSS 파싱
+    rss_service = RSSService()
+    feed_posts = []
+    for _ in range(crawl_rounds):
+        feed_posts = recorder.run('crawl', rss_service.parse_rss_feed, f"{stub_url}/feed.xml") or feed_posts
+
+    if not feed_posts:
+        raise RuntimeError("No posts parsed from stub feed")
+
+    work = [feed_posts[i % len(feed_posts)] for i in range(posts)]
+    scraper = WebScraper()
+    client = create_openai_client()
+
+    def enrich(post: Dict) -> Dict:
+        scraped = scraper.scrape_url(post['link'])
+        content = scraped.get('content') or post.get('summary', '')
+        summary = AISummarizer(model=model).summarize(content, max_length=None)
+        tracked_completion(
+            client,
+            'crawler.title_translation',
+            model=model,
+            messages=[
+                {"role": "system", "content": "당신은 전문 번역가입니다. 제목을 간결하고 자연스러운 한글로 번역해주세요."},
+                {"role": "user", "content": f"다음 제목을 한글로 번역해주세요:\n\n{post['title']}"}
+            ],
+            temperature=0.3,
+            max_tokens=100
+        )
+        return {'content': content, **summary}
+
+    def process(post: Dict):
+        enriched = recorder.run('enrich', enrich, post)
+        if not enriched:
+            return
+
+        sections = recorder.run(
+            'generate',
+            CardNewsGenerator(model=model).generate_sections,
+            summary=enriched['summary'],
+            original_text=enriched['content'],
+            card_count=enriched['card_count']
+        )
+        if not sections:
+            return
+
+        recorder.run(
+            'chat',
+            ChatService(model=model).process_chat_message,
+            user_message="두 번째 카드 더 간결하게 해줘",
+            current_sections=sections
+        )
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(process, work))
+    wall = time.perf_counter() - started
+
+    telemetry = get_telemetry().snapshot()
+
+    return {
+        'config': {'posts': posts, 'concurrency': concurrency, 'crawl_rounds': crawl_rounds},
+        'wall_seconds': round(wall, 3),
+        'posts_per_sec': round(posts / wall, 3) if wall > 0 else None,
+        'stages': recorder.report(),
+        'llm_totals': telemetry['totals']
+    }
+
+
+def compare_with_baseline(result: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    기준 결과 대비 p95 회귀 검사
+
+    Returns:
+        회귀 메시지 목록 (비어있으면 통과)
+    """
+    regressions = []
+    for stage, stats in result['stages'].items():
+        base = baseline.get('stages', {}).get(stage)
+        if not base:
+            continue
+        limit = base['p95'] * (1 + tolerance)
+        if stats['p95'] > limit:
+            regressions.append(f"{stage}: p95 {stats['p95']:.3f}s > {limit:.3f}s (baseline {base['p95']:.3f}s)")
+    return regressions
+
+
+def print_report(result: Dict):
+    """결과 출력"""
+    print("=" * 80)
+    print(f"📊 Pipeline benchmark: {result['config']}")
+    print("=" * 80)
+    print(f"{'stage':<10}{'count':>7}{'err':>5}{'ops/s':>9}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for stage, s in result['stages'].items():
+        throughput = f"{s['throughput_per_sec']:.2f}" if s['throughput_per_sec'] else '-'
+        print(
+            f"{stage:<10}{s['count']:>7}{s['errors']:>5}{throughput:>9}"
+            f"{s['mean']:>9.3f}{s['p50']:>9.3f}{s['p95']:>9.3f}{s['p99']:>9.3f}{s['max']:>9.3f}"
+        )
+    print("-" * 80)
+    print(f"wall: {result['wall_seconds']}s, posts/s: {result['posts_per_sec']}")
+    print(f"LLM: {result['llm_totals']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="CardNews 파이프라인 부하 벤치마크")
+    parser.add_argument('--stub-url', default=None, help='실행 중인 스텁 서버 URL (없으면 내장 실행)')
+    parser.add_argument('--posts', type=int, default=10, help='처리할 게시물 수')
+    parser.add_argument('--concurrency', type=int, default=4, help='동시 처리 수')
+    parser.add_argument('--crawl-rounds', type=int, default=3, help='RSS 파싱 반복 횟수')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', default=None, help='비교할 기준 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='p95 허용 증가율 (기본 20%%)')
+    add_stub_arguments(parser)
+    args = parser.parse_args(argv)
+
+    stub_url = args.stub_url or start_embedded_stub(args)
+    result = run_benchmark(stub_url, args.posts, args.concurrency, args.crawl_rounds)
+    print_report(result)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_with_baseline(result, json.load(f), args.tolerance)
+        if regressions:
+            print("❌ Regressions detected:")
+            for line in regressions:
+                print(f"   {line}")
+            return 1
+        print("✅ No regressions against baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
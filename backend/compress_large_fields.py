@@ -0,0 +1,110 @@
+"""
+큰 텍스트 필드 압축 이관 스크립트
+
+- rss_posts.content, projects.source_content 중 압축되지 않은 큰 문자열을
+  COMPRESSION_CODEC으로 압축해 다시 저장
+- 새로 저장되는 데이터는 쓰기 시점에 압축되므로 기존 데이터 이관에만 필요
+- 이미 압축된 값과 임계값 미만 값은 건너뜀 (여러 번 실행해도 안전)
+
+사용법:
+    python compress_large_fields.py                        # 모든 대상 컬렉션
+    python compress_large_fields.py --collection rss_posts
+    python compress_large_fields.py --dry-run              # 저장하지 않고 절감량만 계산
+"""
+
+import sys
+import os
+import argparse
+import logging
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.config import settings
+from app.utils.compression import COMPRESSED_FIELDS, compress_text, is_compressed
+from app.utils.firebase import get_db, _ChunkedBatch
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def compress_collection(db, collection: str, dry_run: bool = False) -> dict:
+    """
+    컬렉션의 압축 대상 필드 이관
+    
+    Returns:
+        {'scanned', 'compressed', 'original_bytes', 'stored_bytes'}
+    """
+    fields = COMPRESSED_FIELDS[collection]
+    result = {'scanned': 0, 'compressed': 0, 'original_bytes': 0, 'stored_bytes': 0}
+    batch = _ChunkedBatch(db, headroom=0)
+    
+    # 큰 필드만 읽음
+    for doc in db.collection(collection).select(list(fields)).stream():
+        data = doc.to_dict() or {}
+        result['scanned'] += 1
+        
+        updates = {}
+        for field in fields:
+            value = data.get(field)
+            if not isinstance(value, str) or is_compressed(value):
+                continue
+            
+            stored = compress_text(value)
+            if stored is not value:
+                updates[field] = stored
+                result['original_bytes'] += len(value.encode('utf-8'))
+                result['stored_bytes'] += len(stored)
+        
+        if not updates:
+            continue
+        
+        result['compressed'] += 1
+        if dry_run:
+            continue
+        
+        batch.update(doc.reference, updates)
+        if batch.full():
+            batch.take().commit()
+    
+    pending = batch.take()
+    if pending is not None and not dry_run:
+        pending.commit()
+    
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="큰 텍스트 필드 압축 이관")
+    parser.add_argument('--collection', choices=sorted(COMPRESSED_FIELDS), default=None, help='특정 컬렉션만 이관')
+    parser.add_argument('--dry-run', action='store_true', help='저장하지 않고 절감량만 계산')
+    args = parser.parse_args()
+    
+    logger.info("Large Field Compression Script")
+    logger.info("="*60)
+    
+    db = get_db()
+    if db is None:
+        logger.error("Firestore not initialized")
+        sys.exit(1)
+    
+    if settings.COMPRESSION_MIN_BYTES <= 0:
+        logger.error("COMPRESSION_MIN_BYTES is 0 (compression disabled)")
+        sys.exit(1)
+    
+    collections = [args.collection] if args.collection else sorted(COMPRESSED_FIELDS)
+    for collection in collections:
+        result = compress_collection(db, collection, dry_run=args.dry_run)
+        saved = result['original_bytes'] - result['stored_bytes']
+        ratio = (result['stored_bytes'] / result['original_bytes'] * 100) if result['original_bytes'] else 0
+        logger.info(
+            f"{'🔎' if args.dry_run else '✅'} {collection}: {result['compressed']}/{result['scanned']} documents, "
+            f"{result['original_bytes']:,} → {result['stored_bytes']:,} bytes ({ratio:.1f}%, saved {saved:,})"
+        )
+    
+    if args.dry_run:
+        logger.info("Dry run: nothing was written")
@@ -0,0 +1,43 @@
+"""
+보존 기간이 지난 크롤링 로그 정리 스크립트
+
+- 새 로그는 expires_at 필드로 Firestore TTL 정책에 의해 자동 삭제됨
+- expires_at이 없는 기존 로그는 이 스크립트로 정리
+
+사용법:
+    python purge_crawl_logs.py              # CRAWL_LOG_RETENTION_DAYS 기준
+    python purge_crawl_logs.py --days 14    # 14일 이전 로그 삭제
+    python purge_crawl_logs.py --site-id <site_id>
+"""
+
+import sys
+import os
+import argparse
+import logging
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.config import settings
+from app.utils.firebase import purge_crawl_logs
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="크롤링 로그 보존 기간 정리")
+    parser.add_argument('--days', type=int, default=settings.CRAWL_LOG_RETENTION_DAYS, help='보존 기간 (일)')
+    parser.add_argument('--site-id', default=None, help='특정 사이트만 정리')
+    args = parser.parse_args()
+    
+    logger.info("Crawl Logs Purge Script")
+    logger.info("="*60)
+    
+    deleted = purge_crawl_logs(older_than_days=args.days, site_id=args.site_id)
+    
+    logger.info(f"✅ Deleted {deleted} crawl logs older than {args.days} days")
@@ -0,0 +1,173 @@
+"""
+라이브러리 피드 materialized 컬렉션(library_items) 재구축 스크립트
+
+- 모든 RSS 게시물 → library_items/{md5(url)}.post
+- 모든 RSS 프로젝트 → library_items/{md5(url)}.project
+  (프로젝트에 정렬 키 published_at / library_key가 없으면 추가)
+- 프로젝트와 같은 URL의 RSS 게시물을 프로젝트에 연결 (has_cardnews, project_id)
+- library_items 전체로 집계 카운터(library_stats) 재계산
+
+새로 저장되는 데이터는 쓰기 시점에 자동 반영되므로, 기존 데이터 이관이나
+불일치 복구가 필요할 때만 실행하면 됩니다. (여러 번 실행해도 안전)
+"""
+
+import sys
+import os
+import logging
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.firebase import (
+    get_db,
+    _library_key,
+    _library_item_from_post,
+    _library_item_from_project,
+    _library_stats_state,
+    _library_stats_deltas,
+    _nest,
+    LIBRARY_STATS_ALL
+)
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 400  # Firestore 배치 최대 500 쓰기
+
+
+class BatchWriter:
+    """일정 개수마다 커밋하는 WriteBatch 래퍼"""
+    
+    def __init__(self, db):
+        self.db = db
+        self.batch = db.batch()
+        self.pending = 0
+    
+    def set(self, ref, data, merge=False):
+        self.batch.set(ref, data, merge=merge)
+        self._count()
+    
+    def update(self, ref, data):
+        self.batch.update(ref, data)
+        self._count()
+    
+    def delete(self, ref):
+        self.batch.delete(ref)
+        self._count()
+    
+    def _count(self):
+        self.pending += 1
+        if self.pending >= BATCH_SIZE:
+            self.flush()
+    
+    def flush(self):
+        if self.pending:
+            self.batch.commit()
+            self.batch = self.db.batch()
+            self.pending = 0
+
+
+def rebuild_library_items():
+    """library_items 재구축"""
+    db = get_db()
+    if db is None:
+        logger.error("Firestore not initialized")
+        return
+    
+    writer = BatchWriter(db)
+    items = db.collection('library_items')
+    post_count = 0
+    project_count = 0
+    linked_count = 0
+    
+    # 1. RSS 게시물
+    linked_posts = set()
+    for doc in db.collection('rss_posts').stream():
+        post = doc.to_dict()
+        if not post.get('url'):
+            continue
+        
+        writer.set(items.document(doc.id), _library_item_from_post(post), merge=True)
+        post_count += 1
+        
+        if post.get('has_cardnews'):
+            linked_posts.add(doc.id)
+    
+    logger.info(f"📰 RSS posts: {post_count}")
+    
+    # 2. RSS 프로젝트
+    for doc in db.collection('projects').where('source_type', '==', 'rss').stream():
+        project = doc.to_dict()
+        if not project.get('source_url'):
+            continue
+        
+        project_updates = {}
+        if not project.get('published_at'):
+            project_updates['published_at'] = project.get('original_published_at') or project.get('created_at')
+        if not project.get('library_key'):
+            project_updates['library_key'] = _library_key(project['source_url'])
+        
+        if project_updates:
+            writer.update(doc.reference, project_updates)
+            project.update(project_updates)
+        
+        writer.set(items.document(project['library_key']), _library_item_from_project(project), merge=True)
+        project_count += 1
+        
+        # 같은 URL의 RSS 게시물 연결
+        if project['library_key'] not in linked_posts:
+            post_ref = db.collection('rss_posts').document(project['library_key'])
+            if post_ref.get().exists:
+                writer.update(post_ref, {'has_cardnews': True, 'project_id': doc.id})
+                linked_posts.add(project['library_key'])
+                linked_count += 1
+    
+    writer.flush()
+    
+    # 3. 집계 카운터 재계산 (증분 갱신 중 어긋난 값도 복구)
+    stats_count = rebuild_library_stats(db, writer)
+    
+    # 결과 요약
+    logger.info("\n" + "="*60)
+    logger.info("Rebuild completed!")
+    logger.info(f"📰 RSS posts: {post_count}")
+    logger.info(f"🗂️  Projects: {project_count}")
+    logger.info(f"🔗 RSS posts linked: {linked_count}")
+    logger.info(f"📊 Stats documents: {stats_count}")
+    logger.info("="*60)
+
+
+def rebuild_library_stats(db, writer: BatchWriter) -> int:
+    """library_items 전체를 집계하여 library_stats 문서 교체"""
+    totals = {}
+    for doc in db.collection('library_items').stream():
+        state = _library_stats_state(doc.to_dict())
+        for doc_id, paths in _library_stats_deltas(None, state).items():
+            counters = totals.setdefault(doc_id, {})
+            for path, delta in paths.items():
+                counters[path] = counters.get(path, 0) + delta
+    
+    stats = db.collection('library_stats')
+    for doc in stats.stream():
+        if doc.id not in totals:
+            writer.delete(doc.reference)
+    
+    for doc_id, counters in totals.items():
+        data = _nest(counters)
+        if doc_id != LIBRARY_STATS_ALL:
+            data['site_id'] = doc_id
+        writer.set(stats.document(doc_id), data)
+    
+    writer.flush()
+    return len(totals)
+
+
+if __name__ == "__main__":
+    logger.info("Library Items Rebuild Script")
+    logger.info("="*60)
+    
+    rebuild_library_items()
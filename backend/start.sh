@@ -0,0 +1,23 @@
+#!/bin/bash
+# API 서버와 워커를 한 컨테이너에서 실행
+#
+# 크롤링 스케줄러, 수동 크롤링, 카드뉴스 생성은 워커(python -m app.worker)가 실행하므로
+# API만 실행하면 작업이 처리되지 않습니다. 둘 중 하나가 종료되면 나머지도 종료하여
+# 컨테이너가 재시작되게 합니다. (워커를 별도 서비스로 실행하면 uvicorn만 실행)
+
+set -u
+
+python -m app.worker &
+WORKER_PID=$!
+
+uvicorn app.main:app --host 0.0.0.0 --port "${PORT:-8000}" &
+API_PID=$!
+
+trap 'kill -TERM "$WORKER_PID" "$API_PID" 2>/dev/null' TERM INT
+
+wait -n "$WORKER_PID" "$API_PID"
+STATUS=$?
+
+kill -TERM "$WORKER_PID" "$API_PID" 2>/dev/null
+wait
+exit "$STATUS"
@@ -0,0 +1,37 @@
+"""
+테스트 공용 fixture
+
+저장소 테스트는 SQLite 백엔드(app.utils.sqlite_store)를 임시 파일로 사용하므로
+Firebase 자격 증명 없이 실행됩니다.
+"""
+
+import pytest
+
+from app.config import settings
+from app.utils import firebase, firebase_async, sqlite_store
+from app.utils.cache import get_library_cache, get_project_cache
+from app.utils.search_index import get_search_index
+
+
+def _reset_storage():
+    firebase._db = None
+    firebase_async._db = None
+    if sqlite_store._client is not None:
+        sqlite_store._client.close()
+    sqlite_store._client = None
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """임시 SQLite 저장소 (빈 캐시 / 빈 검색 색인)"""
+    monkeypatch.setattr(settings, 'STORAGE_BACKEND', 'sqlite')
+    monkeypatch.setattr(settings, 'SQLITE_PATH', str(tmp_path / 'cardnews.db'))
+    monkeypatch.setattr(settings, 'PROJECT_CACHE_LISTEN', False)
+    _reset_storage()
+    get_library_cache().invalidate()
+    get_project_cache().invalidate()
+    get_search_index().rebuild([])
+    
+    yield firebase.get_db()
+    
+    _reset_storage()
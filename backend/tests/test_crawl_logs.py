@@ -0,0 +1,54 @@
+"""크롤링 로그 커서 페이지네이션 테스트"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.utils import firebase, firebase_async
+
+
+def _pages(site_id=None, limit=2) -> list:
+    pages, cursor = [], None
+    while True:
+        page = firebase.get_crawl_logs_page(site_id=site_id, limit=limit, cursor=cursor)
+        pages.append([log['id'] for log in page['logs']])
+        cursor = page['next_cursor']
+        if cursor is None:
+            return pages
+
+
+def test_pages_include_logs_with_same_started_at(storage):
+    started_at = datetime(2026, 1, 1, 9)
+    ids = [firebase.create_crawl_log({'site_id': 'site-a', 'started_at': started_at})['id'] for _ in range(5)]
+    ids.append(firebase.create_crawl_log({'site_id': 'site-a', 'started_at': started_at - timedelta(hours=1)})['id'])
+    
+    for site_id in ('site-a', None):
+        pages = _pages(site_id)
+        seen = [log_id for page in pages for log_id in page]
+        assert sorted(seen[:5]) == sorted(ids[:5])
+        assert seen[5:] == ids[5:]
+        assert len(seen) == len(set(seen))
+
+
+def test_cursor_without_id_keeps_previous_behaviour(storage):
+    started_at = datetime(2026, 1, 1, 9)
+    firebase.create_crawl_log({'site_id': 'site-a', 'started_at': started_at})
+    older = firebase.create_crawl_log({'site_id': 'site-a', 'started_at': started_at - timedelta(hours=1)})
+    
+    cursor = firebase._encode_cursor({'started_at': started_at})
+    page = firebase.get_crawl_logs_page(site_id='site-a', cursor=cursor)
+    
+    assert [log['id'] for log in page['logs']] == [older['id']]
+
+
+@pytest.mark.asyncio
+async def test_async_pages_match_sync(storage):
+    started_at = datetime(2026, 1, 1, 9)
+    for _ in range(3):
+        firebase.create_crawl_log({'site_id': 'site-a', 'started_at': started_at})
+    
+    first = await firebase_async.get_crawl_logs_page(site_id='site-a', limit=2)
+    second = await firebase_async.get_crawl_logs_page(site_id='site-a', limit=2, cursor=first['next_cursor'])
+    
+    assert [log['id'] for log in first['logs'] + second['logs']] == _pages('site-a')[0] + _pages('site-a')[1]
+    assert second['next_cursor'] is None
@@ -0,0 +1,114 @@
+"""라이브러리 피드 캐시 무효화 테스트"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services import library_service
+from app.services.library_service import LibraryService
+from app.utils import firebase
+from app.utils.cache import VersionedCache, get_library_cache, invalidate_library_cache
+
+
+def _post(n: int, site_id: str = 'site-a') -> dict:
+    return {
+        'site_id': site_id,
+        'site_name': 'Site A',
+        'title': f'게시물 {n}',
+        'url': f'https://example.com/{site_id}/{n}',
+        'summary': '요약',
+        'published_at': datetime(2026, 1, n, tzinfo=timezone.utc)
+    }
+
+
+def test_predicate_invalidation_rejects_inflight_put():
+    cache = VersionedCache(maxsize=8)
+    version = cache.version()
+    
+    cache.invalidate(lambda key: key[0] == 'site-a')
+    
+    assert cache.put(('site-a', 1), 'stale', version) is False
+    assert cache.put(('site-b', 1), 'fresh', version) is True
+    assert cache.get(('site-a', 1)) is None
+    assert cache.get(('site-b', 1)) == 'fresh'
+    assert cache.stats()['stale_puts'] == 1
+
+
+def test_full_invalidation_rejects_every_inflight_put():
+    cache = VersionedCache(maxsize=8)
+    version = cache.version()
+    
+    cache.invalidate()
+    
+    assert cache.put(('site-a', 1), 'stale', version) is False
+    assert cache.put(('site-a', 1), 'fresh', cache.version()) is True
+
+
+def test_invalidation_history_overflow_stays_conservative():
+    cache = VersionedCache(maxsize=2, max_versions=2)
+    version = cache.version()
+    
+    for site in ('x', 'y', 'z'):
+        cache.invalidate(lambda key, site=site: key[0] == site)
+    
+    # 기록에서 밀려난 무효화는 모든 키에 적용된 것으로 간주
+    assert cache.put(('site-a', 1), 'stale', version) is False
+
+
+@pytest.mark.asyncio
+async def test_feed_is_not_cached_when_invalidated_during_read(storage, monkeypatch):
+    firebase.create_rss_post(_post(1))
+    service = LibraryService()
+    count = service._count
+    
+    async def racing_count(*args, **kwargs):
+        total = await count(*args, **kwargs)
+        # 첫 페이지를 읽는 동안 새 게시물이 저장됨
+        firebase.create_rss_post(_post(2))
+        return total
+    
+    monkeypatch.setattr(service, '_count', racing_count)
+    stale = await service.get_feed()
+    assert stale['total'] == 1
+    
+    monkeypatch.setattr(service, '_count', count)
+    fresh = await service.get_feed()
+    assert fresh['total'] == 2
+    assert [item['title'] for item in fresh['items']] == ['게시물 2', '게시물 1']
+
+
+@pytest.mark.asyncio
+async def test_facets_are_not_cached_when_invalidated_during_read(storage, monkeypatch):
+    firebase.create_rss_post(_post(1))
+    service = LibraryService()
+    get_stats = library_service.get_library_stats
+    
+    async def racing_stats(site_id=None):
+        stats = await get_stats(site_id)
+        invalidate_library_cache('site-a')
+        return stats
+    
+    monkeypatch.setattr(library_service, 'get_library_stats', racing_stats)
+    await service.get_facets('site-a')
+    assert get_library_cache().get(('site-a', 'facets')) is None
+    
+    monkeypatch.setattr(library_service, 'get_library_stats', get_stats)
+    facets = await service.get_facets('site-a')
+    assert facets['total'] == 1
+    assert get_library_cache().get(('site-a', 'facets')) == facets
+
+
+@pytest.mark.asyncio
+async def test_unrelated_site_invalidation_keeps_feed_cached(storage, monkeypatch):
+    firebase.create_rss_post(_post(1))
+    service = LibraryService()
+    get_stats = library_service.get_library_stats
+    
+    async def racing_stats(site_id=None):
+        stats = await get_stats(site_id)
+        invalidate_library_cache('site-b')
+        return stats
+    
+    monkeypatch.setattr(library_service, 'get_library_stats', racing_stats)
+    facets = await service.get_facets('site-a')
+    assert get_library_cache().get(('site-a', 'facets')) == facets
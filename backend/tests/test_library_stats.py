@@ -0,0 +1,132 @@
+"""라이브러리 집계 카운터(library_stats) 유지 테스트"""
+
+from collections import Counter
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils import firebase, firebase_async
+
+
+URL = 'https://example.com/posts/1'
+
+
+def _post(url: str = URL) -> dict:
+    return {
+        'site_id': 'site-a',
+        'site_name': 'Site A',
+        'title': '게시물',
+        'url': url,
+        'summary': '요약',
+        'published_at': datetime(2026, 3, 2, tzinfo=timezone.utc)
+    }
+
+
+def _rss_project(url: str = URL) -> dict:
+    return firebase.create_project({
+        'source_type': 'rss',
+        'source_content': '본문',
+        'source_url': url,
+        'source_site_id': 'site-a',
+        'source_site_name': 'Site A',
+        'original_published_at': datetime(2026, 3, 2, tzinfo=timezone.utc)
+    })
+
+
+def _stats(site_id=None) -> dict:
+    stats = firebase.get_library_stats(site_id) or {}
+    return {'items': stats.get('items', 0), 'cardnews': stats.get('cardnews', 0)}
+
+
+def _recount(db) -> dict:
+    """library_items에서 다시 센 전체 개수"""
+    counts = Counter()
+    for doc in db.collection('library_items').stream():
+        state = firebase._library_stats_state(doc.to_dict())
+        if state is not None:
+            counts['items'] += 1
+            counts['cardnews'] += state[2]
+    return {'items': counts['items'], 'cardnews': counts['cardnews']}
+
+
+def test_counters_follow_create_link_and_delete(storage):
+    post_id = firebase.create_rss_post(_post())
+    assert _stats() == {'items': 1, 'cardnews': 0}
+    
+    project = _rss_project()
+    firebase.update_rss_post_project_link(post_id, project['id'])
+    assert _stats() == {'items': 1, 'cardnews': 1}
+    assert _stats('site-a') == {'items': 1, 'cardnews': 1}
+    
+    result = firebase.delete_projects([project['id']])
+    assert result['projects'] == 1
+    assert result['posts_unlinked'] == 1
+    assert _stats() == {'items': 1, 'cardnews': 0}
+    assert _stats() == _recount(storage)
+    assert firebase.get_rss_post(post_id)['has_cardnews'] is False
+
+
+def test_deleting_project_without_post_removes_item(storage):
+    project = _rss_project()
+    assert _stats() == {'items': 1, 'cardnews': 1}
+    
+    firebase.delete_projects([project['id']])
+    assert _stats() == {'items': 0, 'cardnews': 0}
+    assert _stats() == _recount(storage)
+
+
+def test_concurrent_delete_decrements_once(storage, monkeypatch):
+    project = _rss_project()
+    run_transaction = firebase._run_transaction
+    raced = []
+    
+    def racing_transaction(db, func):
+        # 첫 삭제가 항목을 조회한 뒤 트랜잭션을 시작하기 전에 같은 프로젝트 삭제가 끝남
+        if not raced:
+            raced.append(True)
+            firebase.delete_projects([project['id']])
+        return run_transaction(db, func)
+    
+    monkeypatch.setattr(firebase, '_run_transaction', racing_transaction)
+    firebase.delete_projects([project['id']])
+    
+    assert _stats() == {'items': 0, 'cardnews': 0}
+    assert _stats() == _recount(storage)
+
+
+def test_delete_racing_relink_keeps_new_link(storage, monkeypatch):
+    post_id = firebase.create_rss_post(_post())
+    old = _rss_project()
+    firebase.update_rss_post_project_link(post_id, old['id'])
+    new = _rss_project()
+    run_transaction = firebase._run_transaction
+    raced = []
+    
+    def racing_transaction(db, func):
+        # 삭제 대상 조회 후 게시물이 새 프로젝트에 다시 연결됨
+        if not raced and func.__name__ == 'write' and func.__qualname__.startswith('delete_projects'):
+            raced.append(True)
+            firebase.update_rss_post_project_link(post_id, new['id'])
+        return run_transaction(db, func)
+    
+    monkeypatch.setattr(firebase, '_run_transaction', racing_transaction)
+    result = firebase.delete_projects([old['id']])
+    
+    assert result['posts_unlinked'] == 0
+    assert firebase.get_rss_post(post_id)['project_id'] == new['id']
+    assert _stats() == {'items': 1, 'cardnews': 1}
+    assert _stats() == _recount(storage)
+
+
+@pytest.mark.asyncio
+async def test_async_delete_keeps_counters_consistent(storage):
+    post_id = await firebase_async.create_rss_post(_post())
+    project = _rss_project()
+    await firebase_async.update_rss_post_project_link(post_id, project['id'])
+    assert _stats() == {'items': 1, 'cardnews': 1}
+    
+    results = [await firebase_async.delete_projects([project['id']]) for _ in range(2)]
+    
+    assert [result['posts_unlinked'] for result in results] == [1, 0]
+    assert _stats() == {'items': 1, 'cardnews': 0}
+    assert _stats() == _recount(storage)
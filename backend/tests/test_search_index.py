@@ -0,0 +1,68 @@
+"""라이브러리 검색 색인 테스트"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services.library_service import LibraryService
+from app.utils import firebase
+from app.utils.search_index import SearchIndex
+
+
+def _item(key: str, title: str) -> dict:
+    return {
+        'key': key,
+        'site_id': 'site-a',
+        'published_at': datetime(2026, 1, 1, tzinfo=timezone.utc),
+        'post': {'title': title}
+    }
+
+
+def test_partial_match_expands_to_containing_tokens():
+    index = SearchIndex()
+    index.rebuild([_item('a', 'OpenAI 발표'), _item('b', 'AI 뉴스'), _item('c', '날씨')])
+    
+    assert [key for key, _ in index.search('ai')] == ['b', 'a']
+    assert [key for key, _ in index.search('뉴')] == ['b']
+    assert index.search('penai')[0][0] == 'a'
+    assert index.search('xyz') == []
+
+
+def test_gram_index_follows_token_removal():
+    index = SearchIndex()
+    index.rebuild([_item('a', 'OpenAI'), _item('b', 'Anthropic')])
+    
+    index.remove('a')
+    
+    assert index.search('ai') == []
+    assert 'openai' not in index._grams.get('ai', set())
+    assert all(index._grams.values())
+    
+    index.apply('b', {'post': {'title': 'Claude'}})
+    assert [key for key, _ in index.search('laud')] == ['b']
+    assert index.search('thro') == []
+
+
+def test_exact_token_ranks_above_partial_match():
+    index = SearchIndex()
+    index.rebuild([_item('partial', 'openai'), _item('exact', 'ai')])
+    
+    assert [key for key, _ in index.search('ai')] == ['exact', 'partial']
+
+
+@pytest.mark.asyncio
+async def test_keyword_without_tokens_falls_back_to_scan(storage):
+    firebase.create_rss_post({
+        'site_id': 'site-a',
+        'site_name': 'Site A',
+        'title': '日本 市場',
+        'url': 'https://example.com/jp',
+        'summary': '',
+        'published_at': datetime(2026, 1, 1, tzinfo=timezone.utc)
+    })
+    service = LibraryService()
+    assert service.search_index.ready
+    
+    result = await service.get_feed(keyword='日本')
+    
+    assert [item['title'] for item in result['items']] == ['日本 市場']
@@ -0,0 +1,89 @@
+"""섹션 전체 교체(replace_sections) 테스트"""
+
+import threading
+
+import pytest
+
+from app.config import settings
+from app.utils import firebase, firebase_async
+
+
+def _project() -> dict:
+    return firebase.create_project({'source_type': 'text', 'source_content': '본문'})
+
+
+def _section(title: str, **fields) -> dict:
+    return {'type': 'content', 'title': title, 'content': f'{title} 내용', **fields}
+
+
+def _titles(project_id: str) -> list:
+    return [section['title'] for section in firebase._fetch_sections(firebase.get_db(), project_id)]
+
+
+def test_replace_diffs_against_stored_sections(storage):
+    project = _project()
+    first, second, third = firebase.create_sections(project['id'], [_section('a'), _section('b'), _section('c')])
+    
+    result = firebase.replace_sections(project['id'], [
+        {**third, 'order': None},
+        {**first, 'title': 'a2'},
+        _section('d')
+    ])
+    
+    assert [section['title'] for section in result] == ['c', 'a2', 'd']
+    assert _titles(project['id']) == ['c', 'a2', 'd']
+    stored = {section['id']: section for section in firebase.get_sections(project['id'])}
+    assert second['id'] not in stored
+    assert stored[first['id']]['title'] == 'a2'
+    assert stored[third['id']]['order'] == 0
+
+
+def test_replace_without_changes_writes_nothing(storage, monkeypatch):
+    project = _project()
+    sections = firebase.create_sections(project['id'], [_section('a', order=0)])
+    monkeypatch.setattr(settings, 'PROJECT_CACHE_LISTEN', True)
+    
+    firebase.replace_sections(project['id'], sections)
+    
+    assert 'sections_updated_at' not in firebase.get_project(project['id'])
+
+
+def test_replace_stamps_project_in_same_transaction(storage, monkeypatch):
+    project = _project()
+    monkeypatch.setattr(settings, 'PROJECT_CACHE_LISTEN', True)
+    
+    firebase.replace_sections(project['id'], [_section('a')])
+    
+    assert firebase.get_project(project['id'])['sections_updated_at'] is not None
+
+
+def test_concurrent_replaces_do_not_mix(storage):
+    project = _project()
+    firebase.create_sections(project['id'], [_section('old')])
+    lists = [[_section(f'{name}{i}') for i in range(5)] for name in ('x', 'y', 'z')]
+    barrier = threading.Barrier(len(lists))
+    
+    def replace(sections):
+        barrier.wait()
+        firebase.replace_sections(project['id'], sections)
+    
+    threads = [threading.Thread(target=replace, args=(sections,)) for sections in lists]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    # 마지막으로 커밋된 목록만 남음 (이전 목록의 섹션이 남거나 섞이지 않음)
+    assert _titles(project['id']) in [[section['title'] for section in sections] for sections in lists]
+
+
+@pytest.mark.asyncio
+async def test_async_replace_sections(storage):
+    project = _project()
+    first, second = await firebase_async.create_sections(project['id'], [_section('a'), _section('b')])
+    
+    result = await firebase_async.replace_sections(project['id'], [second, _section('c')])
+    
+    assert [section['title'] for section in result] == ['b', 'c']
+    assert [section['title'] for section in await firebase_async.get_sections(project['id'])] == ['b', 'c']
+    assert _titles(project['id']) == ['b', 'c']
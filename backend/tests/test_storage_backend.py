@@ -0,0 +1,101 @@
+"""저장소 백엔드 선택 (STORAGE_BACKEND) 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.utils import firebase, firebase_async
+from app.utils.sqlite_store import AsyncSQLiteClient, SQLiteClient
+
+from tests.conftest import _reset_storage
+
+
+class _FakeFirestore:
+    """자격 증명이 있을 때 initialize_firebase()가 반환하는 Firestore 클라이언트 대용"""
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    """STORAGE_BACKEND 설정 + initialize_firebase 호출 기록"""
+    calls = []
+    
+    def set_backend(name: str, firestore_client=None):
+        monkeypatch.setattr(settings, 'STORAGE_BACKEND', name)
+        monkeypatch.setattr(settings, 'SQLITE_PATH', str(tmp_path / 'cardnews.db'))
+        
+        def initialize_firebase():
+            calls.append(name)
+            return firestore_client
+        
+        monkeypatch.setattr(firebase, 'initialize_firebase', initialize_firebase)
+        _reset_storage()
+        return calls
+    
+    yield set_backend
+    _reset_storage()
+
+
+def test_sqlite_backend_skips_firebase_even_with_credentials(backend):
+    calls = backend('sqlite', firestore_client=_FakeFirestore())
+    
+    assert isinstance(firebase.get_db(), SQLiteClient)
+    assert firebase.is_local_storage()
+    assert calls == []
+
+
+def test_initialized_firebase_does_not_override_sqlite_backend(tmp_path, monkeypatch):
+    """자격 증명으로 Firebase가 초기화되어도 저장소 선택은 get_db()의 STORAGE_BACKEND를 따름"""
+    client = _FakeFirestore()
+    monkeypatch.setattr(settings, 'STORAGE_BACKEND', 'sqlite')
+    monkeypatch.setattr(settings, 'SQLITE_PATH', str(tmp_path / 'cardnews.db'))
+    monkeypatch.setattr(firebase.firebase_admin, 'initialize_app', lambda *args: object())
+    monkeypatch.setattr(firebase.firestore, 'client', lambda: client)
+    monkeypatch.setattr(firebase, '_app_initialized', False)
+    monkeypatch.setattr(firebase, '_firestore_db', None)
+    _reset_storage()
+    
+    try:
+        assert firebase.initialize_firebase() is client
+        assert isinstance(firebase.get_db(), SQLiteClient)
+    finally:
+        _reset_storage()
+
+
+def test_async_client_follows_sqlite_backend(backend):
+    backend('sqlite', firestore_client=_FakeFirestore())
+    
+    assert isinstance(asyncio.run(_async_db()), AsyncSQLiteClient)
+
+
+def test_firestore_backend_uses_firebase_client(backend):
+    client = _FakeFirestore()
+    calls = backend('firestore', firestore_client=client)
+    
+    assert firebase.get_db() is client
+    assert not firebase.is_local_storage()
+    assert calls == ['firestore']
+
+
+def test_firestore_backend_without_credentials_has_no_storage(backend):
+    backend('firestore', firestore_client=None)
+    
+    assert firebase.get_db() is None
+
+
+def test_auto_backend_falls_back_to_sqlite(backend):
+    calls = backend('auto', firestore_client=None)
+    
+    assert isinstance(firebase.get_db(), SQLiteClient)
+    assert calls == ['auto']
+
+
+def test_auto_backend_prefers_firestore(backend):
+    client = _FakeFirestore()
+    backend('auto', firestore_client=client)
+    
+    assert firebase.get_db() is client
+
+
+async def _async_db():
+    return firebase_async.get_db()
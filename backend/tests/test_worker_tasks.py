@@ -0,0 +1,95 @@
+"""워커 작업 상태 전이 / 변경 알림 조회 테스트"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services import task_queue
+from app.utils import firebase, firebase_async
+from app.worker import Worker
+
+
+@pytest.fixture
+def worker(storage):
+    worker = Worker(max_tasks=2, publish_changes=False)
+    worker.handlers['noop'] = lambda payload, progress: {'ok': True}
+    yield worker
+    worker.executor.shutdown(wait=True)
+
+
+def test_transition_requires_expected_status(storage):
+    task = firebase.create_worker_task('noop', {})
+    
+    assert firebase.transition_worker_task(task['id'], 'queued', {'status': 'running'}) is True
+    assert firebase.transition_worker_task(task['id'], 'queued', {'status': 'cancelled'}) is False
+    assert firebase.get_worker_task(task['id'])['status'] == 'running'
+    assert firebase.transition_worker_task('missing', 'queued', {'status': 'running'}) is False
+
+
+def test_poll_runs_queued_task(worker):
+    task = firebase.create_worker_task('noop', {})
+    
+    assert worker.poll() == 1
+    worker.executor.shutdown(wait=True)
+    
+    done = firebase.get_worker_task(task['id'])
+    assert done['status'] == 'completed'
+    assert done['result'] == {'ok': True}
+
+
+@pytest.mark.asyncio
+async def test_poll_skips_task_cancelled_after_listing(worker, monkeypatch):
+    task = firebase.create_worker_task('noop', {})
+    listed = firebase.get_worker_tasks(status='queued')
+    
+    # 워커가 목록을 읽은 뒤 API가 취소
+    assert await task_queue.cancel_task(task['id']) is True
+    monkeypatch.setattr(firebase, 'get_worker_tasks', lambda status='queued', limit=10: listed)
+    
+    assert worker.poll() == 0
+    assert firebase.get_worker_task(task['id'])['status'] == 'cancelled'
+
+
+@pytest.mark.asyncio
+async def test_cancel_loses_to_worker_that_took_task(storage, monkeypatch):
+    task = await firebase_async.create_worker_task('noop', {})
+    get_task = task_queue.get_worker_task
+    
+    async def racing_get(task_id):
+        # API가 queued를 읽은 뒤 워커가 작업을 꺼냄
+        current = await get_task(task_id)
+        firebase.transition_worker_task(task_id, 'queued', {'status': 'running'})
+        return current
+    
+    monkeypatch.setattr(task_queue, 'get_worker_task', racing_get)
+    
+    assert await task_queue.cancel_task(task['id']) is False
+    assert firebase.get_worker_task(task['id'])['status'] == 'running'
+
+
+@pytest.mark.asyncio
+async def test_worker_events_include_same_timestamp(storage):
+    now = datetime.now(timezone.utc)
+    events = storage.collection('worker_events')
+    for event_id in ('a', 'b'):
+        events.document(event_id).set({
+            'id': event_id,
+            'library_keys': [event_id],
+            'created_at': now,
+            'expires_at': now + timedelta(hours=1)
+        })
+    
+    fetched = await firebase_async.get_worker_events(now)
+    assert sorted(event['id'] for event in fetched) == ['a', 'b']
+
+
+def test_advance_events_dedupes_by_id():
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    t1 = t0 + timedelta(seconds=1)
+    
+    since, seen = task_queue._advance_events(t0, set(), [{'id': 'a', 'created_at': t0}, {'id': 'b', 'created_at': t1}])
+    assert (since, seen) == (t1, {'b'})
+    
+    # 같은 시각에 나중에 저장된 알림은 다음 조회에 포함되고, 반영한 id는 누적
+    since, seen = task_queue._advance_events(since, seen, [{'id': 'b', 'created_at': t1}, {'id': 'c', 'created_at': t1}])
+    assert (since, seen) == (t1, {'b', 'c'})
@@ -0,0 +1,125 @@
+/**
+ * 백그라운드 작업(Job) API 클라이언트
+ */
+
+const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
+
+export type JobStatus = 'queued' | 'running' | 'completed' | 'failed' | 'cancelled';
+
+export interface Job<T = unknown> {
+  id: string;
+  type: 'create_project' | 'create_cardnews' | 'trigger_crawl';
+  status: JobStatus;
+  step: string | null;  // 현재 진행 단계
+  message: string | null;
+  progress: number;  // 0~1
+  result: T | null;  // 완료 시 결과 (작업 종류별)
+  error: string | null;
+  created_at: string;
+  started_at: string | null;
+  completed_at: string | null;
+}
+
+export type JobSubmitRequest =
+  | { type: 'create_project'; params: { source_type: 'url' | 'text'; source_content: string; model?: string; card_start_type?: string } }
+  | { type: 'create_cardnews'; params: { rss_post_id: string; site_id: string; url: string; title: string; content: string } }
+  | { type: 'trigger_crawl'; params: { site_id: string } };
+
+export interface JobProgressEvent {
+  step: string;
+  message: string | null;
+  progress: number;
+  [key: string]: unknown;  // 작업별 추가 값 (예: current, total, url)
+}
+
+export interface JobStatusEvent {
+  status: JobStatus;
+  result?: unknown;
+  error?: string | null;
+}
+
+const DONE_STATUSES: JobStatus[] = ['completed', 'failed', 'cancelled'];
+
+/**
+ * 작업 제출 (바로 작업 ID 반환)
+ */
+export async function submitJob(request: JobSubmitRequest): Promise<Job> {
+  const response = await fetch(`${API_BASE_URL}/api/jobs`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify(request),
+  });
+  
+  if (!response.ok) {
+    const error = await response.json().catch(() => ({}));
+    throw new Error(error.detail || `Failed to submit job: ${response.statusText}`);
+  }
+  
+  return response.json();
+}
+
+/**
+ * 작업 상태 조회
+ */
+export async function getJob(jobId: string): Promise<Job> {
+  const response = await fetch(`${API_BASE_URL}/api/jobs/${jobId}`);
+  
+  if (!response.ok) {
+    throw new Error(`Failed to fetch job: ${response.statusText}`);
+  }
+  
+  return response.json();
+}
+
+/**
+ * 작업 취소
+ */
+export async function cancelJob(jobId: string): Promise<Job> {
+  const response = await fetch(`${API_BASE_URL}/api/jobs/${jobId}/cancel`, {
+    method: 'POST',
+  });
+  
+  if (!response.ok) {
+    throw new Error(`Failed to cancel job: ${response.statusText}`);
+  }
+  
+  return response.json();
+}
+
+/**
+ * 작업 진행 이벤트 구독 (SSE)
+ *
+ * @returns 구독 해제 함수
+ */
+export function subscribeJob(
+  jobId: string,
+  handlers: {
+    onProgress?: (event: JobProgressEvent) => void;
+    onStatus?: (event: JobStatusEvent) => void;
+    onError?: (error: Event) => void;
+  }
+): () => void {
+  const source = new EventSource(`${API_BASE_URL}/api/jobs/${jobId}/events`);
+  
+  source.addEventListener('progress', (e) => {
+    handlers.onProgress?.(JSON.parse((e as MessageEvent).data));
+  });
+  
+  source.addEventListener('status', (e) => {
+    const event: JobStatusEvent = JSON.parse((e as MessageEvent).data);
+    handlers.onStatus?.(event);
+    
+    // 작업이 끝나면 서버가 스트림을 닫으므로 자동 재연결 방지
+    if (DONE_STATUSES.includes(event.status)) {
+      source.close();
+    }
+  });
+  
+  source.onerror = (e) => {
+    handlers.onError?.(e);
+  };
+  
+  return () => source.close();
+}
@@ -33,6 +33,21 @@ export interface LibraryFeedResponse {
   page: number;
   page_size: number;
   items: LibraryFeedItem[];
+  next_cursor: string | null;  // 다음 페이지 커서 (마지막 페이지면 null)
+}
+
+export interface LibraryFacetCount {
+  key: string;  // 사이트 ID 또는 YYYY-MM
+  items: number;
+  cardnews: number;
+}
+
+export interface LibraryFacetsResponse {
+  total: number;
+  cardnews: number | null;
+  sites: LibraryFacetCount[];
+  months: LibraryFacetCount[];
+  precomputed: boolean;
 }
 
 export interface CreateCardnewsRequest {
@@ -59,6 +74,7 @@ export async function getLibraryFeed(params: {
   year_month?: string;
   page?: number;
   page_size?: number;
+  cursor?: string;
 }): Promise<LibraryFeedResponse> {
   const queryParams = new URLSearchParams();
   
@@ -69,6 +85,7 @@ export async function getLibraryFeed(params: {
   if (params.year_month) queryParams.append('year_month', params.year_month);
   if (params.page) queryParams.append('page', params.page.toString());
   if (params.page_size) queryParams.append('page_size', params.page_size.toString());
+  if (params.cursor) queryParams.append('cursor', params.cursor);
   
   const response = await axios.get<LibraryFeedResponse>(
     `${API_URL}/api/library/feed?${queryParams.toString()}`
@@ -77,6 +94,21 @@ export async function getLibraryFeed(params: {
   return response.data;
 }
 
+/**
+ * RSS Library 집계 조회 (전체/카드뉴스/사이트별/월별 개수)
+ */
+export async function getLibraryFacets(siteId?: string): Promise<LibraryFacetsResponse> {
+  const queryParams = new URLSearchParams();
+  
+  if (siteId) queryParams.append('site_id', siteId);
+  
+  const response = await axios.get<LibraryFacetsResponse>(
+    `${API_URL}/api/library/facets?${queryParams.toString()}`
+  );
+  
+  return response.data;
+}
+
 /**
  * RSS 게시물에서 카드뉴스 생성
  */
@@ -79,6 +79,42 @@ export async function deleteProject(projectId: string): Promise<void> {
   }
 }
 
+export interface ProjectBulkDeleteRequest {
+  project_ids?: string[];
+  status?: 'draft' | 'summarized' | 'completed';
+  auto_generated?: boolean;
+  limit?: number;
+}
+
+export interface ProjectBulkDeleteResponse {
+  projects: number;
+  sections: number;
+  conversations: number;
+  posts_unlinked: number;
+}
+
+/**
+ * 프로젝트 일괄 삭제 (ID 목록 또는 조건)
+ */
+export async function bulkDeleteProjects(
+  request: ProjectBulkDeleteRequest
+): Promise<ProjectBulkDeleteResponse> {
+  const response = await fetch(`${API_BASE_URL}/api/projects/bulk-delete`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify(request),
+  });
+  
+  if (!response.ok) {
+    const errorData = await response.json().catch(() => ({}));
+    throw new Error(errorData.detail || `Failed to bulk delete projects: ${response.statusText}`);
+  }
+  
+  return response.json();
+}
+
 /**
  * 프로젝트 상태 업데이트
  */